@@ -0,0 +1,66 @@
+# ticks hasta completar la meta según la capacidad de carga de los robots y
+# el tamaño del mapa (promedio de varias semillas fijas)
+#
+# uso: python benchmarks/bench_capacity.py [semillas]
+
+# importes globales
+import sys
+
+# importes locales
+from pathlib import Path
+from statistics import mean
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# importes internos
+from event_log import DROP  # noqa: E402
+from simulation import Simulation  # noqa: E402
+
+CAPACITIES: List[int] = [1, 2, 4, 8]
+SIZES: List[Tuple[int, int]] = [(50, 30), (100, 60), (200, 120)]
+MAX_TICKS: int = 50_000
+
+
+# corre una simulación y regresa (ticks, viajes de entrega)
+def run(width: int, height: int, capacity: int, seed: int) -> Tuple[int, int]:
+    area: int = width * height
+    resources: int = max(10, area // 150)
+    simulation = Simulation(
+        width,
+        height,
+        number_of_robots=max(4, area // 500),
+        number_of_resources=resources,
+        number_of_obstacles=area // 75,
+        # el promedio es 3.5 materiales por recurso, la meta siempre se alcanza
+        materials_goal=2 * resources,
+        carrying_capacity=capacity,
+        seed=seed,
+        event_log=True,
+        verbose=False,
+    )
+    ticks: int = simulation.run_until(max_ticks=MAX_TICKS)
+    trips: int = sum(1 for event in simulation.event_log if event.kind == DROP)
+    return ticks, trips
+
+
+def main() -> None:
+    seeds: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"promedio de {seeds} semillas (máximo {MAX_TICKS} ticks)")
+    print(f"{'mapa':<10} {'capacidad':>9} {'ticks':>9} {'viajes':>8} {'vs 1':>7}")
+    for width, height in SIZES:
+        baseline: float = 0.0
+        for capacity in CAPACITIES:
+            results = [run(width, height, capacity, seed) for seed in range(seeds)]
+            ticks: float = mean(ticks for ticks, _ in results)
+            trips: float = mean(trips for _, trips in results)
+            if capacity == CAPACITIES[0]:
+                baseline = ticks
+            print(
+                f"{f'{width}x{height}':<10} {capacity:>9} {ticks:>9.0f} "
+                f"{trips:>8.1f} {ticks / baseline:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# compara memoria y acceso a atributos de las entidades con __slots__ contra
+# las clases anteriores basadas en __dict__
+#
+# uso: python benchmarks/bench_entities.py [cantidad]
+
+# importes globales
+import sys
+import timeit
+import tracemalloc
+
+# importes locales
+from pathlib import Path
+from random import Random, randint
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# importes internos
+from cell import Cell  # noqa: E402
+from obstacles import Obstacles  # noqa: E402
+from resources import Resources  # noqa: E402
+from robot import Robot  # noqa: E402
+
+
+# versiones anteriores (con __dict__ y dimensiones del tablero por instancia)
+class DictCell:
+    def __init__(self, x: int, y: int):
+        self.x: int = x
+        self.y: int = y
+
+
+class DictObstacles:
+    def __init__(self, x: int, y: int, grid_width: int, grid_height: int) -> None:
+        self.x: int = x
+        self.y: int = y
+        self.grid_width: int = grid_width
+        self.grid_height: int = grid_height
+
+
+class DictResources(DictObstacles):
+    def __init__(self, x: int, y: int, grid_width: int, grid_height: int) -> None:
+        super().__init__(x, y, grid_width, grid_height)
+        self.materials: int = randint(1, 6)
+
+
+class DictRobot:
+    def __init__(self, game, x: int, y: int):
+        self.game = game
+        self.view_distance: int = 5
+        self.grab_distance: int = 1
+        self.materials: int = 0
+        self.movements: List[Tuple[int, int]] = []
+        self.is_grabbing: bool = False
+        self.closest_resource = None
+        self.last_resource = None
+        self.x: int = x
+        self.y: int = y
+        self.explored_area = set()
+        self.start_cell: DictCell = DictCell(self.x, self.y)
+        self.current_path = None
+        self.path_goal = None
+        self.path_version: int = -1
+
+
+# bytes asignados por objeto al crear `count` instancias
+def measure_memory(factory: Callable[[int], object], count: int) -> float:
+    tracemalloc.start()
+    objects = [factory(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+# nanosegundos por lectura de x, y sumadas sobre todas las instancias
+def measure_access(factory: Callable[[int], object], count: int) -> float:
+    objects = [factory(i) for i in range(count)]
+    timer = timeit.Timer(lambda: sum(o.x + o.y for o in objects))
+    loops, _ = timer.autorange()
+    best = min(timer.repeat(repeat=5, number=loops)) / loops
+    return best / (2 * count) * 1e9
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    width, height = 2000, 2000
+    rng = Random(0)
+    cases = [
+        ("Cell", lambda i: DictCell(i, i), lambda i: Cell(i, i)),
+        (
+            "Obstacles",
+            lambda i: DictObstacles(i, i, width, height),
+            lambda i: Obstacles(i, i),
+        ),
+        (
+            "Resources",
+            lambda i: DictResources(i, i, width, height),
+            lambda i: Resources(i, i, rng),
+        ),
+        ("Robot", lambda i: DictRobot(None, i, i), lambda i: Robot(None, i, i)),
+    ]
+
+    print(f"{count} instancias por clase")
+    print(
+        f"{'clase':<10} {'antes B/obj':>12} {'después B/obj':>14} "
+        f"{'antes ns/attr':>14} {'después ns/attr':>16}"
+    )
+    for name, before, after in cases:
+        print(
+            f"{name:<10} {measure_memory(before, count):>12.1f} "
+            f"{measure_memory(after, count):>14.1f} "
+            f"{measure_access(before, count):>14.2f} "
+            f"{measure_access(after, count):>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
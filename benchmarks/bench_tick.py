@@ -0,0 +1,91 @@
+# mide ticks por segundo y la latencia de cada fase del tick
+#
+# uso:
+#   python -m pytest benchmarks/bench_tick.py --benchmark-autosave
+#   python -m pytest benchmarks/bench_tick.py --benchmark-compare --benchmark-compare-fail=mean:10%
+#   python -m pytest benchmarks/bench_tick.py --matrix full
+
+# importes globales
+import os
+import pytest
+
+# importes locales
+from random import Random
+from typing import List, Tuple
+
+# importes internos
+from conftest import SEED, build_simulation
+from simulation import Simulation
+
+ROUNDS: int = 30
+
+
+def test_tick(benchmark, simulation: Simulation) -> None:
+    benchmark.pedantic(simulation.step, rounds=ROUNDS * 2, warmup_rounds=5)
+
+
+def test_update_resources(benchmark, simulation: Simulation) -> None:
+    benchmark.pedantic(
+        simulation.update_resources, setup=simulation.update_robots, rounds=ROUNDS
+    )
+
+
+def test_find_closest_resource(benchmark, simulation: Simulation) -> None:
+    def find_all() -> None:
+        for robot in simulation.robots:
+            robot.find_closest_resource()
+
+    benchmark.pedantic(find_all, setup=simulation.step, rounds=ROUNDS)
+
+
+def test_is_valid_move(benchmark, simulation: Simulation) -> None:
+    rng = Random(SEED)
+    cells: List[Tuple[int, int]] = [
+        (rng.randrange(simulation.width), rng.randrange(simulation.height))
+        for _ in range(1000)
+    ]
+    robot = simulation.robots[0]
+
+    def check_all() -> None:
+        for x, y in cells:
+            robot.is_valid_move(x, y)
+
+    benchmark.pedantic(check_all, rounds=ROUNDS)
+
+
+def test_move_towards(benchmark, simulation: Simulation) -> None:
+    resources = simulation.resources
+
+    def move_all() -> None:
+        for i, robot in enumerate(simulation.robots):
+            robot.move_towards(resources[(i * 7919) % len(resources)])
+
+    benchmark.pedantic(move_all, rounds=ROUNDS)
+
+
+def test_move_randomly(benchmark, simulation: Simulation) -> None:
+    def move_all() -> None:
+        for robot in simulation.robots:
+            robot.move_randomly()
+
+    benchmark.pedantic(move_all, rounds=ROUNDS)
+
+
+# dibujo con el renderizador de pygame (sin ventana real)
+def test_render(benchmark, size: Tuple[int, int]) -> None:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pytest.importorskip("pygame")
+    from game import Game
+
+    width, height = size
+    grid_size: int = max(1, 1500 // max(width, height))
+    game = Game(
+        width,
+        height,
+        grid_size,
+        20,
+        simulation=build_simulation(size, 4, 0.01),
+    )
+    game.screen.blit(game.background, (0, 0))
+    game.render()
+    benchmark.pedantic(game.render, setup=game.simulation.step, rounds=ROUNDS)
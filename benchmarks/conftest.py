@@ -0,0 +1,84 @@
+# importes globales
+import pytest
+import sys
+
+# importes locales
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# importes internos
+from simulation import Simulation  # noqa: E402
+
+SEED: int = 1234
+
+# (ancho, alto) de cada matriz; "full" agrega mapas grandes que tardan en crearse
+SIZES: Dict[str, List[Tuple[int, int]]] = {
+    "quick": [(75, 40), (250, 250)],
+    "full": [(75, 40), (250, 250), (1000, 1000), (2000, 2000)],
+}
+ROBOTS: Dict[str, List[int]] = {"quick": [4, 64], "full": [4, 64, 512]}
+# fracción del tablero ocupada por recursos y por obstáculos
+DENSITIES: Dict[str, List[float]] = {"quick": [0.01], "full": [0.01, 0.05]}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--matrix",
+        choices=sorted(SIZES),
+        default="quick",
+        help="tamaño de la matriz de escenarios a medir",
+    )
+
+
+# sin pytest-benchmark (benchmarks/requirements.txt) un `pytest` simple no
+# falla: las mediciones se omiten y el resto de las pruebas corre igual
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    if config.pluginmanager.hasplugin("benchmark"):
+        return
+    skip = pytest.mark.skip(reason="pytest-benchmark is not installed")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    matrix: str = metafunc.config.getoption("--matrix")
+    if "size" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "size", SIZES[matrix], ids=[f"{w}x{h}" for w, h in SIZES[matrix]]
+        )
+    if "robots" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "robots", ROBOTS[matrix], ids=[f"robots{n}" for n in ROBOTS[matrix]]
+        )
+    if "density" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "density", DENSITIES[matrix], ids=[f"density{d}" for d in DENSITIES[matrix]]
+        )
+
+
+# escenario con semilla fija; el mundo se crea fuera de la medición
+def build_simulation(
+    size: Tuple[int, int], robots: int, density: float, seed: int = SEED
+) -> Simulation:
+    width, height = size
+    entities: int = max(1, int(width * height * density))
+    return Simulation(
+        width,
+        height,
+        number_of_robots=robots,
+        number_of_resources=entities,
+        number_of_obstacles=entities,
+        materials_goal=10**9,
+        seed=seed,
+        verbose=False,
+    )
+
+
+@pytest.fixture
+def simulation(size: Tuple[int, int], robots: int, density: float) -> Simulation:
+    return build_simulation(size, robots, density)
@@ -1,7 +1,140 @@
-from game import Game
+# corre un escenario con ventana o sin interfaz
+#
+# uso: python src/app.py [escenario.toml] [--headless] [--seed 7] [--ticks 20000] \
+#          [--set world.robots=50 --set view_distance=8] [--summary resultado.json]
+
+# importes globales
+import argparse
+import json
+import sys
+import time
+
+# importes locales
+from typing import Any, Dict, List, Optional
+
+# importes internos
+import scenario as scenarios
+from scenario import Scenario
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Corre un escenario (TOML o JSON) con ventana o sin interfaz."
+    )
+    parser.add_argument("scenario", nargs="?", help="archivo .toml o .json")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--headless", dest="headless", action="store_true", default=None)
+    mode.add_argument("--render", dest="headless", action="store_false")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--ticks", type=int, help="máximo de ticks a simular")
+    parser.add_argument("--event-log", help="guarda el registro binario de eventos")
+    parser.add_argument("--checkpoint", help="guarda un punto de control al terminar")
+    parser.add_argument("--log", help="registro estructurado en JSON lines")
+    parser.add_argument("--summary", help="resultado de la corrida en JSON")
+    parser.add_argument("--metrics", help="métricas por fase (JSON, .prom o .txt)")
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="CAMPO=VALOR",
+        help="cambia un campo del escenario, p. ej. world.robots=50",
+    )
+    return parser.parse_args(argv)
+
+
+# escenario del archivo con las opciones de la línea de comandos encima
+def build_scenario(args: argparse.Namespace) -> Scenario:
+    scenario = scenarios.load(args.scenario) if args.scenario else Scenario()
+    for override in args.overrides:
+        key, separator, text = override.partition("=")
+        if not separator:
+            raise ValueError(f"--set expects FIELD=VALUE, got {override!r}")
+        scenario.set(key.strip(), scenarios.parse_value(text.strip()))
+    options: Dict[str, Any] = {
+        "run.headless": args.headless,
+        "run.seed": args.seed,
+        "run.ticks": args.ticks,
+        "output.event_log": args.event_log,
+        "output.checkpoint": args.checkpoint,
+        "output.log": args.log,
+        "output.summary": args.summary,
+        "output.metrics": args.metrics,
+    }
+    for key, value in options.items():
+        if value is not None:
+            scenario.set(key, value)
+    return scenario
+
+
+def run(scenario: Scenario) -> Dict[str, Any]:
+    # importados aquí para que un escenario inválido falle antes de cargar
+    # la simulación (y pygame solo se carga con ventana)
+    from simulation import Simulation
+    from structured_log import StructuredLogger
+
+    output = scenario["output"]
+    logger = StructuredLogger(output["log"]) if output["log"] else None
+    simulation = Simulation(logger=logger, **scenario.simulation_parameters())
+
+    started: float = time.perf_counter()
+    if scenario["run"]["headless"]:
+        simulation.run_until(max_ticks=scenario["run"]["ticks"])
+        simulation.close()
+    else:
+        from game import Game
+
+        render = scenario["render"]
+        Game(
+            simulation.width,
+            simulation.height,
+            render["grid_size"],
+            render["tps"],
+            simulation=simulation,
+            fps=render["fps"],
+            max_ticks=scenario["run"]["ticks"],
+        ).run()
+    elapsed: float = time.perf_counter() - started
+
+    if output["event_log"]:
+        simulation.event_log.save(output["event_log"])
+    if output["checkpoint"]:
+        import checkpoint
+
+        checkpoint.save(simulation, output["checkpoint"])
+    if output["metrics"]:
+        simulation.metrics.dump(output["metrics"])
+
+    summary: Dict[str, Any] = {
+        "seed": simulation.seed,
+        "ticks": simulation.tick,
+        "completed": simulation.check_game_over(),
+        "materials_delivered": simulation.start_area.materials,
+        "distance_walked": sum(robot.distance_walked for robot in simulation.robots),
+        "elapsed": round(elapsed, 6),
+        "scenario": scenario.to_dict(),
+    }
+    if simulation.metrics.enabled:
+        summary["metrics"] = simulation.metrics.to_dict()
+    if output["summary"]:
+        with open(output["summary"], "w") as file:
+            json.dump(summary, file, indent=2)
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    try:
+        scenario = build_scenario(args)
+    except (OSError, ValueError) as error:
+        sys.exit(f"error: {error}")
+    summary = run(scenario)
+    if scenario["run"]["headless"]:
+        print(
+            f"{summary['ticks']} ticks, {summary['materials_delivered']} materiales, "
+            f"semilla {summary['seed']}"
+        )
 
 
 if __name__ == "__main__":
-    # ancho = 75, alto = 40, tamaño de celda = 20, velocidad = 20 
-    game = Game(75, 40, 20, 20)
-    game.run()
+    main()
@@ -0,0 +1,200 @@
+# corre muchas simulaciones sin interfaz en paralelo y guarda un renglón por corrida
+#
+# uso: python src/batch.py --seeds 0-99 --robots 4,8 --view-distance 3,5 \
+#          --output resultados.csv --workers 8
+
+# importes globales
+import argparse
+import csv
+import os
+import time
+
+# importes locales
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# importes internos
+from simulation import Simulation
+
+# parámetros que identifican una corrida (sirven para reanudar)
+KEY_FIELDS: List[str] = [
+    "seed",
+    "width",
+    "height",
+    "robots",
+    "view_distance",
+    "resources",
+    "obstacles",
+    "materials_goal",
+    "max_ticks",
+]
+RESULT_FIELDS: List[str] = [
+    "ticks",
+    "completed",
+    "materials_delivered",
+    "distance_walked",
+    "elapsed",
+]
+FIELDS: List[str] = KEY_FIELDS + RESULT_FIELDS
+
+Job = Dict[str, int]
+
+
+# convierte "0-3,7,10-11" en [0, 1, 2, 3, 7, 10, 11]
+def parse_int_list(text: str) -> List[int]:
+    values: List[int] = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            values.extend(range(int(start), int(end) + 1))
+        else:
+            values.append(int(part))
+    return values
+
+
+def job_key(job: Dict[str, object]) -> Tuple[int, ...]:
+    return tuple(int(job[field]) for field in KEY_FIELDS)
+
+
+# corre una simulación completa; se ejecuta dentro de un proceso del pool
+def run_job(job: Job) -> Dict[str, object]:
+    started: float = time.perf_counter()
+    simulation = Simulation(
+        job["width"],
+        job["height"],
+        number_of_robots=job["robots"],
+        number_of_resources=job["resources"],
+        number_of_obstacles=job["obstacles"],
+        materials_goal=job["materials_goal"],
+        view_distance=job["view_distance"],
+        seed=job["seed"],
+        verbose=False,
+    )
+    ticks: int = simulation.run_until(
+        simulation.check_game_over, max_ticks=job["max_ticks"]
+    )
+    result: Dict[str, object] = dict(job)
+    result.update(
+        ticks=ticks,
+        completed=int(simulation.check_game_over()),
+        materials_delivered=simulation.start_area.materials,
+        distance_walked=sum(robot.distance_walked for robot in simulation.robots),
+        elapsed=round(time.perf_counter() - started, 6),
+    )
+    return result
+
+
+# quita el último renglón si quedó a medias por una interrupción
+def drop_partial_line(path: str) -> None:
+    with open(path, "rb+") as file:
+        data = file.read()
+        if data and not data.endswith(b"\n"):
+            file.truncate(data.rfind(b"\n") + 1)
+
+
+# corridas que ya están en el archivo de resultados
+def completed_keys(path: str) -> Set[Tuple[int, ...]]:
+    if not os.path.exists(path):
+        return set()
+    drop_partial_line(path)
+    keys: Set[Tuple[int, ...]] = set()
+    with open(path, newline="") as file:
+        for row in csv.DictReader(file):
+            try:
+                keys.add(job_key(row))
+            except (TypeError, ValueError):
+                continue
+    return keys
+
+
+def build_jobs(args: argparse.Namespace) -> List[Job]:
+    return [
+        {
+            "seed": seed,
+            "width": args.width,
+            "height": args.height,
+            "robots": robots,
+            "view_distance": view_distance,
+            "resources": resources,
+            "obstacles": obstacles,
+            "materials_goal": args.materials_goal,
+            "max_ticks": args.max_ticks,
+        }
+        for robots, view_distance, resources, obstacles, seed in product(
+            args.robots, args.view_distance, args.resources, args.obstacles, args.seeds
+        )
+    ]
+
+
+# reparte las corridas pendientes entre procesos y escribe cada resultado en
+# cuanto termina, así una interrupción solo pierde las corridas en curso
+def run_batch(jobs: Iterable[Job], csv_path: str, workers: Optional[int] = None) -> int:
+    done = completed_keys(csv_path)
+    pending: List[Job] = [job for job in jobs if job_key(job) not in done]
+    if not pending:
+        return 0
+
+    new_file: bool = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+    with open(csv_path, "a", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_job, job) for job in pending]
+            for future in as_completed(futures):
+                writer.writerow(future.result())
+                file.flush()
+    return len(pending)
+
+
+# convierte los resultados a Parquet (requiere pyarrow)
+def write_parquet(csv_path: str, parquet_path: str) -> None:
+    from pyarrow import csv as pa_csv, parquet
+
+    parquet.write_table(pa_csv.read_csv(csv_path), parquet_path)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Corre simulaciones sin interfaz en paralelo."
+    )
+    parser.add_argument("--seeds", type=parse_int_list, default=parse_int_list("0-9"))
+    parser.add_argument("--width", type=int, default=75)
+    parser.add_argument("--height", type=int, default=40)
+    parser.add_argument("--robots", type=parse_int_list, default=[4])
+    parser.add_argument("--view-distance", type=parse_int_list, default=[5])
+    parser.add_argument("--resources", type=parse_int_list, default=[20])
+    parser.add_argument("--obstacles", type=parse_int_list, default=[20])
+    parser.add_argument("--materials-goal", type=int, default=25)
+    parser.add_argument("--max-ticks", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--output",
+        default="results.csv",
+        help="archivo .csv o .parquet (se escribe un .csv intermedio para reanudar)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    parquet_path: Optional[str] = None
+    csv_path: str = args.output
+    if args.output.endswith(".parquet"):
+        parquet_path = args.output
+        csv_path = args.output[: -len(".parquet")] + ".csv"
+
+    jobs = build_jobs(args)
+    ran = run_batch(jobs, csv_path, args.workers)
+    print(f"{ran} corridas nuevas, {len(jobs) - ran} ya estaban en {csv_path}")
+
+    if parquet_path is not None:
+        write_parquet(csv_path, parquet_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 class Cell:
+    __slots__ = ("x", "y")
+
     def __init__(self, x: int, y: int):
         self.x: int = x
         self.y: int = y
@@ -0,0 +1,424 @@
+# guarda y restaura el estado completo de una Simulation entre dos ticks
+#
+# el mundo estático (zona inicial y obstáculos) se vuelve a generar con la
+# semilla; el resto se guarda en secciones de arreglos: el estado del
+# generador aleatorio, el mapa de exploración, los recursos, el índice
+# espacial y los robots. Las referencias a recursos se guardan como ids.
+# Una simulación restaurada continúa exactamente igual que la original.
+
+# importes globales
+import struct
+import sys
+
+# importes locales
+from array import array
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# importes internos
+from cell import Cell
+from occupancy import OBSTACLE, RESOURCE, ROBOT, START_AREA
+from robot import MOVEMENT_HISTORY
+
+MAGIC: bytes = b"PSCK"
+VERSION: int = 1
+
+# magic, versión y los campos de CheckpointHeader
+HEADER: struct.Struct = struct.Struct("<4sHqIIIIIIIiiqqqBiIBI")
+# cada sección: tipo del arreglo y cantidad de elementos
+SECTION = struct.Struct("<cI")
+
+# parámetros que se pueden cambiar al restaurar o bifurcar
+OVERRIDES: Tuple[str, ...] = (
+    "materials_goal",
+    "view_distance",
+    "grab_distance",
+    "exploration_decay",
+    "respawn_delay",
+    "coordination_interval",
+    "carrying_capacity",
+    "line_of_sight",
+    "verbose",
+    "metrics",
+    "logger",
+)
+
+
+class CheckpointHeader(NamedTuple):
+    seed: int
+    width: int
+    height: int
+    number_of_robots: int
+    number_of_resources: int
+    number_of_obstacles: int
+    materials_goal: int
+    view_distance: int
+    exploration_decay: int  # -1 si no hay
+    respawn_delay: int  # -1 si no hay
+    tick: int
+    start_materials: int
+    grid_version: int
+    game_over: int
+    coordination_interval: int  # -1 si no hay
+    carrying_capacity: int
+    line_of_sight: int
+    grab_distance: int
+
+
+def _write(buffer: bytearray, typecode: str, values) -> None:
+    data = array(typecode, values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    buffer += SECTION.pack(typecode.encode(), len(data))
+    buffer += data.tobytes()
+
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int) -> None:
+        self.data: memoryview = memoryview(data)
+        self.offset: int = offset
+
+    def read(self, typecode: str) -> array:
+        code, count = SECTION.unpack_from(self.data, self.offset)
+        if code != typecode.encode():
+            raise ValueError("corrupt checkpoint")
+        self.offset += SECTION.size
+        values = array(typecode)
+        end: int = self.offset + count * values.itemsize
+        if end > len(self.data):
+            raise ValueError("truncated checkpoint")
+        values.frombytes(self.data[self.offset : end])
+        if sys.byteorder != "little":
+            values.byteswap()
+        self.offset = end
+        return values
+
+
+def _optional(value: Optional[int]) -> int:
+    return -1 if value is None else value
+
+
+def dumps(simulation) -> bytes:
+    robots = simulation.robots
+    manager = simulation.resource_manager
+    scheduler = simulation.scheduler
+
+    header = CheckpointHeader(
+        simulation.seed,
+        simulation.width,
+        simulation.height,
+        simulation.number_of_robots,
+        simulation.number_of_resources,
+        simulation.number_of_obstacles,
+        simulation.materials_goal,
+        simulation.view_distance,
+        _optional(simulation.exploration.decay_interval),
+        _optional(manager.respawn_delay),
+        simulation.tick,
+        simulation.start_area.materials,
+        simulation.grid.version,
+        int(simulation.game_over),
+        _optional(
+            simulation.coordinator.interval if simulation.coordinator else None
+        ),
+        simulation.carrying_capacity,
+        int(simulation.sensor is not None),
+        simulation.grab_distance,
+    )
+    buffer = bytearray(HEADER.pack(MAGIC, VERSION, *header))
+
+    # generador aleatorio: (versión, 625 enteros, gauss_next)
+    _, state, gauss = simulation.rng.getstate()
+    _write(buffer, "I", state)
+    _write(buffer, "d", [] if gauss is None else [gauss])
+
+    _write(buffer, "B", simulation.exploration.visits)
+    # el campo de distancias se guarda para no recalcular el BFS al cargar
+    _write(buffer, "i", simulation.home_field.distances)
+
+    # recursos por id y el orden de cada estructura que los guarda
+    _write(buffer, "i", [resource.x for resource in manager.by_id])
+    _write(buffer, "i", [resource.y for resource in manager.by_id])
+    _write(buffer, "i", [resource.materials for resource in manager.by_id])
+    _write(buffer, "i", [resource.id for resource in manager.resources])
+    _write(buffer, "i", [resource.id for resource in manager.depleted])
+    _write(buffer, "q", [due for due, _ in manager.pool])
+    _write(buffer, "i", [resource.id for _, resource in manager.pool])
+    _write(buffer, "i", [resource.id for resource in simulation.resource_index.positions])
+
+    # robots
+    _write(buffer, "i", [robot.x for robot in robots])
+    _write(buffer, "i", [robot.y for robot in robots])
+    _write(buffer, "i", [robot.start_cell.x for robot in robots])
+    _write(buffer, "i", [robot.start_cell.y for robot in robots])
+    _write(buffer, "i", [robot.materials for robot in robots])
+    _write(buffer, "q", [robot.distance_walked for robot in robots])
+    _write(
+        buffer,
+        "B",
+        [
+            robot.is_grabbing
+            | scheduler.is_awake(robot.id) << 1
+            | (robot.id in scheduler.waiting) << 2
+            for robot in robots
+        ],
+    )
+    _write(buffer, "i", [_resource_id(robot.closest_resource) for robot in robots])
+    _write(buffer, "i", [_resource_id(robot.last_resource) for robot in robots])
+    _write(buffer, "i", [robot.path_goal[0] if robot.path_goal else -1 for robot in robots])
+    _write(buffer, "i", [robot.path_goal[1] if robot.path_goal else -1 for robot in robots])
+    _write(buffer, "q", [robot.path_version for robot in robots])
+    _write(
+        buffer,
+        "i",
+        [-1 if robot.current_path is None else len(robot.current_path) for robot in robots],
+    )
+    _write(
+        buffer,
+        "i",
+        [value for robot in robots for step in robot.current_path or () for value in step],
+    )
+    _write(buffer, "I", [len(robot.movements) for robot in robots])
+    _write(
+        buffer,
+        "i",
+        [
+            value
+            for robot in robots
+            for step in robot.recent_movements()
+            for value in step
+        ],
+    )
+
+    # recursos que conoce el coordinador y los que quedaron reservados
+    coordinator = simulation.coordinator
+    known = coordinator.known if coordinator else ()
+    taken = coordinator.taken if coordinator else ()
+    _write(buffer, "i", [resource.id for resource in known])
+    _write(buffer, "i", [resource.id for resource in taken])
+
+    # celdas vistas con línea de visión
+    _write(buffer, "B", simulation.exploration.seen)
+    return bytes(buffer)
+
+
+def _resource_id(resource) -> int:
+    return -1 if resource is None else resource.id
+
+
+def read_header(data: bytes) -> CheckpointHeader:
+    if len(data) < 6:
+        raise ValueError("not a checkpoint")
+    magic, version = struct.unpack_from("<4sH", data)
+    if magic != MAGIC:
+        raise ValueError("not a checkpoint")
+    if version != VERSION:
+        raise ValueError(f"unsupported checkpoint version {version}")
+    if len(data) < HEADER.size:
+        raise ValueError("truncated checkpoint")
+    _, _, *fields = HEADER.unpack_from(data)
+    return CheckpointHeader(*fields)
+
+
+# crea una Simulation nueva con el estado guardado
+# `overrides` cambia parámetros que no alteran el mundo (ver OVERRIDES)
+def loads(data: bytes, **overrides: Any):
+    # importado aquí para que este módulo no dependa de la simulación
+    from simulation import Simulation
+
+    unknown = set(overrides) - set(OVERRIDES)
+    if unknown:
+        raise TypeError(f"cannot override {', '.join(sorted(unknown))}")
+
+    header = read_header(data)
+    parameters: Dict[str, Any] = {
+        "materials_goal": header.materials_goal,
+        "view_distance": header.view_distance,
+        "grab_distance": header.grab_distance,
+        "exploration_decay": None
+        if header.exploration_decay < 0
+        else header.exploration_decay,
+        "respawn_delay": None if header.respawn_delay < 0 else header.respawn_delay,
+        "coordination_interval": None
+        if header.coordination_interval < 0
+        else header.coordination_interval,
+        "carrying_capacity": header.carrying_capacity,
+        "line_of_sight": bool(header.line_of_sight),
+        "verbose": False,
+    }
+    parameters.update(overrides)
+    simulation = Simulation(
+        header.width,
+        header.height,
+        number_of_robots=header.number_of_robots,
+        number_of_resources=header.number_of_resources,
+        number_of_obstacles=header.number_of_obstacles,
+        seed=header.seed,
+        **parameters,
+    )
+    reader = _Reader(data, HEADER.size)
+
+    state = reader.read("I")
+    gauss = reader.read("d")
+    simulation.rng.setstate((3, tuple(state), gauss[0] if gauss else None))
+    simulation.exploration.visits[:] = reader.read("B")
+    distances = reader.read("i")
+    simulation.tick = header.tick
+    simulation.start_area.materials = header.start_materials
+    simulation.game_over = bool(header.game_over)
+
+    _restore_resources(simulation, reader)
+    _restore_robots(simulation, reader)
+    _rebuild_grid(simulation, header.grid_version)
+    simulation.home_field.distances[:] = distances
+    known = reader.read("i")
+    taken = reader.read("i")
+    if simulation.coordinator is not None:
+        by_id = simulation.resource_manager.by_id
+        simulation.coordinator.known = dict.fromkeys(by_id[i] for i in known)
+        simulation.coordinator.taken = dict.fromkeys(by_id[i] for i in taken)
+    simulation.exploration.seen[:] = reader.read("B")
+    if simulation.sensor is not None:
+        simulation.sensor.rebuild()
+    return simulation
+
+
+def _restore_resources(simulation, reader: _Reader) -> None:
+    manager = simulation.resource_manager
+    by_id = manager.by_id
+    for resource, x, y, materials in zip(
+        by_id, reader.read("i"), reader.read("i"), reader.read("i")
+    ):
+        resource.x, resource.y, resource.materials = x, y, materials
+
+    # la lista de vivos es la misma que usa la simulación: se cambia en su lugar
+    manager.resources[:] = [by_id[i] for i in reader.read("i")]
+    manager.slots[:] = [-1] * len(by_id)
+    for slot, resource in enumerate(manager.resources):
+        manager.slots[resource.id] = slot
+    manager.depleted[:] = [by_id[i] for i in reader.read("i")]
+    manager.pool.clear()
+    manager.pool.extend(zip(reader.read("q"), (by_id[i] for i in reader.read("i"))))
+
+    # el orden de inserción del índice decide los empates en `nearest`
+    index = simulation.resource_index
+    index.positions.clear()
+    for bucket in index.buckets:
+        bucket.clear()
+    for i in reader.read("i"):
+        index.insert(by_id[i])
+
+
+def _restore_robots(simulation, reader: _Reader) -> None:
+    robots = simulation.robots
+    by_id = simulation.resource_manager.by_id
+    scheduler = simulation.scheduler
+
+    columns: List[array] = [
+        reader.read("i"),
+        reader.read("i"),
+        reader.read("i"),
+        reader.read("i"),
+        reader.read("i"),
+        reader.read("q"),
+        reader.read("B"),
+        reader.read("i"),
+        reader.read("i"),
+        reader.read("i"),
+        reader.read("i"),
+        reader.read("q"),
+        reader.read("i"),
+    ]
+    path_cells = reader.read("i")
+    movement_lengths = reader.read("I")
+    movement_cells = reader.read("i")
+
+    scheduler.waiting.clear()
+    path_offset: int = 0
+    movement_offset: int = 0
+    for robot, (
+        x,
+        y,
+        start_x,
+        start_y,
+        materials,
+        distance_walked,
+        flags,
+        closest,
+        last,
+        goal_x,
+        goal_y,
+        path_version,
+        path_length,
+    ), movements in zip(robots, zip(*columns), movement_lengths):
+        robot.x, robot.y = x, y
+        robot.start_cell = Cell(start_x, start_y)
+        robot.materials = materials
+        robot.distance_walked = distance_walked
+        robot.is_grabbing = bool(flags & 1)
+        robot.closest_resource = by_id[closest] if closest >= 0 else None
+        robot.last_resource = by_id[last] if last >= 0 else None
+        robot.path_goal = (goal_x, goal_y) if goal_x >= 0 else None
+        robot.path_version = path_version
+        if path_length < 0:
+            robot.current_path = None
+        else:
+            end = path_offset + 2 * path_length
+            cells = path_cells[path_offset:end]
+            robot.current_path = list(zip(cells[::2], cells[1::2]))
+            path_offset = end
+        end = movement_offset + 2 * movements
+        cells = movement_cells[movement_offset:end]
+        robot.movements = list(zip(cells[::2], cells[1::2]))[-MOVEMENT_HISTORY:]
+        robot.movement_head = 0
+        movement_offset = end
+
+        scheduler.awake[robot.id] = flags >> 1 & 1
+        if flags & 4:
+            scheduler.waiting[robot.id] = None
+    scheduler.listed[:] = scheduler.awake
+    scheduler.order = [robot.id for robot in robots if scheduler.awake[robot.id]]
+    scheduler.slept = False
+
+
+# la ocupación se deriva del resto del estado; se reconstruye sin avisar a
+# nadie (el campo de distancias se restaura aparte)
+def _rebuild_grid(simulation, version: int) -> None:
+    grid = simulation.grid
+    listeners = grid.listeners
+    grid.listeners = []
+    grid.cells[:] = bytes(len(grid.cells))
+    for counts in grid.counts.values():
+        counts[:] = array("H", bytes(2 * len(grid.cells)))
+
+    area = simulation.start_area
+    for x in range(area.start_x, area.start_x + area.area_width):
+        for y in range(area.start_y, area.start_y + area.area_height):
+            grid.add(x, y, START_AREA)
+    for obstacle in simulation.obstacles:
+        grid.add(obstacle.x, obstacle.y, OBSTACLE)
+    for resource in simulation.resources:
+        grid.add(resource.x, resource.y, RESOURCE)
+    for robot in simulation.robots:
+        grid.add(robot.x, robot.y, ROBOT)
+
+    grid.listeners = listeners
+    grid.version = version
+
+
+def save(simulation, path: str) -> None:
+    with open(path, "wb") as file:
+        file.write(dumps(simulation))
+
+
+def load(path: str, **overrides: Any):
+    with open(path, "rb") as file:
+        return loads(file.read(), **overrides)
+
+
+# copia independiente de una simulación, opcionalmente con otros parámetros
+# y con otra semilla para el generador aleatorio desde este punto
+def fork(simulation, seed: Optional[int] = None, **overrides: Any):
+    copy = loads(dumps(simulation), **overrides)
+    if seed is not None:
+        copy.rng.seed(seed)
+    return copy
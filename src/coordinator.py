@@ -0,0 +1,139 @@
+# importes locales
+from heapq import heapify, heappop, heappush
+from typing import Dict, Iterator, List, Tuple
+
+# importes internos
+from resources import Resources
+
+
+# reparto centralizado de recursos entre los robots libres
+#
+# el coordinador solo conoce los recursos que algún robot ya vio. Cada
+# `interval` ticks asigna a cada robot libre (despierto y sin carga) un recurso
+# de forma voraz: primero las parejas más cercanas y, a igual distancia, el
+# recurso con más materiales. Cada robot asignado reserva lo que puede cargar,
+# así un recurso nunca recibe más robots de los que puede llenar.
+# La asignación se guarda en `last_resource`, que el robot ya prioriza; los
+# recursos reservados por completo quedan en `taken` y los robots sin tarea no
+# los persiguen hasta la siguiente ronda.
+#
+# las parejas no se ordenan todas: cada robot recorre las cubetas del índice
+# espacial en anillos y entrega sus candidatos de cerca a lejos, y un montículo
+# mezcla a todos los robots en el mismo orden que tendría la lista completa
+class TaskCoordinator:
+    def __init__(self, simulation, interval: int = 10) -> None:
+        self.simulation = simulation
+        self.interval: int = interval
+        # conjunto ordenado de recursos vistos que siguen vivos
+        self.known: Dict[Resources, None] = {}
+        # recursos sin lugar para más robots en la última ronda
+        self.taken: Dict[Resources, None] = {}
+        simulation.resource_manager.listeners.append(self.resource_changed)
+
+    # un robot vio o tocó un recurso
+    def report(self, resource: Resources) -> None:
+        if resource.materials > 0:
+            self.known[resource] = None
+
+    # un recurso que reaparece está en otro lugar: hay que volver a encontrarlo
+    def resource_changed(self, resource: Resources, alive: bool) -> None:
+        if not alive:
+            self.known.pop(resource, None)
+            self.taken.pop(resource, None)
+
+    # un robot sin tarea puede ir por el recurso si no quedó reservado por completo
+    def is_free(self, resource: Resources) -> bool:
+        return resource not in self.taken
+
+    def update(self, tick: int) -> None:
+        if tick % self.interval == 0:
+            self.assign()
+
+    # recursos conocidos alrededor del robot ordenados por
+    # (distancia, -materiales, posición en `order`)
+    def _candidates(
+        self, robot, order: Dict[Resources, int]
+    ) -> Iterator[Tuple[int, int, int]]:
+        index = self.simulation.resource_index
+        size: int = index.bucket_size
+        columns: int = index.columns
+        x: int = robot.x
+        y: int = robot.y
+        column: int = x // size
+        row: int = y // size
+        found: List[Tuple[int, int, int]] = []
+        for ring in range(max(columns, index.rows)):
+            for bucket_row in range(row - ring, row + ring + 1):
+                if not 0 <= bucket_row < index.rows:
+                    continue
+                # en las filas de en medio solo cuentan los dos extremos del anillo
+                step: int = 1 if abs(bucket_row - row) == ring else 2 * ring
+                for bucket_column in range(column - ring, column + ring + 1, step):
+                    if not 0 <= bucket_column < columns:
+                        continue
+                    bucket = index.buckets[bucket_row * columns + bucket_column]
+                    for resource in bucket:
+                        j = order.get(resource)
+                        if j is not None:
+                            distance = abs(x - resource.x) + abs(y - resource.y)
+                            heappush(found, (distance, -resource.materials, j))
+            # las cubetas del siguiente anillo quedan a más de ring * size
+            while found and found[0][0] <= ring * size:
+                yield heappop(found)
+        while found:
+            yield heappop(found)
+
+    def assign(self) -> None:
+        simulation = self.simulation
+        scheduler = simulation.scheduler
+        self.taken.clear()
+        robots = [
+            robot
+            for robot in simulation.robots
+            if not robot.is_grabbing and scheduler.is_awake(robot.id)
+        ]
+        resources = [resource for resource in self.known if resource.materials > 0]
+        if not robots or not resources:
+            return
+
+        order: Dict[Resources, int] = {
+            resource: j for j, resource in enumerate(resources)
+        }
+        streams = [self._candidates(robot, order) for robot in robots]
+        # (distancia, -materiales, robot, recurso): el mejor candidato de cada robot
+        pairs: List[Tuple[int, int, int, int]] = []
+        for i, stream in enumerate(streams):
+            for distance, materials, j in stream:
+                pairs.append((distance, materials, i, j))
+                break
+        heapify(pairs)
+
+        capacity: List[int] = [resource.materials for resource in resources]
+        assigned: List[bool] = [False] * len(robots)
+        remaining: int = len(robots)
+        available: int = sum(capacity)
+        while pairs:
+            _, _, i, j = heappop(pairs)
+            if capacity[j] == 0:
+                # el recurso ya se llenó: el robot pasa a su siguiente candidato
+                for distance, materials, k in streams[i]:
+                    if capacity[k]:
+                        heappush(pairs, (distance, materials, i, k))
+                        break
+                continue
+            reserved: int = min(robots[i].capacity, capacity[j])
+            assigned[i] = True
+            capacity[j] -= reserved
+            robots[i].last_resource = resources[j]
+            remaining -= 1
+            available -= reserved
+            if remaining == 0 or available == 0:
+                break
+
+        for resource, left in zip(resources, capacity):
+            if left == 0:
+                self.taken[resource] = None
+        # los que no alcanzaron recurso dejan de perseguir uno ya reservado
+        for robot, has_task in zip(robots, assigned):
+            if not has_task:
+                robot.last_resource = None
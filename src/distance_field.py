@@ -0,0 +1,158 @@
+# importes locales
+from array import array
+from collections import deque
+from heapq import heapify, heappop, heappush
+from typing import Deque, Iterable, List, Optional, Set, Tuple
+
+# importes internos
+from occupancy import OccupancyGrid, BLOCKING
+
+# distancia de las celdas bloqueadas o sin camino a la zona inicial
+UNREACHABLE: int = 2**31 - 1
+
+# orden fijo de vecinos para que el descenso sea determinista
+NEIGHBORS: Tuple[Tuple[int, int], ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+# campo de distancias compartido (BFS con varias fuentes) hacia un conjunto de
+# celdas, normalmente la zona inicial; los robots que regresan solo bajan por él
+class DistanceField:
+    def __init__(
+        self, grid: OccupancyGrid, sources: Iterable[Tuple[int, int]]
+    ) -> None:
+        self.grid: OccupancyGrid = grid
+        self.width: int = grid.width
+        self.height: int = grid.height
+        self.sources: Set[int] = {
+            y * grid.width + x for x, y in sources if grid.in_bounds(x, y)
+        }
+        self.distances: array = array("i", [UNREACHABLE]) * (self.width * self.height)
+        self.recompute()
+        grid.listeners.append(self.on_cell_changed)
+
+    def _neighbors(self, index: int) -> List[int]:
+        x: int = index % self.width
+        y: int = index // self.width
+        result: List[int] = []
+        for dx, dy in NEIGHBORS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                result.append(ny * self.width + nx)
+        return result
+
+    # recalcula todo el campo con un BFS desde las fuentes libres
+    def recompute(self) -> None:
+        cells: bytearray = self.grid.cells
+        distances: array = self.distances
+        for i in range(len(distances)):
+            distances[i] = UNREACHABLE
+        queue: Deque[int] = deque()
+        for source in sorted(self.sources):
+            if not cells[source] & BLOCKING:
+                distances[source] = 0
+                queue.append(source)
+        self._propagate(queue)
+
+    # expande distancias menores desde las celdas en la cola (BFS)
+    def _propagate(self, queue: Deque[int]) -> None:
+        cells: bytearray = self.grid.cells
+        distances: array = self.distances
+        while queue:
+            current: int = queue.popleft()
+            next_distance: int = distances[current] + 1
+            for neighbor in self._neighbors(current):
+                if cells[neighbor] & BLOCKING:
+                    continue
+                if next_distance < distances[neighbor]:
+                    distances[neighbor] = next_distance
+                    queue.append(neighbor)
+
+    # actualiza el campo de forma incremental cuando una celda cambia
+    def on_cell_changed(self, x: int, y: int, blocked: bool) -> None:
+        index: int = y * self.width + x
+        if blocked:
+            self._block(index)
+        else:
+            self._unblock(index)
+
+    # una celda liberada solo puede acortar distancias
+    def _unblock(self, index: int) -> None:
+        distances: array = self.distances
+        if index in self.sources:
+            distances[index] = 0
+        else:
+            best: int = min(
+                (distances[n] for n in self._neighbors(index)), default=UNREACHABLE
+            )
+            if best == UNREACHABLE:
+                return
+            distances[index] = best + 1
+        self._propagate(deque([index]))
+
+    # una celda bloqueada deja huérfanas a las celdas cuyo único camino
+    # más corto pasaba por ella; solo esas se vuelven a calcular
+    def _block(self, index: int) -> None:
+        distances: array = self.distances
+        old_distance: int = distances[index]
+        distances[index] = UNREACHABLE
+        if old_distance == UNREACHABLE:
+            return
+
+        orphans: Set[int] = {index}
+        queue: Deque[int] = deque([index])
+        while queue:
+            current: int = queue.popleft()
+            expected: int = (
+                old_distance if current == index else distances[current]
+            ) + 1
+            for neighbor in self._neighbors(current):
+                if neighbor in orphans or distances[neighbor] != expected:
+                    continue
+                # sigue teniendo otro vecino que no es huérfano a distancia menor
+                if any(
+                    distances[other] == expected - 1 and other not in orphans
+                    for other in self._neighbors(neighbor)
+                ):
+                    continue
+                orphans.add(neighbor)
+                queue.append(neighbor)
+
+        orphans.discard(index)
+        for orphan in orphans:
+            distances[orphan] = UNREACHABLE
+
+        # se reconstruyen las huérfanas desde su borde con el resto del campo
+        cells: bytearray = self.grid.cells
+        heap: List[Tuple[int, int]] = []
+        for orphan in orphans:
+            best: int = min(distances[n] for n in self._neighbors(orphan))
+            if best != UNREACHABLE:
+                heap.append((best + 1, orphan))
+        heapify(heap)
+        while heap:
+            distance, current = heappop(heap)
+            if distance >= distances[current]:
+                continue
+            distances[current] = distance
+            for neighbor in self._neighbors(current):
+                if cells[neighbor] & BLOCKING:
+                    continue
+                if distance + 1 < distances[neighbor]:
+                    heappush(heap, (distance + 1, neighbor))
+
+    # distancia de la celda a la fuente más cercana
+    def distance(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return UNREACHABLE
+        return self.distances[y * self.width + x]
+
+    # siguiente celda cuesta abajo en el campo, None si ya llegó o no hay camino
+    def next_step(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        best: int = self.distance(x, y)
+        step: Optional[Tuple[int, int]] = None
+        for dx, dy in NEIGHBORS:
+            distance: int = self.distance(x + dx, y + dy)
+            if distance < best:
+                best = distance
+                step = (x + dx, y + dy)
+        return step
@@ -0,0 +1,179 @@
+# importes globales
+import struct
+
+# importes locales
+from typing import Iterator, List, NamedTuple, Optional
+
+# tipos de evento
+MOVE: int = 1
+GRAB: int = 2
+DROP: int = 3
+DEPLETE: int = 4
+RESPAWN: int = 5
+
+MAGIC: bytes = b"PSEL"
+VERSION: int = 1
+
+# cabecera: magic, versión, semilla, ancho, alto, robots, recursos, obstáculos, meta
+HEADER = struct.Struct("<4sHqIIIIII")
+# registro: tick, tipo, robot, x, y, valor
+# MOVE: valor sin uso; GRAB: id del recurso (un registro por material
+# recogido); DROP: materiales entregados;
+# DEPLETE: id del recurso; RESPAWN: id del recurso (el campo robot guarda
+# los materiales con los que reaparece)
+RECORD = struct.Struct("<IBHhhi")
+
+
+class Event(NamedTuple):
+    tick: int
+    kind: int
+    robot: int
+    x: int
+    y: int
+    value: int
+
+
+class LogHeader(NamedTuple):
+    seed: int
+    width: int
+    height: int
+    number_of_robots: int
+    number_of_resources: int
+    number_of_obstacles: int
+    materials_goal: int
+
+
+# registro binario compacto de lo que pasa en una simulación
+# con la cabecera basta para reconstruir el mundo inicial (la semilla)
+# y con los eventos se puede reproducir la corrida sin volver a decidir
+class EventLog:
+    def __init__(self, header: LogHeader) -> None:
+        self.header: LogHeader = header
+        self.buffer: bytearray = bytearray()
+
+    @classmethod
+    def for_simulation(cls, simulation) -> "EventLog":
+        return cls(
+            LogHeader(
+                simulation.seed,
+                simulation.width,
+                simulation.height,
+                simulation.number_of_robots,
+                simulation.number_of_resources,
+                simulation.number_of_obstacles,
+                simulation.materials_goal,
+            )
+        )
+
+    def record(self, tick: int, kind: int, robot: int, x: int, y: int, value: int) -> None:
+        self.buffer += RECORD.pack(tick, kind, robot, x, y, value)
+
+    def __len__(self) -> int:
+        return len(self.buffer) // RECORD.size
+
+    def __iter__(self) -> Iterator[Event]:
+        for fields in RECORD.iter_unpack(self.buffer):
+            yield Event(*fields)
+
+    def to_bytes(self) -> bytes:
+        return HEADER.pack(MAGIC, VERSION, *self.header) + bytes(self.buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "EventLog":
+        magic, version, *fields = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not an event log")
+        if version != VERSION:
+            raise ValueError(f"unsupported event log version {version}")
+        log = cls(LogHeader(*fields))
+        log.buffer = bytearray(data[HEADER.size :])
+        if len(log.buffer) % RECORD.size:
+            raise ValueError("truncated event log")
+        return log
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "EventLog":
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+# índice del primer evento en el que dos registros difieren (None si son iguales)
+def first_difference(a: EventLog, b: EventLog) -> Optional[int]:
+    if a.header != b.header:
+        return 0
+    size: int = RECORD.size
+    length: int = min(len(a.buffer), len(b.buffer))
+    for offset in range(0, length, size):
+        if a.buffer[offset : offset + size] != b.buffer[offset : offset + size]:
+            return offset // size
+    if len(a.buffer) != len(b.buffer):
+        return length // size
+    return None
+
+
+# reproduce una corrida aplicando los eventos guardados sobre el mundo inicial
+class Replay:
+    def __init__(self, log: EventLog) -> None:
+        # importado aquí para que el registro no dependa de la simulación
+        from simulation import Simulation
+
+        header = log.header
+        self.simulation = Simulation(
+            header.width,
+            header.height,
+            number_of_robots=header.number_of_robots,
+            number_of_resources=header.number_of_resources,
+            number_of_obstacles=header.number_of_obstacles,
+            materials_goal=header.materials_goal,
+            seed=header.seed,
+            verbose=False,
+        )
+        self.resources = self.simulation.resource_manager
+        self.events: List[Event] = list(log)
+        self.position: int = 0
+
+    def done(self) -> bool:
+        return self.position >= len(self.events)
+
+    # aplica los eventos del siguiente tick
+    def step(self) -> None:
+        simulation = self.simulation
+        if self.done():
+            return
+        tick: int = self.events[self.position].tick
+        while self.position < len(self.events) and self.events[self.position].tick == tick:
+            self.apply(self.events[self.position])
+            self.position += 1
+        simulation.tick = tick + 1
+
+    def run(self) -> None:
+        while not self.done():
+            self.step()
+
+    def apply(self, event: Event) -> None:
+        simulation = self.simulation
+        if event.kind == MOVE:
+            robot = simulation.robots[event.robot]
+            robot.place(event.x, event.y)
+        elif event.kind == GRAB:
+            robot = simulation.robots[event.robot]
+            resource = self.resources.get(event.value)
+            resource.materials -= 1
+            robot.materials += 1
+            robot.is_grabbing = True
+            robot.last_resource = resource
+        elif event.kind == DROP:
+            robot = simulation.robots[event.robot]
+            simulation.start_area.materials += event.value
+            robot.materials = 0
+            robot.is_grabbing = False
+        elif event.kind == DEPLETE:
+            simulation.retire_resource(self.resources.get(event.value))
+        elif event.kind == RESPAWN:
+            simulation.place_resource(
+                self.resources.get(event.value), event.x, event.y, event.robot
+            )
@@ -0,0 +1,55 @@
+# importes locales
+from typing import Optional
+
+# tabla para dividir a la mitad todas las visitas con bytes.translate
+HALVE: bytes = bytes(value // 2 for value in range(256))
+
+
+# mapa de exploración compartido por todo el equipo: un contador de visitas
+# por celda (satura en 255) con memoria fija de width * height bytes
+class ExplorationMap:
+    def __init__(
+        self, width: int, height: int, decay_interval: Optional[int] = None
+    ) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.visits: bytearray = bytearray(width * height)
+        # celdas que algún robot vio (solo con línea de visión, no decae)
+        self.seen: bytearray = bytearray(width * height)
+        # cada cuántos ticks se reducen a la mitad las visitas (None = nunca)
+        self.decay_interval: Optional[int] = decay_interval
+
+    def visit(self, x: int, y: int) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i: int = y * self.width + x
+            if self.visits[i] < 255:
+                self.visits[i] += 1
+
+    def visits_at(self, x: int, y: int) -> int:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.visits[y * self.width + x]
+        return 0
+
+    def is_explored(self, x: int, y: int) -> bool:
+        return self.visits_at(x, y) > 0
+
+    def is_seen(self, x: int, y: int) -> bool:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.seen[y * self.width + x] > 0
+        return False
+
+    # las celdas visitadas hace mucho vuelven a parecer inexploradas
+    def decay(self) -> None:
+        self.visits[:] = self.visits.translate(HALVE)
+
+    def update(self, tick: int) -> None:
+        if self.decay_interval and tick % self.decay_interval == 0:
+            self.decay()
+
+    # porcentaje del tablero que se ha visitado al menos una vez
+    def coverage(self) -> float:
+        return 1 - self.visits.count(0) / len(self.visits)
+
+    # porcentaje del tablero que se ha visto al menos una vez
+    def seen_coverage(self) -> float:
+        return 1 - self.seen.count(0) / len(self.seen)
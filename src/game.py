@@ -1,192 +1,260 @@
 # importes globales
 import pygame
-import sys
 
 # importes locales
 from random import randint
-from typing import List, Tuple
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
 
 # importes internos
-from robot import Robot
-from resources import Resources
-from obstacles import Obstacles
-from start_area import StartArea
-from cell import Cell
+from rendering import Color, RESOURCE_COLOR, draw_obstacle, draw_start_area
+from simulation import Simulation
 
 
 class Game:
-    def __init__(self, width: int, height: int, grid_size: int, ticks: int) -> None:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        grid_size: int,
+        ticks: Optional[int],
+        seed: Optional[int] = None,
+        simulation: Optional[Simulation] = None,
+        fps: int = 30,
+        max_ticks: Optional[int] = None,
+    ) -> None:
         self.width: int = width
         self.height: int = height
         self.grid_size: int = grid_size
-        self.grid: List[List[int]] = [[0 for _ in range(width)] for _ in range(height)]
-        self.ticks: int = ticks
-
-        self.number_of_robots: int = 4
-        self.robots: List[Robot] = []
+        # ticks de simulación por segundo (None o 0: tan rápido como se pueda)
+        self.ticks: Optional[int] = ticks or None
+        # cuadros por segundo de la ventana, independiente de la simulación
+        self.fps: int = fps
+        # al llegar a este tick la simulación se detiene y la ventana sigue abierta
+        self.max_ticks: Optional[int] = max_ticks
+        self.paused: bool = False
+
+        # inicializa la simulación (no depende de pygame) o dibuja una ya creada
+        self.simulation: Simulation = (
+            simulation
+            if simulation is not None
+            else Simulation(width, height, seed=seed)
+        )
 
         # inicializa pygame
         pygame.init()
         self.screen = pygame.display.set_mode((width * grid_size, height * grid_size))
         pygame.display.set_caption("Grid")
-        self.clock = pygame.time.Clock()
 
-        # inicializa los componentes del juego
-        self.initialize_start_area()
-        self.initialize_resources()
-        self.initialize_obstacles()
-        self.initialize_robots()
+        self.robot_colors: List[Color] = [
+            (randint(0, 255), randint(0, 255), randint(0, 255))
+            for _ in self.simulation.robots
+        ]
 
         # Colors
-        self.GREY: Tuple[int, int, int] = (100, 100, 100)
+        self.GREY: Color = (100, 100, 100)
 
         # Text
         self.font = pygame.font.Font(None, 24)  # Choose the font and size
 
-    # funciones para inicializar los componentes del juego
-    def initialize_start_area(self) -> None:
-        self.start_area: StartArea = StartArea(self.width, self.height)
-        self.start_x: int = self.start_area.start_x
-        self.start_y: int = self.start_area.start_y
-
-    def initialize_resources(self) -> None:
-        self.resources: List[Resources] = [
-            Resources(
-                randint(0, self.width - 1),
-                randint(0, self.height - 1),
-                self.width,
-                self.height,
-            )
-            for _ in range(20)
-        ]
-
-    def initialize_obstacles(self) -> None:
-        self.obstacles: List[Obstacles] = [
-            Obstacles(
-                randint(0, self.width - 1),
-                randint(0, self.height - 1),
-                self.width,
-                self.height,
-            )
-            for _ in range(20)
-        ]
-
-    def initialize_robots(self) -> None:
-        for _ in range(self.number_of_robots):
-            x: int = randint(
-                self.start_x, self.start_x + self.start_area.area_width - 1
-            )
-            y: int = randint(
-                self.start_y, self.start_y + self.start_area.area_height - 1
-            )
-            robot: Robot = Robot(self, x, y)
-            self.robots.append(robot)
-
-        self.robot_colors: List[Tuple[int, int, int]] = [
-            (randint(0, 255), randint(0, 255), randint(0, 255)) for _ in self.robots
-        ]
+        # fondo estático (cuadrícula, zona inicial y obstáculos) dibujado una sola vez
+        self.background: pygame.Surface = self.build_background()
+        # color con el que se dibujó cada celda dinámica en el cuadro anterior
+        self.drawn_cells: Dict[Tuple[int, int], Color] = {}
+        # texto del marcador por línea: (texto, superficie, rectángulo)
+        self.info_lines: List[Tuple[str, pygame.Surface, pygame.Rect]] = []
 
     # funciones para dibujar los componentes del juego
-    def draw_grid(self) -> None:
+    def cell_rect(self, x: int, y: int) -> pygame.Rect:
+        return pygame.Rect(
+            x * self.grid_size, y * self.grid_size, self.grid_size, self.grid_size
+        )
+
+    def draw_grid(self, surface: pygame.Surface) -> None:
         for y in range(self.height):
             for x in range(self.width):
-                rect = pygame.Rect(
-                    x * self.grid_size,
-                    y * self.grid_size,
-                    self.grid_size,
-                    self.grid_size,
-                )
-                pygame.draw.rect(self.screen, self.GREY, rect, 1)
-
-    def draw_resources(self) -> None:
-        for resource in self.resources:
-            resource.draw(self.screen, self.grid_size)
-
-    def draw_obstacles(self) -> None:
-        for obstacle in self.obstacles:
-            obstacle.draw(self.screen, self.grid_size)
-
-    def draw_robot(self, robot: Robot, robot_color: Tuple[int, int, int]) -> None:
-        rect = pygame.Rect(
-            robot.x * self.grid_size,
-            robot.y * self.grid_size,
-            self.grid_size,
-            self.grid_size,
-        )
-        pygame.draw.rect(self.screen, robot_color, rect)
-
-    # dibuja el marcador
-    def draw_text(self, text: str, position: Tuple[int, int]) -> None:
-        text_surface = self.font.render(text, True, (255, 255, 255))
-        self.screen.blit(text_surface, position)
-
-    def draw_info(self) -> None:
-        start_area_materials_text = f"Start Area Materials: {self.start_area.materials}"
-        self.draw_text(start_area_materials_text, (10, 10))
-
-        robot_info_y = 30
-        for i, robot in enumerate(self.robots):
-            robot_materials_text = (
-                f"Robot {i + 1} Grabbing: {robot.materials} materials"
-            )
-            self.draw_text(robot_materials_text, (10, robot_info_y))
-            robot_info_y += 20
-
-    # muestra información en consola
-    def log(self, message: str) -> None:
-        print(f"[{self.clock.get_rawtime()}] {message}")
-
-    # calcula el movimiento del robot
-    def move_robot(self, robot: Robot) -> None:
-        if robot.is_grabbing:
-            robot.move_towards(robot.start_cell)
+                pygame.draw.rect(surface, self.GREY, self.cell_rect(x, y), 1)
+
+    def build_background(self) -> pygame.Surface:
+        background = pygame.Surface(self.screen.get_size()).convert()
+        background.fill((0, 0, 0))
+        draw_start_area(background, self.simulation.start_area, self.grid_size)
+        self.draw_grid(background)
+        for obstacle in self.simulation.obstacles:
+            draw_obstacle(background, obstacle, self.grid_size)
+        return background
+
+    # color que debe tener cada celda dinámica en este cuadro
+    def dynamic_cells(self) -> Dict[Tuple[int, int], Color]:
+        cells: Dict[Tuple[int, int], Color] = {}
+        for resource in self.simulation.resources:
+            if resource.materials > 0:
+                cells[(resource.x, resource.y)] = RESOURCE_COLOR
+        for i, robot in enumerate(self.simulation.robots):
+            cells[(robot.x, robot.y)] = self.robot_color(i)
+        return cells
+
+    def robot_color(self, index: int) -> Color:
+        if index < len(self.robot_colors):
+            return self.robot_colors[index]
+        return (0, 255, 0)
+
+    # redibuja solo las celdas cuyo contenido cambió desde el cuadro anterior
+    def draw_cells(self) -> List[pygame.Rect]:
+        current = self.dynamic_cells()
+        dirty: List[pygame.Rect] = []
+        for cell in self.drawn_cells.keys() | current.keys():
+            color = current.get(cell)
+            if self.drawn_cells.get(cell) == color:
+                continue
+            rect = self.cell_rect(*cell)
+            self.screen.blit(self.background, rect, rect)
+            if color is not None:
+                pygame.draw.rect(self.screen, color, rect)
+            dirty.append(rect)
+        self.drawn_cells = current
+        return dirty
+
+    # textos del marcador
+    def info_texts(self) -> List[str]:
+        texts = [f"Start Area Materials: {self.simulation.start_area.materials}"]
+        for i, robot in enumerate(self.simulation.robots):
+            texts.append(f"Robot {i + 1} Grabbing: {robot.materials} materials")
+        # métricas por fase y contadores del último tick si están activadas
+        if self.simulation.metrics.enabled:
+            texts.extend(self.simulation.metrics.overlay_lines())
+        return texts
+
+    # vuelve a generar solo las líneas del marcador que cambiaron
+    # regresa la zona que ocupaban antes y ocupan ahora las líneas modificadas
+    def update_info(self) -> Optional[pygame.Rect]:
+        changed: List[pygame.Rect] = []
+        for i, text in enumerate(self.info_texts()):
+            if i < len(self.info_lines):
+                if self.info_lines[i][0] == text:
+                    continue
+                changed.append(self.info_lines[i][2])
+            surface = self.font.render(text, True, (255, 255, 255))
+            rect = surface.get_rect(topleft=(10, 10 + 20 * i))
+            if i < len(self.info_lines):
+                self.info_lines[i] = (text, surface, rect)
+            else:
+                self.info_lines.append((text, surface, rect))
+            changed.append(rect)
+        if not changed:
+            return None
+        return changed[0].unionall(changed[1:])
+
+    # el marcador va encima de las celdas: si algo cambió debajo de él se
+    # repinta el panel completo (fondo, celdas y texto)
+    def draw_info(self, area: pygame.Rect) -> None:
+        self.screen.blit(self.background, area, area)
+        first_x, first_y = area.left // self.grid_size, area.top // self.grid_size
+        last_x = min(self.width - 1, (area.right - 1) // self.grid_size)
+        last_y = min(self.height - 1, (area.bottom - 1) // self.grid_size)
+        for y in range(first_y, last_y + 1):
+            for x in range(first_x, last_x + 1):
+                color = self.drawn_cells.get((x, y))
+                if color is not None:
+                    pygame.draw.rect(self.screen, color, self.cell_rect(x, y))
+        for _, surface, rect in self.info_lines:
+            self.screen.blit(surface, rect)
+
+    def render(self) -> None:
+        changed = self.update_info()
+        dirty = self.draw_cells()
+        panel = self.info_lines[0][2].unionall([rect for _, _, rect in self.info_lines])
+        if changed is not None or panel.collidelist(dirty) != -1:
+            area = panel if changed is None else panel.union(changed)
+            # se alinea a la cuadrícula para repintar celdas completas
+            left = area.left // self.grid_size * self.grid_size
+            top = area.top // self.grid_size * self.grid_size
+            right = -(-area.right // self.grid_size) * self.grid_size
+            bottom = -(-area.bottom // self.grid_size) * self.grid_size
+            area = pygame.Rect(left, top, right - left, bottom - top)
+            self.draw_info(area)
+            dirty.append(area)
+        if dirty:
+            pygame.display.update(dirty)
+
+    # revisa la ventana y el teclado; regresa False si se cerró
+    # teclas: espacio pausa, + y - duplican o reducen a la mitad la velocidad,
+    # 0 corre la simulación sin límite
+    def handle_events(self) -> bool:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == pygame.K_SPACE:
+                self.paused = not self.paused
+            elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                self.ticks = self.ticks * 2 if self.ticks else None
+            elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                self.ticks = max(1, (self.ticks or 1024) // 2)
+            elif event.key in (pygame.K_0, pygame.K_KP0):
+                self.ticks = None
+        return True
+
+    # dibuja un cuadro midiendo el tiempo si las métricas están activas
+    def draw_frame(self) -> None:
+        metrics = self.simulation.metrics
+        if metrics.enabled:
+            started = perf_counter()
+            self.render()
+            metrics.add_time("render", perf_counter() - started)
         else:
-            robot.decide_movement()
-
-    # comprueba si el juego ha terminado
-    def check_game_over(self) -> bool:
-        return self.start_area.materials >= 25
+            self.render()
+
+    # se acabó el presupuesto de ticks
+    def finished(self) -> bool:
+        return self.max_ticks is not None and self.simulation.tick >= self.max_ticks
+
+    # avanza la simulación hasta `deadline`: a la velocidad pedida o, sin
+    # límite, tantos ticks como quepan antes del siguiente cuadro
+    # regresa cuándo toca el siguiente tick
+    def advance(self, next_tick: float, deadline: float) -> float:
+        if self.paused or self.finished():
+            return deadline
+        if self.ticks is None:
+            while perf_counter() < deadline and not self.finished():
+                self.simulation.step()
+            return deadline
+        interval: float = 1 / self.ticks
+        now: float = perf_counter()
+        # si la simulación se atrasa más de un cuadro se descarta el atraso en
+        # vez de intentar recuperarlo (la ventana seguiría congelada)
+        if now - next_tick > 1 / self.fps:
+            next_tick = now
+        while next_tick <= now and perf_counter() < deadline and not self.finished():
+            self.simulation.step()
+            next_tick += interval
+        return next_tick
 
     # ejecuta el juego
+    # la simulación y el dibujo van a ritmos distintos (paso fijo): entre dos
+    # cuadros se corren los ticks que correspondan y solo se dibuja el último
+    # estado, así la simulación puede ir mucho más rápido que la pantalla
     def run(self) -> None:
-        running: bool = True
-        while running:
-
-            # comprueba si no salen del juego
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-            # se dibujan todos los componentes del juego
-            self.screen.fill((0, 0, 0))
-            self.start_area.draw(self.screen, self.grid_size)
-            self.draw_grid()
-            self.draw_resources()
-            self.draw_obstacles()
-            self.draw_info()
-
-            # actualización de los componentes del juego
-
-            # actualización de los recursos
-            for resource in self.resources:
-                resource.update()
-                if resource.materials == 0:
-                    self.resources.remove(resource)
-
-            # actualización de los robots
-            for color, robot in enumerate(self.robots):
-                if color < len(self.robot_colors):
-                    self.draw_robot(robot, self.robot_colors[color])
-                else:
-                    self.draw_robot(robot, (0, 255, 0))
-
-                if self.check_game_over():
-                    robot.move_towards(robot.start_cell)
-                else:
-                    self.move_robot(robot)
-
-            pygame.display.flip()
-            self.clock.tick(self.ticks)
-
+        self.screen.blit(self.background, (0, 0))
+        self.render()
+        pygame.display.flip()
+
+        frame_interval: float = 1 / self.fps
+        next_frame: float = perf_counter() + frame_interval
+        next_tick: float = perf_counter()
+        while self.handle_events():
+            next_tick = self.advance(next_tick, next_frame)
+
+            now: float = perf_counter()
+            if now >= next_frame:
+                self.draw_frame()
+                # si un cuadro tardó de más se saltan los que ya pasaron
+                next_frame += frame_interval
+                if next_frame < now:
+                    next_frame = now + frame_interval
+                continue
+            pygame.time.wait(max(0, int(1000 * (min(next_frame, next_tick) - now))))
+
+        self.simulation.close()
         pygame.quit()
-        sys.exit()
@@ -0,0 +1,102 @@
+# importes globales
+import json
+
+# importes locales
+from typing import Dict, List, Optional
+
+
+# contadores y tiempos por fase del tick
+# cuando está desactivado el único costo en el camino caliente es revisar
+# `metrics.enabled` antes de contar
+class Metrics:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled: bool = enabled
+        self.ticks: int = 0
+        self.counters: Dict[str, int] = {}
+        # segundos acumulados y del último tick por fase
+        self.phase_totals: Dict[str, float] = {}
+        self.last_phases: Dict[str, float] = {}
+        self.last_counters: Dict[str, int] = {}
+        # contadores al empezar el tick en curso
+        self._counters_before: Dict[str, int] = {}
+        # el tick más lento visto, con sus fases y contadores
+        self.worst_tick: Optional[Dict[str, object]] = None
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        self.phase_totals[phase] = self.phase_totals.get(phase, 0.0) + seconds
+        self.last_phases[phase] = seconds
+
+    def begin_tick(self) -> None:
+        self._counters_before = dict(self.counters)
+
+    # cierra el tick: guarda lo que cambió en los contadores y si fue el más lento
+    def end_tick(self, tick: int, seconds: float) -> None:
+        self.ticks += 1
+        self.add_time("tick", seconds)
+        before = self._counters_before
+        self.last_counters = {
+            name: value - before.get(name, 0)
+            for name, value in self.counters.items()
+            if value != before.get(name, 0)
+        }
+        if self.worst_tick is None or seconds > self.worst_tick["seconds"]:
+            self.worst_tick = {
+                "tick": tick,
+                "seconds": seconds,
+                "phases": dict(self.last_phases),
+                "counters": dict(self.last_counters),
+            }
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "ticks": self.ticks,
+            "counters": dict(self.counters),
+            "phase_seconds": dict(self.phase_totals),
+            "last_phase_seconds": dict(self.last_phases),
+            "last_counters": dict(self.last_counters),
+            "worst_tick": self.worst_tick,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    # formato de texto de Prometheus
+    def to_prometheus(self, prefix: str = "simulation") -> str:
+        lines: List[str] = [
+            f"# TYPE {prefix}_ticks_total counter",
+            f"{prefix}_ticks_total {self.ticks}",
+            f"# TYPE {prefix}_events_total counter",
+        ]
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'{prefix}_events_total{{name="{name}"}} {value}')
+        lines.append(f"# TYPE {prefix}_phase_seconds_total counter")
+        for phase, seconds in sorted(self.phase_totals.items()):
+            lines.append(f'{prefix}_phase_seconds_total{{phase="{phase}"}} {seconds:.9f}')
+        lines.append(f"# TYPE {prefix}_last_phase_seconds gauge")
+        for phase, seconds in sorted(self.last_phases.items()):
+            lines.append(f'{prefix}_last_phase_seconds{{phase="{phase}"}} {seconds:.9f}')
+        return "\n".join(lines) + "\n"
+
+    # guarda en Prometheus si la extensión es .prom o .txt, si no en JSON
+    def dump(self, path: str) -> None:
+        text = (
+            self.to_prometheus()
+            if path.endswith((".prom", ".txt"))
+            else self.to_json()
+        )
+        with open(path, "w") as file:
+            file.write(text)
+
+    # líneas cortas para mostrar encima de la simulación
+    def overlay_lines(self) -> List[str]:
+        phases = " | ".join(
+            f"{phase} {seconds * 1000:.2f} ms"
+            for phase, seconds in self.last_phases.items()
+        )
+        counters = " | ".join(
+            f"{name} {value}" for name, value in sorted(self.last_counters.items())
+        )
+        return [line for line in (phases, counters) if line]
@@ -0,0 +1,86 @@
+# importes locales
+from array import array
+from typing import Callable, Dict, List
+
+# tipos de ocupación de una celda (se combinan como banderas)
+EMPTY: int = 0
+OBSTACLE: int = 1
+RESOURCE: int = 2
+START_AREA: int = 4
+ROBOT: int = 8
+
+# las celdas con estas banderas no se pueden pisar
+BLOCKING: int = OBSTACLE | RESOURCE
+
+
+class OccupancyGrid:
+    def __init__(self, width: int, height: int) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.cells: bytearray = bytearray(width * height)
+
+        # varios recursos o robots pueden compartir celda, por eso se cuentan
+        self.counts: Dict[int, array] = {
+            OBSTACLE: array("H", bytes(2 * width * height)),
+            RESOURCE: array("H", bytes(2 * width * height)),
+            ROBOT: array("H", bytes(2 * width * height)),
+        }
+
+        # aumenta cada vez que cambia una celda bloqueante
+        self.version: int = 0
+        # funciones (x, y, bloqueada) que se llaman cuando una celda cambia
+        # entre libre y bloqueada
+        self.listeners: List[Callable[[int, int, bool], None]] = []
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[y * self.width + x]
+
+    # marca la celda con el tipo de ocupación indicado
+    def add(self, x: int, y: int, kind: int) -> None:
+        if not self.in_bounds(x, y):
+            return
+        i: int = y * self.width + x
+        counts = self.counts.get(kind)
+        if counts is not None:
+            counts[i] += 1
+        newly_blocked: bool = bool(kind & BLOCKING and not self.cells[i] & BLOCKING)
+        self.cells[i] |= kind
+        if newly_blocked:
+            self._blocked_changed(x, y, True)
+
+    # quita el tipo de ocupación de la celda cuando ya no queda ninguno
+    def remove(self, x: int, y: int, kind: int) -> None:
+        if not self.in_bounds(x, y):
+            return
+        i: int = y * self.width + x
+        counts = self.counts.get(kind)
+        if counts is not None:
+            if counts[i] == 0:
+                return
+            counts[i] -= 1
+            if counts[i] > 0:
+                return
+        self.cells[i] &= ~kind
+        if kind & BLOCKING and not self.cells[i] & BLOCKING:
+            self._blocked_changed(x, y, False)
+
+    def _blocked_changed(self, x: int, y: int, blocked: bool) -> None:
+        self.version += 1
+        for listener in self.listeners:
+            listener(x, y, blocked)
+
+    def move(self, old_x: int, old_y: int, x: int, y: int, kind: int) -> None:
+        self.remove(old_x, old_y, kind)
+        self.add(x, y, kind)
+
+    # consulta en O(1) si la celda está fuera del tablero o bloqueada
+    def is_blocked(self, x: int, y: int) -> bool:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return True
+        return bool(self.cells[y * self.width + x] & BLOCKING)
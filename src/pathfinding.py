@@ -0,0 +1,93 @@
+# importes locales
+from heapq import heappop, heappush
+from typing import Dict, List, Optional, Set, Tuple
+
+# importes internos
+from instrumentation import Metrics
+from occupancy import OccupancyGrid, BLOCKING
+
+# orden fijo de vecinos para que los caminos sean deterministas
+NEIGHBORS: Tuple[Tuple[int, int], ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+# A* sobre la rejilla de ocupación con heurística manhattan
+# la meta puede estar bloqueada (por ejemplo un recurso): se acepta como
+# última celda del camino y es el robot quien decide no pisarla
+# regresa la lista de celdas desde el siguiente paso hasta la meta,
+# una lista vacía si la meta no es alcanzable o None si se agotó el límite
+def find_path(
+    grid: OccupancyGrid,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    max_expansions: Optional[int] = None,
+    metrics: Optional[Metrics] = None,
+) -> Optional[List[Tuple[int, int]]]:
+    if start == goal:
+        return []
+    if not grid.in_bounds(*goal):
+        return []
+    path, expansions = _a_star(grid, start, goal, max_expansions)
+    if metrics is not None and metrics.enabled:
+        metrics.count("path_searches")
+        metrics.count("path_expansions", expansions)
+    return path
+
+
+def _a_star(
+    grid: OccupancyGrid,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    max_expansions: Optional[int],
+) -> Tuple[Optional[List[Tuple[int, int]]], int]:
+    width: int = grid.width
+    height: int = grid.height
+    cells: bytearray = grid.cells
+    start_index: int = start[1] * width + start[0]
+    goal_x, goal_y = goal
+    goal_index: int = goal_y * width + goal_x
+
+    came_from: Dict[int, int] = {start_index: -1}
+    closed: Set[int] = set()
+    cost: Dict[int, int] = {start_index: 0}
+    h: int = abs(start[0] - goal_x) + abs(start[1] - goal_y)
+    # (f, h, orden de llegada, índice) para desempatar de forma estable
+    open_heap: List[Tuple[int, int, int, int]] = [(h, h, 0, start_index)]
+    counter: int = 0
+    expansions: int = 0
+
+    while open_heap:
+        _, _, _, current = heappop(open_heap)
+        if current in closed:
+            continue
+        if current == goal_index:
+            path: List[Tuple[int, int]] = []
+            while current != start_index:
+                path.append((current % width, current // width))
+                current = came_from[current]
+            path.reverse()
+            return path, expansions
+
+        closed.add(current)
+        expansions += 1
+        if max_expansions is not None and expansions > max_expansions:
+            return None, expansions
+
+        x: int = current % width
+        y: int = current // width
+        next_cost: int = cost[current] + 1
+        for dx, dy in NEIGHBORS:
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            neighbor: int = ny * width + nx
+            if neighbor != goal_index and cells[neighbor] & BLOCKING:
+                continue
+            if next_cost >= cost.get(neighbor, next_cost + 1):
+                continue
+            cost[neighbor] = next_cost
+            came_from[neighbor] = current
+            h = abs(nx - goal_x) + abs(ny - goal_y)
+            counter += 1
+            heappush(open_heap, (next_cost + h, h, counter, neighbor))
+
+    return [], expansions
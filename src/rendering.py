@@ -0,0 +1,40 @@
+# dibujo de las entidades con pygame
+#
+# las entidades de la simulación no dependen de pygame; este módulo solo se
+# importa cuando hay ventana (desde game.py)
+
+# importes globales
+import pygame
+
+# importes locales
+from typing import Tuple
+
+# importes internos
+from obstacles import Obstacles
+from resources import Resources
+from start_area import StartArea
+
+Color = Tuple[int, int, int]
+
+OBSTACLE_COLOR: Color = (255, 0, 0)
+RESOURCE_COLOR: Color = (0, 0, 255)
+START_AREA_COLOR: Color = (128, 0, 128)
+
+
+def draw_cell(screen: pygame.Surface, x: int, y: int, grid_size: int, color: Color) -> None:
+    rect = pygame.Rect(x * grid_size, y * grid_size, grid_size, grid_size)
+    pygame.draw.rect(screen, color, rect)
+
+
+def draw_obstacle(screen: pygame.Surface, obstacle: Obstacles, grid_size: int) -> None:
+    draw_cell(screen, obstacle.x, obstacle.y, grid_size, OBSTACLE_COLOR)
+
+
+def draw_resource(screen: pygame.Surface, resource: Resources, grid_size: int) -> None:
+    draw_cell(screen, resource.x, resource.y, grid_size, RESOURCE_COLOR)
+
+
+def draw_start_area(screen: pygame.Surface, start_area: StartArea, grid_size: int) -> None:
+    for x in range(start_area.start_x, start_area.start_x + start_area.area_width):
+        for y in range(start_area.start_y, start_area.start_y + start_area.area_height):
+            draw_cell(screen, x, y, grid_size, START_AREA_COLOR)
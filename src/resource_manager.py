@@ -0,0 +1,133 @@
+# importes locales
+from collections import deque
+from random import Random
+from typing import Callable, Deque, List, Optional, Tuple
+
+# importes internos
+from occupancy import OccupancyGrid, BLOCKING, ROBOT, START_AREA
+from resources import Resources
+
+# una celda ocupada por algo de esto no sirve para que aparezca un recurso
+SPAWN_BLOCKING: int = BLOCKING | ROBOT | START_AREA
+
+
+# ciclo de vida de los recursos
+#
+# - cada recurso tiene un id fijo que es su posición en `by_id`
+# - los vivos están en `resources`; agotar uno es quitarlo intercambiándolo
+#   con el último (O(1), el orden de la lista no se conserva)
+# - los agotados esperan en `pool` y, si hay retardo de reaparición, se
+#   reutilizan con `generate()` en vez de crear objetos nuevos
+# - cada alta o baja se avisa a los `listeners` (resource, vivo) para que los
+#   índices espaciales y de ocupación se mantengan al día
+class ResourceManager:
+    def __init__(
+        self,
+        grid: OccupancyGrid,
+        rng: Random,
+        respawn_delay: Optional[int] = None,
+        spawn_attempts: int = 8,
+    ) -> None:
+        self.grid: OccupancyGrid = grid
+        self.rng: Random = rng
+        # ticks que tarda en reaparecer un recurso agotado (None: no reaparece)
+        self.respawn_delay: Optional[int] = respawn_delay
+        # celdas al azar que se prueban por reaparición antes de dejarla para
+        # el siguiente tick
+        self.spawn_attempts: int = spawn_attempts
+
+        self.resources: List[Resources] = []
+        self.by_id: List[Resources] = []
+        # posición de cada id dentro de `resources` (-1 si no está vivo)
+        self.slots: List[int] = []
+        # recursos que llegaron a cero durante el tick, se retiran en `update`
+        self.depleted: List[Resources] = []
+        # (tick en el que reaparece, recurso) en orden de llegada
+        self.pool: Deque[Tuple[int, Resources]] = deque()
+        self.listeners: List[Callable[[Resources, bool], None]] = []
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def get(self, resource_id: int) -> Resources:
+        return self.by_id[resource_id]
+
+    def is_alive(self, resource: Resources) -> bool:
+        return self.slots[resource.id] >= 0
+
+    # crea un recurso nuevo con el siguiente id y lo agrega a los vivos
+    def create(self, x: int, y: int) -> Resources:
+        resource = Resources(x, y, self.rng, len(self.by_id))
+        self.by_id.append(resource)
+        self.slots.append(-1)
+        self.add(resource)
+        return resource
+
+    def add(self, resource: Resources) -> None:
+        if self.slots[resource.id] >= 0:
+            return
+        self.slots[resource.id] = len(self.resources)
+        self.resources.append(resource)
+        self._notify(resource, True)
+
+    # se avisa antes de quitarlo para que los índices vean su posición actual
+    def remove(self, resource: Resources) -> None:
+        slot: int = self.slots[resource.id]
+        if slot < 0:
+            return
+        self._notify(resource, False)
+        last = self.resources.pop()
+        if last is not resource:
+            self.resources[slot] = last
+            self.slots[last.id] = slot
+        self.slots[resource.id] = -1
+
+    # lo llama el robot cuando deja un recurso sin materiales
+    def mark_depleted(self, resource: Resources) -> None:
+        self.depleted.append(resource)
+
+    # saca un recurso de los vivos y lo deja esperando a reaparecer
+    def retire(self, resource: Resources, tick: int) -> None:
+        if self.slots[resource.id] < 0:
+            return
+        self.remove(resource)
+        if self.respawn_delay is not None:
+            self.pool.append((tick + self.respawn_delay, resource))
+
+    # coloca un recurso en una celda con los materiales dados (si seguía vivo
+    # primero se libera su celda anterior)
+    def place(self, resource: Resources, x: int, y: int, materials: int) -> None:
+        self.remove(resource)
+        resource.x, resource.y, resource.materials = x, y, materials
+        self.add(resource)
+
+    # vuelve a generar un recurso en una celda libre; si no encuentra una en
+    # `spawn_attempts` intentos regresa False y se intenta en otro tick
+    def respawn(self, resource: Resources) -> bool:
+        grid = self.grid
+        for _ in range(self.spawn_attempts):
+            resource.generate(grid.width, grid.height, self.rng)
+            if not grid.get(resource.x, resource.y) & SPAWN_BLOCKING:
+                self.add(resource)
+                return True
+        return False
+
+    # retira los recursos agotados en el tick anterior y hace reaparecer los
+    # que ya cumplieron su espera
+    def update(self, tick: int) -> None:
+        if self.depleted:
+            for resource in self.depleted:
+                if resource.materials == 0:
+                    self.retire(resource, tick)
+            self.depleted.clear()
+
+        pool = self.pool
+        while pool and pool[0][0] <= tick:
+            resource = pool[0][1]
+            if self.slots[resource.id] < 0 and not self.respawn(resource):
+                break
+            pool.popleft()
+
+    def _notify(self, resource: Resources, alive: bool) -> None:
+        for listener in self.listeners:
+            listener(resource, alive)
@@ -1,28 +1,20 @@
-# importes globales
-import pygame
-
 # importes locales
-from random import randint
+from random import Random
 
 # importes internos
 from obstacles import Obstacles
 
 
 class Resources(Obstacles):
-    def __init__(self, x: int, y: int, grid_width: int, grid_height: int) -> None:
-        super().__init__(x, y, grid_width, grid_height)
-        self.materials: int = randint(1, 6)
-
-    def generate(self) -> None:
-        self.x = randint(0, self.grid_width - 1)
-        self.y = randint(0, self.grid_height - 1)
-        self.materials = randint(1, 6)
+    __slots__ = ("id", "materials")
 
-    def update(self) -> None:
-        if self.materials == 0:
-            self.x = -1
-            self.y = -1
+    def __init__(self, x: int, y: int, rng: Random, resource_id: int = 0) -> None:
+        super().__init__(x, y)
+        self.id: int = resource_id
+        self.materials: int = rng.randint(1, 6)
 
-    def draw(self, screen: pygame.Surface, grid_size: int) -> None:
-        rect = pygame.Rect(self.x * grid_size, self.y * grid_size, grid_size, grid_size)
-        pygame.draw.rect(screen, (0, 0, 255), rect)
+    # se usa para reutilizar el objeto cuando el recurso reaparece
+    def generate(self, grid_width: int, grid_height: int, rng: Random) -> None:
+        self.x = rng.randint(0, grid_width - 1)
+        self.y = rng.randint(0, grid_height - 1)
+        self.materials = rng.randint(1, 6)
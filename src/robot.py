@@ -1,40 +1,96 @@
-# importes globales
-import random
-
 # importes locales
 from typing import Union, List, Tuple, Optional
 
 # importes internos
 from cell import Cell
+from event_log import MOVE, GRAB, DROP
+from occupancy import ROBOT
+from pathfinding import find_path
 from resources import Resources
-from obstacles import Obstacles
+
+# cantidad de movimientos recientes que recuerda cada robot
+MOVEMENT_HISTORY: int = 64
+
+# movimientos posibles y peso de cada vecino al moverse al azar
+# (antes una celda explorada se rechazaba una de cada tres veces, 2/3 del peso)
+MOVES: Tuple[Tuple[int, int], ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+UNEXPLORED_WEIGHT: int = 3
+EXPLORED_WEIGHT: int = 2
 
 
 class Robot:
-    def __init__(self, game, x: int, y: int):
+    __slots__ = (
+        "game",
+        "id",
+        "view_distance",
+        "grab_distance",
+        "capacity",
+        "materials",
+        "movements",
+        "movement_head",
+        "is_grabbing",
+        "closest_resource",
+        "last_resource",
+        "x",
+        "y",
+        "start_cell",
+        "current_path",
+        "path_goal",
+        "path_version",
+        "distance_walked",
+    )
+
+    def __init__(
+        self,
+        game,
+        x: int,
+        y: int,
+        robot_id: int = 0,
+        view_distance: int = 5,
+        capacity: int = 1,
+        grab_distance: int = 1,
+    ):
         self.game = game
-        self.view_distance: int = 5
-        self.grab_distance: int = 1
+        self.id: int = robot_id
+        self.view_distance: int = view_distance
+        self.grab_distance: int = grab_distance
+        # materiales que puede cargar en un solo viaje
+        self.capacity: int = capacity
         self.materials: int = 0
+        # solo se guardan los últimos movimientos en un búfer circular: la
+        # lista crece hasta MOVEMENT_HISTORY y después se sobreescribe desde
+        # `movement_head`, la posición del movimiento más antiguo
         self.movements: List[Tuple[int, int]] = []
+        self.movement_head: int = 0
         self.is_grabbing: bool = False
         self.closest_resource: Optional[Resources] = None
         self.last_resource: Optional[Resources] = None
         self.x: int = x
         self.y: int = y
-        self.explored_area = set()
         self.start_cell: Cell = Cell(self.x, self.y)
+        # camino en orden inverso (el siguiente paso es el último elemento)
         self.current_path: Optional[List[Tuple[int, int]]] = None
+        self.path_goal: Optional[Tuple[int, int]] = None
+        self.path_version: int = -1
+        self.distance_walked: int = 0
 
     # decide si moverse hacia un recurso o de forma aleatoria
     def decide_movement(self) -> None:
         # Buscar activamente el recurso más cercano dentro del campo de visión
         self.closest_resource = self.find_closest_resource()
+        coordinator = self.game.coordinator
+        if coordinator is not None and self.closest_resource is not None:
+            coordinator.report(self.closest_resource)
 
         if self.last_resource is not None and self.last_resource.materials != 0:
             self.move_towards(self.last_resource)
             return
-        elif self.closest_resource is not None and self.closest_resource.materials != 0:
+        elif (
+            self.closest_resource is not None
+            and self.closest_resource.materials != 0
+            and (coordinator is None or coordinator.is_free(self.closest_resource))
+        ):
+            # con coordinador no se persigue un recurso que ya reservaron otros
             self.move_towards(self.closest_resource)
             return
         else:
@@ -42,101 +98,184 @@ class Robot:
 
     # busca un recurso que se encuentre dentro del campo de vision del robot
     def find_closest_resource(self) -> Optional[Resources]:
-        closest_resource = None
-        closest_distance = float("inf")
+        # con línea de visión los obstáculos tapan lo que hay detrás
+        if self.game.sensor is not None:
+            return self.game.sensor.closest_resource(self, self.game.tick)
+        # solo se revisan las cubetas del índice espacial cercanas al robot
+        return self.game.resource_index.nearest(self.x, self.y, self.view_distance)
 
-        for resource in self.game.resources:
-            distance = self.distance_to(resource)
-            if distance <= self.view_distance and distance < closest_distance:
-                closest_resource = resource
-                closest_distance = distance
-
-        return closest_resource
-
-    # revisa si ya se exploro el movimiento
+    # revisa si ya se exploro la celda (el mapa de exploración es de todo el equipo)
+    # con línea de visión también cuenta lo que algún robot ya vio de lejos
     def already_explored(self, x: int, y: int) -> bool:
-        return (x, y) in self.explored_area
+        exploration = self.game.exploration
+        if exploration.is_explored(x, y):
+            return True
+        return self.game.sensor is not None and exploration.is_seen(x, y)
 
-    # agrega los movimientos al area explorada y la comparte con todos los robots
-    def update_explored_area(self) -> None:
-        for move in self.movements:
-                self.explored_area.add(move)
-        for robot in self.game.robots:
-            if robot is not self:
-                robot.explored_area.union(self.explored_area)
-
-    # genera un movimiento aleatorio dentro de los posibles movimientos
+    # elige un vecino al azar en una sola pasada: se descartan las celdas
+    # bloqueadas o fuera del tablero y las ya exploradas pesan menos
+    # si no hay ningún vecino libre el robot se queda en su lugar
     def move_randomly(self) -> None:
-        direction = random.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
-        new_x, new_y = self.x + direction[0], self.y + direction[1]
-        while not self.is_valid_move(new_x, new_y):
-            direction = random.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
-            new_x, new_y = self.x + direction[0], self.y + direction[1]
-        else:
-            self._move(new_x, new_y)
-            self._check_resource_interaction()  # Verificar interacción con recursos después de moverse
+        candidates: List[Tuple[int, int]] = []
+        weights: List[int] = []
+        total: int = 0
+        for dx, dy in MOVES:
+            new_x, new_y = self.x + dx, self.y + dy
+            if not self.is_valid_move(new_x, new_y):
+                continue
+            weight = (
+                EXPLORED_WEIGHT
+                if self.already_explored(new_x, new_y)
+                else UNEXPLORED_WEIGHT
+            )
+            candidates.append((new_x, new_y))
+            total += weight
+            weights.append(total)
 
-    # usa un ligero pathfinder para acercarse a un recurso o a la zona inicial
+        if not candidates:
+            metrics = self.game.metrics
+            if metrics.enabled:
+                metrics.count("stay_put")
+            self._check_resource_interaction()
+            if not self.is_grabbing:
+                # encerrado: duerme hasta que se libere alguna celda
+                self.game.scheduler.sleep(self.id)
+            return
+
+        choice: int = self.game.rng.randrange(total)
+        for (new_x, new_y), cumulative in zip(candidates, weights):
+            if choice < cumulative:
+                break
+        self._move(new_x, new_y)
+        self._check_resource_interaction()  # Verificar interacción con recursos después de moverse
+
+    # sigue un camino calculado con A* hacia un recurso o a la zona inicial
+    # el camino se reutiliza entre ticks y solo se recalcula si cambia el objetivo
+    # o si una celda bloqueada nueva lo invalida
     def move_towards(self, target: Union[Cell, Resources]) -> None:
-        target_x, target_y = target.x, target.y
-        if self.distance_to(target) > 0:
-            direction = random.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
-            new_x, new_y = self.x + direction[0], self.y + direction[1]
-            closer_to_target: bool = False
-            while not closer_to_target:
-                direction = random.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
-                new_x, new_y = self.x + direction[0], self.y + direction[1]
-                closer_to_target = abs(new_x - target_x) + abs(
-                    new_y - target_y
-                ) <= self.distance_to(target)
-                if self.is_valid_move(new_x, new_y) and closer_to_target:
-                    break
-            if self.is_valid_move(new_x, new_y):
-                self._move(new_x, new_y)
-            else:
-                direction = random.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
-                new_x, new_y = self.x + direction[0], self.y + direction[1]
-                self._move(new_x, new_y)
+        if self.distance_to(target) == 0:
+            return
+        goal: Tuple[int, int] = (target.x, target.y)
+        found: bool = self.has_valid_path(goal) or self.plan_path(goal)
+        if not found or not self.current_path:
+            # la búsqueda se agotó o el objetivo está encerrado por obstáculos:
+            # se olvida el recurso (también el compartido) y se explora
+            self._check_resource_interaction()
+            if self.is_grabbing:
+                return
+            if self.last_resource is target:
+                self.last_resource = None
+            if self.closest_resource is target:
+                self.closest_resource = None
+            self.move_randomly()
+            return
 
-    # verifica si el movimiento es valido basado en los recursos y obstáculos
-    # también revisa si el movimiento ya fue hecho anteriormente
-    def is_valid_move(self, x: int, y: int) -> bool:
-        # other_robots: List[Robot] = self.game.robots
-        resources: List[Resources] = self.game.resources
-        obstacles: List[Obstacles] = self.game.obstacles
+        new_x, new_y = self.current_path[-1]
+        if (new_x, new_y) == goal and self.game.grid.is_blocked(new_x, new_y):
+            # el objetivo es un recurso, basta con quedarse a su lado
+            self._check_resource_interaction()
+            return
 
-        if not (0 <= x < self.game.width and 0 <= y < self.game.height):
-            return False  # Movimiento fuera de los límites del tablero
+        self.current_path.pop()
+        self._move(new_x, new_y)
 
-        # Verificar colisión con otros robots
-        # collides_with_robots = any(robot.x == x and robot.y == y for robot in other_robots)
+    # baja por el campo de distancias compartido hacia la zona inicial
+    def return_home(self) -> None:
+        if self.is_grabbing and self.at_home():
+            self._check_resource_interaction()
+            return
+        home_field = self.game.home_field
+        step = home_field.next_step(self.x, self.y)
+        if step is not None:
+            self._move(*step)
+        elif self.is_grabbing or home_field.distance(self.x, self.y) != 0:
+            # la zona inicial no es alcanzable por ahora
+            self.game.scheduler.sleep(self.id)
+        else:
+            # ya está dentro de la zona inicial y no carga nada: terminó
+            self.game.scheduler.sleep(self.id, waiting=False)
 
-        # Verificar colisión con recursos
-        collides_with_resources = any(
-            resource.x == x and resource.y == y for resource in resources
-        )
+    # revisa si el robot está lo bastante cerca de la zona inicial para dejar materiales
+    def at_home(self) -> bool:
+        return self.game.home_field.distance(self.x, self.y) <= self.grab_distance
 
-        # Verificar colisión con obstáculos
-        collides_with_obstacles = any(
-            obstacle.x == x and obstacle.y == y for obstacle in obstacles
+    # calcula un camino nuevo y lo guarda en current_path
+    # A* solo expande tantas celdas como tiene el rectángulo entre el robot y
+    # la meta con un margen de `view_distance` por lado, así una meta
+    # inalcanzable no recorre todo el mapa; regresa False si se agotó
+    def plan_path(self, goal: Tuple[int, int]) -> bool:
+        margin: int = 2 * self.view_distance + 1
+        limit: int = (abs(goal[0] - self.x) + margin) * (abs(goal[1] - self.y) + margin)
+        path = find_path(
+            self.game.grid,
+            (self.x, self.y),
+            goal,
+            max_expansions=limit,
+            metrics=self.game.metrics,
         )
+        if path is None:
+            self.current_path = None
+            self.path_goal = None
+            return False
+        self.current_path = path[::-1]
+        self.path_goal = goal
+        self.path_version = self.game.grid.version
+        return True
 
-        if self.already_explored(x, y):
-            if random.randint(1, 3) == 1:
+    # revisa si el camino guardado todavía sirve para llegar a la meta
+    def has_valid_path(self, goal: Tuple[int, int]) -> bool:
+        if self.current_path is None or self.path_goal != goal:
+            return False
+        grid = self.game.grid
+        if self.path_version == grid.version:
+            if not self.current_path:
+                return True
+            next_x, next_y = self.current_path[-1]
+            return abs(next_x - self.x) + abs(next_y - self.y) == 1
+        if not self.current_path:
+            # la meta no era alcanzable, pero el tablero cambió
+            return False
+        next_x, next_y = self.current_path[-1]
+        if abs(next_x - self.x) + abs(next_y - self.y) != 1:
+            return False
+        # solo se invalida si alguna celda del camino (excepto la meta) se bloqueó
+        for x, y in self.current_path[1:]:
+            if grid.is_blocked(x, y):
                 return False
+        self.path_version = grid.version
+        return True
 
-        # Si no hay colisiones y la posición no ha sido explorada, el movimiento es válido
-        return (
-            not collides_with_obstacles
-            and not collides_with_resources
-        )
+    # verifica si el movimiento es valido basado en los recursos y obstáculos
+    def is_valid_move(self, x: int, y: int) -> bool:
+        metrics = self.game.metrics
+        if metrics.enabled:
+            metrics.count("is_valid_move")
+        # Verificar límites del tablero y colisión con recursos u obstáculos en O(1)
+        # (los robots no bloquean la celda)
+        return not self.game.grid.is_blocked(x, y)
 
     # mueve al robot y agrega el movimiento a la lista de movimientos hechos
     def _move(self, x: int, y: int) -> None:
+        self.place(x, y)
+        self._check_resource_interaction()
+
+    # últimos movimientos del más antiguo al más reciente
+    def recent_movements(self) -> List[Tuple[int, int]]:
+        return self.movements[self.movement_head :] + self.movements[: self.movement_head]
 
-        self.movements.append((x, y))
+    # cambia la posición del robot sin revisar interacciones (también lo usa la
+    # reproducción de un registro de eventos)
+    def place(self, x: int, y: int) -> None:
+        if len(self.movements) < MOVEMENT_HISTORY:
+            self.movements.append((x, y))
+        else:
+            self.movements[self.movement_head] = (x, y)
+            self.movement_head = (self.movement_head + 1) % MOVEMENT_HISTORY
+        self.game.exploration.visit(x, y)
+        self.game.grid.move(self.x, self.y, x, y, ROBOT)
         self.x, self.y = x, y
-        self._check_resource_interaction()
+        self.distance_walked += 1
+        self.game.record(MOVE, self.id, x, y, 0)
 
     # revisa si puede recoger los materiales de un recurso
     def _check_resource_interaction(self) -> None:
@@ -146,15 +285,18 @@ class Robot:
         ):
             # Verificar si el recurso está siendo agarrado por otro robot
             if not self.is_grabbing:
+                materials: int = self.materials
                 self.grab_resource(self.closest_resource)
-                self.game.log("Robot has grabbed a resource")
+                # solo se registra si de verdad recogió algo
+                if self.materials > materials:
+                    self.game.log(
+                        "grab", self.id, self.x, self.y, self.closest_resource.id
+                    )
                 self.closest_resource = None
 
-        elif self.is_grabbing and (
-            self.distance_to(self.start_cell) == self.grab_distance
-        ):
+        elif self.is_grabbing and self.at_home():
             self.drop_resource()
-            self.game.log("Robot has dropped a resource")
+            self.game.log("drop", self.id, self.x, self.y)
     
     # le da la localización del ultimo recurso al resto de robots
     def ask_for_help(self, resource: Resources):
@@ -162,27 +304,41 @@ class Robot:
             for robot in self.game.robots:
                 if robot.last_resource and not robot == self:
                     robot.last_resource = resource
-                    # robot.explored_area.union(self.explored_area)
+                    self.game.scheduler.wake(robot.id)
 
     # calcula la distancia entre el robot y un recurso o el area de inicio
     def distance_to(self, target: Union[Resources, Cell]):
         return abs(self.x - target.x) + abs(self.y - target.y)
 
-    # recoge un material de un recurso
+    # recoge de una sola vez todos los materiales que le caben
     def grab_resource(self, resource: Resources) -> None:
         if self.is_grabbing:
             return
         if self.distance_to(resource) <= self.grab_distance:
-            self.update_explored_area()
-            self.materials += 1
-            resource.materials -= 1
+            amount: int = min(self.capacity - self.materials, resource.materials)
+            if amount <= 0:
+                return
+            self.materials += amount
+            resource.materials -= amount
+            if resource.materials == 0:
+                self.game.resource_manager.mark_depleted(resource)
+                # el recurso ya no cuenta como objetivo para nadie
+                self.game.scheduler.wake_waiting()
             self.is_grabbing = True
+            # un registro por material para que el formato no cambie
+            for _ in range(amount):
+                self.game.record(GRAB, self.id, self.x, self.y, resource.id)
             self.last_resource = resource
-            self.ask_for_help(resource)
+            if self.game.coordinator is not None:
+                # con coordinador el recurso se reparte en la siguiente ronda
+                self.game.coordinator.report(resource)
+            else:
+                self.ask_for_help(resource)
 
-    # deposita el material en el area de inicio
+    # deposita todo lo que carga en el area de inicio
     def drop_resource(self) -> None:
-        if self.is_grabbing and self.distance_to(self.start_cell) == self.grab_distance:
+        if self.is_grabbing and self.at_home():
             self.is_grabbing = False
-            self.game.start_area.increase_materials()
+            self.game.record(DROP, self.id, self.x, self.y, self.materials)
+            self.game.start_area.increase_materials(self.materials)
             self.materials = 0
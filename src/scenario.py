@@ -0,0 +1,183 @@
+# escenarios: parámetros de una corrida en un archivo TOML o JSON
+#
+# este módulo solo usa la biblioteca estándar para que leer y validar un
+# escenario sea barato y ocurra antes de importar pygame o la simulación
+#
+# ejemplo (TOML):
+#
+#   [world]
+#   width = 200
+#   height = 120
+#   robots = 50
+#
+#   [run]
+#   seed = 7
+#   ticks = 20000
+#   headless = true
+#
+#   [output]
+#   summary = "resultado.json"
+
+# importes globales
+import json
+
+# importes locales
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: solo escenarios JSON
+    tomllib = None
+
+
+class Field(NamedTuple):
+    kind: type
+    default: Any
+    # mínimo permitido para los enteros
+    minimum: Optional[int] = None
+    # acepta None (en TOML basta con no escribir el campo)
+    optional: bool = False
+
+
+# la zona inicial mide 5x5 (StartArea): el mapa no puede ser más chico
+MINIMUM_SIZE: int = 5
+
+# secciones y campos permitidos con su tipo y valor por defecto
+SCHEMA: Dict[str, Dict[str, Field]] = {
+    "world": {
+        "width": Field(int, 75, minimum=MINIMUM_SIZE),
+        "height": Field(int, 40, minimum=MINIMUM_SIZE),
+        "robots": Field(int, 4, minimum=0),
+        "resources": Field(int, 20, minimum=0),
+        "obstacles": Field(int, 20, minimum=0),
+        "materials_goal": Field(int, 25, minimum=0),
+        "view_distance": Field(int, 5, minimum=0),
+        # con 0 un robot nunca alcanza un recurso: no puede pisar su celda
+        "grab_distance": Field(int, 1, minimum=1),
+        "carrying_capacity": Field(int, 1, minimum=1),
+        "line_of_sight": Field(bool, False),
+        "exploration_decay": Field(int, None, minimum=1, optional=True),
+        "respawn_delay": Field(int, None, minimum=0, optional=True),
+        "coordination_interval": Field(int, None, minimum=1, optional=True),
+    },
+    "run": {
+        "seed": Field(int, None, minimum=0, optional=True),
+        # máximo de ticks a simular (None: hasta llegar a la meta)
+        "ticks": Field(int, None, minimum=0, optional=True),
+        "headless": Field(bool, False),
+        "verbose": Field(bool, True),
+        "metrics": Field(bool, False),
+    },
+    "render": {
+        "grid_size": Field(int, 20, minimum=1),
+        # ticks por segundo en la ventana (None: tan rápido como se pueda)
+        "tps": Field(int, 20, minimum=1, optional=True),
+        "fps": Field(int, 30, minimum=1),
+    },
+    "output": {
+        "event_log": Field(str, None, optional=True),
+        "checkpoint": Field(str, None, optional=True),
+        "log": Field(str, None, optional=True),
+        "summary": Field(str, None, optional=True),
+        # métricas por fase en JSON (o Prometheus con .prom/.txt); activa run.metrics
+        "metrics": Field(str, None, optional=True),
+    },
+}
+
+# campos de "world" que en Simulation tienen otro nombre
+SIMULATION_NAMES: Dict[str, str] = {
+    "robots": "number_of_robots",
+    "resources": "number_of_resources",
+    "obstacles": "number_of_obstacles",
+}
+
+
+def _check(section: str, name: str, value: Any) -> Any:
+    field = SCHEMA[section][name]
+    if value is None and field.optional:
+        return None
+    # bool es subclase de int: no se acepta true donde va un número
+    if (field.kind is int and isinstance(value, bool)) or not isinstance(
+        value, field.kind
+    ):
+        expected = {int: "an integer", bool: "true or false", str: "a string"}[field.kind]
+        raise ValueError(f"{section}.{name} must be {expected}, got {value!r}")
+    if field.minimum is not None and value < field.minimum:
+        raise ValueError(f"{section}.{name} must be at least {field.minimum}, got {value}")
+    return value
+
+
+class Scenario:
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        self.values: Dict[str, Dict[str, Any]] = {
+            section: {name: field.default for name, field in fields.items()}
+            for section, fields in SCHEMA.items()
+        }
+        for section, fields in (data or {}).items():
+            if section not in SCHEMA:
+                raise ValueError(f"unknown section {section!r}")
+            if not isinstance(fields, dict):
+                raise ValueError(f"section {section!r} must be a table")
+            for name, value in fields.items():
+                self.set(f"{section}.{name}", value)
+
+    # cambia un campo "sección.nombre"; el nombre solo basta si no es ambiguo
+    def set(self, key: str, value: Any) -> None:
+        section, name = self.resolve(key)
+        self.values[section][name] = _check(section, name, value)
+
+    def resolve(self, key: str) -> Tuple[str, str]:
+        if "." in key:
+            section, name = key.split(".", 1)
+            if section in SCHEMA and name in SCHEMA[section]:
+                return section, name
+        else:
+            sections: List[str] = [s for s in SCHEMA if key in SCHEMA[s]]
+            if len(sections) == 1:
+                return sections[0], key
+        raise ValueError(f"unknown scenario field {key!r}")
+
+    def __getitem__(self, section: str) -> Dict[str, Any]:
+        return self.values[section]
+
+    # argumentos para crear la Simulation (sin el registro estructurado)
+    def simulation_parameters(self) -> Dict[str, Any]:
+        world = self.values["world"]
+        run = self.values["run"]
+        parameters: Dict[str, Any] = {
+            SIMULATION_NAMES.get(name, name): value for name, value in world.items()
+        }
+        parameters.update(
+            seed=run["seed"],
+            verbose=run["verbose"],
+            metrics=run["metrics"] or self.values["output"]["metrics"] is not None,
+            event_log=self.values["output"]["event_log"] is not None,
+        )
+        return parameters
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {section: dict(fields) for section, fields in self.values.items()}
+
+
+# lee un escenario; el formato se elige por la extensión (.json o .toml)
+def load(path: str) -> Scenario:
+    if path.endswith(".json"):
+        with open(path) as file:
+            data = json.load(file)
+    else:
+        if tomllib is None:
+            raise ValueError("TOML scenarios need Python 3.11 or newer, use JSON")
+        with open(path, "rb") as file:
+            data = tomllib.load(file)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: a scenario must be a table of sections")
+    return Scenario(data)
+
+
+# convierte el texto de una opción "--set campo=valor": números, true/false,
+# null y cadenas entre comillas se leen como JSON; lo demás queda como texto
+def parse_value(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
@@ -0,0 +1,75 @@
+# importes locales
+from bisect import bisect_left
+from typing import Dict, Iterator, List
+
+
+# decide qué robots actúan en cada tick
+#
+# un robot que no puede hacer nada (encerrado o ya en casa al terminar) se
+# duerme y deja de costar hasta que algo lo despierte; un objetivo inalcanzable
+# no cuenta, el robot lo olvida y sigue explorando.
+# los que esperan un cambio del tablero quedan en `waiting` y se despiertan
+# todos juntos con `wake_waiting`; los que terminaron solo con `wake`.
+#
+# los despiertos se recorren en orden de id, igual que la lista de robots: si
+# uno se despierta a mitad de tick con id mayor al actual actúa en ese mismo
+# tick, así el resultado es el mismo que si nunca se hubiera dormido
+class Scheduler:
+    def __init__(self, size: int) -> None:
+        self.awake: bytearray = bytearray(b"\x01") * size
+        # ids en `order` (incluye a los que se durmieron en el tick actual)
+        self.listed: bytearray = bytearray(b"\x01") * size
+        self.order: List[int] = list(range(size))
+        # posición del recorrido actual (-1 fuera de un tick)
+        self.position: int = -1
+        self.slept: bool = False
+        # conjunto ordenado de los que esperan un cambio del tablero
+        self.waiting: Dict[int, None] = {}
+
+    def __iter__(self) -> Iterator[int]:
+        order = self.order
+        awake = self.awake
+        self.position = 0
+        while self.position < len(order):
+            robot_id = order[self.position]
+            if awake[robot_id]:
+                yield robot_id
+            self.position += 1
+        self.position = -1
+        if self.slept:
+            self.slept = False
+            for robot_id in order:
+                self.listed[robot_id] = awake[robot_id]
+            self.order = [robot_id for robot_id in order if awake[robot_id]]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def is_awake(self, robot_id: int) -> bool:
+        return bool(self.awake[robot_id])
+
+    # duerme al robot; con waiting=True se despierta cuando cambie el tablero
+    def sleep(self, robot_id: int, waiting: bool = True) -> None:
+        self.awake[robot_id] = 0
+        self.slept = True
+        if waiting:
+            self.waiting[robot_id] = None
+
+    def wake(self, robot_id: int) -> None:
+        if self.awake[robot_id]:
+            return
+        self.awake[robot_id] = 1
+        self.waiting.pop(robot_id, None)
+        if self.listed[robot_id]:
+            return
+        self.listed[robot_id] = 1
+        index: int = bisect_left(self.order, robot_id)
+        self.order.insert(index, robot_id)
+        if 0 <= self.position and index <= self.position:
+            self.position += 1
+
+    def wake_waiting(self) -> None:
+        if not self.waiting:
+            return
+        for robot_id in list(self.waiting):
+            self.wake(robot_id)
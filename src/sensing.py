@@ -0,0 +1,181 @@
+# importes globales
+import numpy as np
+
+# importes locales
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# importes internos
+from occupancy import OccupancyGrid, OBSTACLE
+from resources import Resources
+from spatial_index import ResourceIndex
+
+# muestras por celda de distancia al trazar la línea de visión
+SAMPLES_PER_CELL: int = 16
+
+
+# tablas de visión para un radio:
+# - desplazamientos del rombo ordenados por distancia manhattan (el primero
+#   visible con recurso es el más cercano)
+# - para cada desplazamiento, los desplazamientos que lo tapan: las celdas que
+#   cruza el segmento entre los centros (sin contar los extremos). Las filas
+#   se rellenan con len(offsets), que apunta a una columna siempre libre
+@lru_cache(maxsize=None)
+def view_table(radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    offsets: List[Tuple[int, int]] = [
+        (dx, dy)
+        for dy in range(-radius, radius + 1)
+        for dx in range(-radius, radius + 1)
+        if abs(dx) + abs(dy) <= radius
+    ]
+    offsets.sort(key=lambda offset: abs(offset[0]) + abs(offset[1]))
+    position = {offset: i for i, offset in enumerate(offsets)}
+
+    shadows: List[List[int]] = []
+    for dx, dy in offsets:
+        samples: int = SAMPLES_PER_CELL * max(abs(dx), abs(dy), 1)
+        t = (np.arange(samples) + 0.5) / samples
+        x, y = t * dx, t * dy
+        # los puntos que solo rozan el borde entre dos celdas no tapan nada
+        inside = (np.abs(x - np.rint(x)) < 0.499) & (np.abs(y - np.rint(y)) < 0.499)
+        cells = set(zip(np.rint(x[inside]).astype(int), np.rint(y[inside]).astype(int)))
+        cells.discard((0, 0))
+        cells.discard((dx, dy))
+        shadows.append(sorted(position[cell] for cell in cells))
+
+    width: int = max((len(shadow) for shadow in shadows), default=0) or 1
+    occluders = np.full((len(offsets), width), len(offsets), dtype=np.int32)
+    for i, shadow in enumerate(shadows):
+        occluders[i, : len(shadow)] = shadow
+    return np.array(offsets, dtype=np.int32).reshape(-1, 2), occluders
+
+
+# percepción con línea de visión: los obstáculos tapan lo que hay detrás
+#
+# los obstáculos y los recursos vivos se guardan en arreglos con un borde del
+# tamaño del radio, así el rombo de cada robot se lee con un solo `np.take` y
+# se evalúa para todos los robots a la vez
+class Sensor:
+    def __init__(
+        self,
+        grid: OccupancyGrid,
+        radius: int,
+        index: ResourceIndex,
+        by_id: List[Resources],
+        number_of_robots: int,
+        seen: Optional[bytearray] = None,
+    ) -> None:
+        self.width: int = grid.width
+        self.height: int = grid.height
+        self.radius: int = radius
+        self.padding: int = max(radius, 1)
+        self.stride: int = grid.width + 2 * self.padding
+        self.offsets, self.occluders = view_table(radius)
+        self.steps: np.ndarray = self.offsets[:, 1] * self.stride + self.offsets[:, 0]
+
+        shape = (grid.height + 2 * self.padding, self.stride)
+        inner = (
+            slice(self.padding, self.padding + grid.height),
+            slice(self.padding, self.padding + grid.width),
+        )
+        cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height, grid.width)
+        self.padded_blocking: np.ndarray = np.zeros(shape, dtype=bool)
+        self.padded_blocking[inner] = (cells & OBSTACLE) > 0
+        # índice de cada celda en el tablero (-1 fuera de él)
+        self.padded_cell: np.ndarray = np.full(shape, -1, dtype=np.int64)
+        self.padded_cell[inner] = np.arange(grid.width * grid.height).reshape(
+            grid.height, grid.width
+        )
+        self.padded_resource: np.ndarray = np.full(shape, -1, dtype=np.int32)
+        self.index: ResourceIndex = index
+        self.by_id: List[Resources] = by_id
+        # celdas vistas por algún robot (capa del mapa de exploración)
+        self.seen: Optional[np.ndarray] = (
+            None if seen is None else np.frombuffer(seen, dtype=np.uint8)
+        )
+
+        # resultado del último cálculo en lote por robot (indexado por id)
+        self.closest: np.ndarray = np.full(number_of_robots, -1, dtype=np.int32)
+        self.sensed_tick: np.ndarray = np.full(number_of_robots, -1, dtype=np.int64)
+        self.sensed_at: np.ndarray = np.zeros((number_of_robots, 2), dtype=np.int32)
+
+    def _center(self, x, y):
+        return (y + self.padding) * self.stride + (x + self.padding)
+
+    # lo llama el administrador de recursos en cada alta o baja, después de
+    # que el índice espacial se actualizó. Si varios recursos comparten la
+    # celda se ve el primero del índice, así el resultado no depende del orden
+    # de los cambios
+    def resource_changed(self, resource: Resources, alive: bool) -> None:
+        if not (0 <= resource.x < self.width and 0 <= resource.y < self.height):
+            return
+        visible = self.index.at(resource.x, resource.y)
+        self.padded_resource[resource.y + self.padding, resource.x + self.padding] = (
+            -1 if visible is None else visible.id
+        )
+
+    def rebuild(self) -> None:
+        self.padded_resource.fill(-1)
+        for resource in self.index.positions:
+            self.resource_changed(resource, True)
+
+    # celdas visibles para varios robots: (celdas del rombo, máscara visible)
+    def visible(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cells = self._center(x, y)[:, None] + self.steps[None, :]
+        blocking = np.take(self.padded_blocking, cells)
+        blocking = np.concatenate([blocking, np.zeros((len(x), 1), dtype=bool)], axis=1)
+        hidden = blocking[:, self.occluders].any(axis=2)
+        return cells, ~hidden
+
+    # recurso visible más cercano de cada robot (-1 si no ve ninguno) y las
+    # celdas del tablero que vio cada uno
+    def sense(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cells, visible = self.visible(x, y)
+        candidates = np.take(self.padded_resource, cells)
+        candidates[~visible] = -1
+        found = candidates >= 0
+        first = found.argmax(axis=1)
+        closest = candidates[np.arange(len(x)), first]
+        closest[~found.any(axis=1)] = -1
+        seen = np.take(self.padded_cell, cells)[visible]
+        return closest, seen[seen >= 0]
+
+    # calcula en lote lo que ve cada robot al inicio del tick
+    def update(self, robots: list, tick: int) -> None:
+        if not robots:
+            return
+        ids = np.fromiter((robot.id for robot in robots), dtype=np.int64, count=len(robots))
+        x = np.fromiter((robot.x for robot in robots), dtype=np.int32, count=len(robots))
+        y = np.fromiter((robot.y for robot in robots), dtype=np.int32, count=len(robots))
+        closest, cells = self.sense(x, y)
+        self.closest[ids] = closest
+        self.sensed_tick[ids] = tick
+        self.sensed_at[ids, 0] = x
+        self.sensed_at[ids, 1] = y
+        if self.seen is not None:
+            self.seen[cells] = 1
+
+    # recurso visible más cercano con materiales; usa el cálculo en lote si
+    # sigue siendo válido (mismo tick, misma posición y recurso no agotado)
+    def closest_resource(self, robot, tick: int) -> Optional[Resources]:
+        by_id = self.by_id
+        i: int = robot.id
+        if (
+            self.sensed_tick[i] == tick
+            and self.sensed_at[i, 0] == robot.x
+            and self.sensed_at[i, 1] == robot.y
+        ):
+            resource_id = int(self.closest[i])
+            if resource_id < 0:
+                return None
+            if by_id[resource_id].materials > 0:
+                return by_id[resource_id]
+
+        # cálculo individual, saltando los recursos que ya se vaciaron
+        cells, visible = self.visible(
+            np.array([robot.x], dtype=np.int32), np.array([robot.y], dtype=np.int32)
+        )
+        for resource_id in np.take(self.padded_resource, cells)[visible]:
+            if resource_id >= 0 and by_id[resource_id].materials > 0:
+                return by_id[resource_id]
+        return None
@@ -0,0 +1,380 @@
+# mundo vectorizado repartido entre varios procesos
+#
+# el tablero se divide en franjas verticales, una por proceso. El estado vive en
+# arreglos de memoria compartida (multiprocessing.shared_memory), así que cada
+# proceso lee directamente las celdas de sus vecinos: la franja de `view_distance`
+# columnas a cada lado hace de celdas fantasma y no cambia durante la fase en que
+# se lee. Cada tick tiene dos fases separadas por barreras:
+#
+#   1. cada proceso mueve a los robots que están en su franja y anota a qué
+#      recurso quiere llegar cada uno (entregas incluidas)
+#   2. cada proceso resuelve las recolecciones de los recursos de su franja,
+#      así dos procesos nunca escriben el mismo recurso
+#
+# un robot que cruza el borde pasa al proceso vecino en el siguiente tick: el
+# proceso principal anota el dueño de cada robot (`owner`) con las posiciones
+# al inicio del tick, antes de que los procesos empiecen a moverlos.
+# El proceso principal retira los recursos agotados y mantiene el campo de
+# distancias a la zona inicial entre ticks.
+#
+# si un proceso falla rompe la barrera; el principal también la rompe si una
+# fase tarda más de `timeout` segundos. En los dos casos el principal detiene
+# a los procesos, libera la memoria y lanza BrokenBarrierError.
+
+# importes globales
+import numpy as np
+import os
+
+# importes locales
+from multiprocessing import Barrier, Process
+from multiprocessing.shared_memory import SharedMemory
+from threading import BrokenBarrierError
+from typing import Callable, Dict, List, Optional, Tuple
+
+# importes internos
+from vectorized import VectorWorld
+
+# arreglos del mundo que se comparten tal cual entre procesos
+SHARED_FIELDS: Tuple[str, ...] = (
+    "resource_x",
+    "resource_y",
+    "resource_materials",
+    "resource_alive",
+    "padded_resource_at",
+    "robot_x",
+    "robot_y",
+    "robot_materials",
+    "robot_grabbing",
+    "robot_view",
+    "robot_last_resource",
+    "robot_distance",
+)
+
+# posiciones del arreglo de control
+TICK: int = 0
+GAME_OVER: int = 1
+STOP: int = 2
+
+Spec = Dict[str, Tuple[str, Tuple[int, ...], str]]
+
+
+# conjunto de arreglos de NumPy respaldados por bloques de memoria compartida
+class SharedArrays:
+    def __init__(self) -> None:
+        self.blocks: List[SharedMemory] = []
+        self.arrays: Dict[str, np.ndarray] = {}
+        # nombre del bloque, forma y tipo de cada arreglo (para otros procesos)
+        self.spec: Spec = {}
+
+    def create(self, name: str, source: np.ndarray) -> np.ndarray:
+        block = SharedMemory(create=True, size=max(source.nbytes, 1))
+        array: np.ndarray = np.ndarray(source.shape, dtype=source.dtype, buffer=block.buf)
+        array[...] = source
+        self.blocks.append(block)
+        self.arrays[name] = array
+        self.spec[name] = (block.name, source.shape, source.dtype.str)
+        return array
+
+    @classmethod
+    def attach(cls, spec: Spec) -> "SharedArrays":
+        shared = cls()
+        for name, (block_name, shape, dtype) in spec.items():
+            block = SharedMemory(name=block_name)
+            shared.blocks.append(block)
+            shared.arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        shared.spec = dict(spec)
+        return shared
+
+    # antes de cerrar no debe quedar ninguna vista de los bloques
+    def close(self, unlink: bool = False) -> None:
+        self.arrays.clear()
+        for block in self.blocks:
+            block.close()
+            if unlink:
+                block.unlink()
+        self.blocks.clear()
+
+
+# la parte del mundo que simula un proceso: usa las fases de VectorWorld sobre
+# los arreglos compartidos, sin cuadrícula ni campo de distancias propios
+class ShardWorker(VectorWorld):
+    def __init__(
+        self,
+        arrays: Dict[str, np.ndarray],
+        width: int,
+        height: int,
+        padding: int,
+        grab_distance: int,
+        seed: Optional[int],
+        index: int,
+        columns: Tuple[int, int],
+    ) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.padding: int = padding
+        self.grab_distance: int = grab_distance
+        self.index: int = index
+        self.first_column, self.last_column = columns
+        # el primer proceso usa la misma semilla que VectorWorld, así con un
+        # solo proceso el resultado es idéntico
+        self.rng: np.random.Generator = np.random.default_rng(
+            seed if index == 0 or seed is None else (seed, index)
+        )
+        for name in SHARED_FIELDS:
+            setattr(self, name, arrays[name])
+        self.cells: np.ndarray = arrays["cells"]
+        self.home: np.ndarray = arrays["home"]
+        self.requests: np.ndarray = arrays["requests"]
+        self.owner: np.ndarray = arrays["owner"]
+        self.delivered: np.ndarray = arrays["delivered"]
+        self.control: np.ndarray = arrays["control"]
+        self.resource_at: np.ndarray = self.padded_resource_at[
+            padding : padding + height, padding : padding + width
+        ]
+        self.start_materials: int = int(self.delivered[index])
+
+    def in_strip(self, x: np.ndarray) -> np.ndarray:
+        return (x >= self.first_column) & (x < self.last_column)
+
+    # fase 1: mueve a los robots de la franja y anota sus objetivos
+    def move_phase(self) -> None:
+        # no se usa robot_x: los vecinos lo están modificando en esta fase
+        robots = np.flatnonzero(self.owner == self.index)
+        self.requests[robots] = -1
+        if self.control[GAME_OVER]:
+            self.move_home(robots)
+            return
+
+        returning = robots[self.robot_grabbing[robots]]
+        seeking = robots[~self.robot_grabbing[robots]]
+
+        targets = self.robot_last_resource[seeking].copy()
+        lost = targets >= 0
+        lost[lost] = ~self.resource_alive[targets[lost]] | (
+            self.resource_materials[targets[lost]] <= 0
+        )
+        targets[lost] = -1
+        self.robot_last_resource[seeking[lost]] = -1
+        without_target = targets < 0
+        if without_target.any():
+            targets[without_target] = self.find_closest_resources(seeking[without_target])
+
+        self.move_home(returning)
+        self.move_seeking(seeking, targets)
+        self.drop(returning)
+        self.requests[seeking] = targets
+        self.delivered[self.index] = self.start_materials
+
+    # fase 2: recolecciones sobre los recursos de la franja
+    def grab_phase(self) -> None:
+        if self.control[GAME_OVER]:
+            return
+        robots = np.flatnonzero(self.requests >= 0)
+        targets = self.requests[robots]
+        mine = self.in_strip(self.resource_x[targets])
+        self.grab(robots[mine], targets[mine])
+
+
+def run_worker(
+    spec: Spec,
+    barrier,
+    width: int,
+    height: int,
+    padding: int,
+    grab_distance: int,
+    seed: Optional[int],
+    index: int,
+    columns: Tuple[int, int],
+) -> None:
+    shared = SharedArrays.attach(spec)
+    worker = ShardWorker(
+        shared.arrays, width, height, padding, grab_distance, seed, index, columns
+    )
+    control = shared.arrays["control"]
+    try:
+        while True:
+            barrier.wait()
+            if control[STOP]:
+                break
+            worker.move_phase()
+            barrier.wait()
+            worker.grab_phase()
+            barrier.wait()
+    except BrokenBarrierError:
+        # el proceso principal u otro proceso ya abandonó el tick
+        pass
+    except BaseException:
+        # avisa al resto para que nadie se quede esperando en la barrera
+        barrier.abort()
+        raise
+    finally:
+        del worker, control
+        shared.close()
+
+
+# reparte un VectorWorld entre `workers` procesos
+# el mundo original se sigue usando desde este proceso para retirar recursos,
+# mantener el campo de distancias y consultar el estado
+class ShardedWorld:
+    def __init__(
+        self,
+        world: VectorWorld,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = 60.0,
+    ) -> None:
+        self.world: VectorWorld = world
+        # segundos que el proceso principal espera cada fase (None = sin límite)
+        self.timeout: Optional[float] = timeout
+        self.workers: int = max(1, min(workers or os.cpu_count() or 1, world.width))
+        self.columns: List[int] = [
+            int(column)
+            for column in np.linspace(0, world.width, self.workers + 1).round()
+        ]
+
+        # los arreglos del mundo pasan a memoria compartida; la ocupación y las
+        # distancias se copian porque la cuadrícula y el campo siguen aquí
+        self.shared: SharedArrays = SharedArrays()
+        for name in SHARED_FIELDS:
+            setattr(world, name, self.shared.create(name, getattr(world, name)))
+        padding: int = world.padding
+        world.resource_at = world.padded_resource_at[
+            padding : padding + world.height, padding : padding + world.width
+        ]
+        self.cells: np.ndarray = self.shared.create("cells", world.cells)
+        self.home: np.ndarray = self.shared.create("home", world.home)
+        self.requests: np.ndarray = self.shared.create(
+            "requests", np.full(len(world.robot_x), -1, dtype=np.int32)
+        )
+        # proceso que mueve a cada robot en el tick actual
+        self.owner: np.ndarray = self.shared.create(
+            "owner", np.zeros(len(world.robot_x), dtype=np.int32)
+        )
+        self.delivered: np.ndarray = self.shared.create(
+            "delivered", np.zeros(self.workers, dtype=np.int64)
+        )
+        self.delivered[0] = world.start_materials
+        self.control: np.ndarray = self.shared.create(
+            "control", np.zeros(3, dtype=np.int64)
+        )
+        self.grid_version: int = world.grid.version
+
+        self.barrier = Barrier(self.workers + 1)
+        self.processes: List[Process] = [
+            Process(
+                target=run_worker,
+                args=(
+                    self.shared.spec,
+                    self.barrier,
+                    world.width,
+                    world.height,
+                    padding,
+                    world.grab_distance,
+                    world.seed,
+                    index,
+                    (self.columns[index], self.columns[index + 1]),
+                ),
+                daemon=True,
+            )
+            for index in range(self.workers)
+        ]
+        for process in self.processes:
+            process.start()
+        self.closed: bool = False
+
+    @classmethod
+    def from_simulation(
+        cls,
+        simulation,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = 60.0,
+    ) -> "ShardedWorld":
+        return cls(VectorWorld.from_simulation(simulation), workers, timeout)
+
+    @property
+    def tick(self) -> int:
+        return self.world.tick
+
+    def check_game_over(self) -> bool:
+        return self.world.check_game_over()
+
+    # avanza un tick: retiro de recursos aquí y las dos fases en los procesos
+    def step(self) -> None:
+        if self.closed:
+            raise RuntimeError("sharded world is closed")
+        world = self.world
+        world.update_resources()
+        if world.grid.version != self.grid_version:
+            self.grid_version = world.grid.version
+            self.cells[...] = world.cells
+            self.home[...] = world.home
+
+        self.owner[...] = np.searchsorted(self.columns[1:], world.robot_x, side="right")
+        self.control[TICK] = world.tick
+        self.control[GAME_OVER] = world.check_game_over()
+        self.wait()
+        self.wait()
+        self.wait()
+        world.start_materials = int(self.delivered.sum())
+        world.tick += 1
+
+    # espera a los procesos en la barrera; si alguno falló o se agotó el tiempo
+    # se detiene todo y el error llega a quien llamó
+    def wait(self) -> None:
+        try:
+            self.barrier.wait(self.timeout)
+        except BrokenBarrierError:
+            self.barrier.abort()
+            for process in self.processes:
+                process.join(1)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            codes = [process.exitcode for process in self.processes]
+            self.release()
+            raise BrokenBarrierError(
+                f"sharded world stopped, worker exit codes {codes}"
+            ) from None
+
+    def run_until(
+        self,
+        condition: Optional[Callable[[], bool]] = None,
+        max_ticks: Optional[int] = None,
+    ) -> int:
+        if condition is None:
+            condition = self.check_game_over
+        start_tick: int = self.tick
+        while not condition():
+            if max_ticks is not None and self.tick - start_tick >= max_ticks:
+                break
+            self.step()
+        return self.tick - start_tick
+
+    # detiene los procesos y devuelve el estado final a arreglos normales, así el
+    # mundo se puede seguir consultando (o simulando en un solo proceso)
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.control[STOP] = 1
+        self.wait()
+        for process in self.processes:
+            process.join()
+        self.release()
+
+    # copia el estado a arreglos normales y libera la memoria compartida
+    def release(self) -> None:
+        self.closed = True
+        world = self.world
+        for name in SHARED_FIELDS:
+            setattr(world, name, getattr(world, name).copy())
+        padding: int = world.padding
+        world.resource_at = world.padded_resource_at[
+            padding : padding + world.height, padding : padding + world.width
+        ]
+        del self.cells, self.home, self.requests, self.owner, self.delivered, self.control
+        self.shared.close(unlink=True)
+
+    def __enter__(self) -> "ShardedWorld":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
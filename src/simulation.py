@@ -0,0 +1,325 @@
+# importes locales
+from random import Random, randrange
+from time import perf_counter
+from typing import Callable, List, Optional
+
+# importes internos
+from coordinator import TaskCoordinator
+from distance_field import DistanceField
+from event_log import EventLog, DEPLETE, RESPAWN
+from exploration import ExplorationMap
+from instrumentation import Metrics
+from occupancy import OccupancyGrid, OBSTACLE, RESOURCE, ROBOT, START_AREA
+from robot import Robot
+from scheduler import Scheduler
+from resources import Resources
+from resource_manager import ResourceManager
+from obstacles import Obstacles
+from spatial_index import ResourceIndex
+from start_area import StartArea
+from structured_log import DEBUG, INFO, StructuredLogger
+
+
+class Simulation:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        number_of_robots: int = 4,
+        number_of_resources: int = 20,
+        number_of_obstacles: int = 20,
+        materials_goal: int = 25,
+        view_distance: int = 5,
+        grab_distance: int = 1,
+        carrying_capacity: int = 1,
+        line_of_sight: bool = False,
+        exploration_decay: Optional[int] = None,
+        respawn_delay: Optional[int] = None,
+        coordination_interval: Optional[int] = None,
+        seed: Optional[int] = None,
+        event_log: bool = False,
+        verbose: bool = True,
+        metrics: bool = False,
+        logger: Optional[StructuredLogger] = None,
+    ) -> None:
+        self.width: int = width
+        self.height: int = height
+
+        # toda la aleatoriedad sale de este generador; sin semilla se elige una
+        # para que cualquier corrida se pueda repetir
+        self.seed: int = seed if seed is not None else randrange(2**62)
+        self.rng: Random = Random(self.seed)
+
+        self.grid: OccupancyGrid = OccupancyGrid(width, height)
+        self.resource_index: ResourceIndex = ResourceIndex(width, height)
+        self.resource_manager: ResourceManager = ResourceManager(
+            self.grid, self.rng, respawn_delay
+        )
+        self.resource_manager.listeners.append(self.index_resource)
+        self.exploration: ExplorationMap = ExplorationMap(
+            width, height, exploration_decay
+        )
+        self.tick: int = 0
+        self.metrics: Metrics = Metrics(metrics)
+
+        self.number_of_robots: int = number_of_robots
+        self.number_of_resources: int = number_of_resources
+        self.number_of_obstacles: int = number_of_obstacles
+        self.materials_goal: int = materials_goal
+        self.view_distance: int = view_distance
+        self.grab_distance: int = grab_distance
+        self.carrying_capacity: int = carrying_capacity
+        self.verbose: bool = verbose
+        # sin registro propio y en modo verbose se escribe en consola desde
+        # un hilo aparte para no bloquear el ciclo con print
+        if logger is None and verbose:
+            logger = StructuredLogger(format="text")
+        self.logger: Optional[StructuredLogger] = logger
+        self.robots: List[Robot] = []
+        self.event_log: Optional[EventLog] = (
+            EventLog.for_simulation(self) if event_log else None
+        )
+
+        # inicializa los componentes de la simulación
+        self.initialize_start_area()
+        self.initialize_resources()
+        self.initialize_obstacles()
+        self.initialize_home_field()
+        self.initialize_robots()
+
+        # los robots dormidos solo vuelven a actuar cuando algo cambia
+        self.scheduler: Scheduler = Scheduler(len(self.robots))
+        self.game_over: bool = False
+        self.grid.listeners.append(self.board_changed)
+
+        # percepción con línea de visión (opcional, requiere NumPy)
+        self.sensor = None
+        if line_of_sight:
+            # importado aquí para que NumPy solo sea necesario con esta opción
+            from sensing import Sensor
+
+            self.sensor = Sensor(
+                self.grid,
+                self.view_distance,
+                self.resource_index,
+                self.resource_manager.by_id,
+                len(self.robots),
+                self.exploration.seen,
+            )
+            self.sensor.rebuild()
+            self.resource_manager.listeners.append(self.sensor.resource_changed)
+
+        # reparto centralizado de recursos cada cierto número de ticks (opcional)
+        self.coordinator: Optional[TaskCoordinator] = (
+            TaskCoordinator(self, coordination_interval)
+            if coordination_interval
+            else None
+        )
+
+    # funciones para inicializar los componentes de la simulación
+    def initialize_start_area(self) -> None:
+        self.start_area: StartArea = StartArea(self.width, self.height, self.rng)
+        self.start_x: int = self.start_area.start_x
+        self.start_y: int = self.start_area.start_y
+        for x in range(self.start_x, self.start_x + self.start_area.area_width):
+            for y in range(self.start_y, self.start_y + self.start_area.area_height):
+                self.grid.add(x, y, START_AREA)
+
+    def initialize_resources(self) -> None:
+        # la lista de vivos es del administrador; se modifica en su lugar
+        self.resources: List[Resources] = self.resource_manager.resources
+        for _ in range(self.number_of_resources):
+            x: int = self.rng.randint(0, self.width - 1)
+            y: int = self.rng.randint(0, self.height - 1)
+            self.resource_manager.create(x, y)
+        # a partir de aquí las bajas y reapariciones quedan en el registro
+        self.resource_manager.listeners.append(self.resource_changed)
+
+    def initialize_obstacles(self) -> None:
+        self.obstacles: List[Obstacles] = [
+            Obstacles(
+                self.rng.randint(0, self.width - 1),
+                self.rng.randint(0, self.height - 1),
+            )
+            for _ in range(self.number_of_obstacles)
+        ]
+        for obstacle in self.obstacles:
+            self.grid.add(obstacle.x, obstacle.y, OBSTACLE)
+
+    # campo de distancias compartido hacia la zona inicial
+    def initialize_home_field(self) -> None:
+        self.home_field: DistanceField = DistanceField(
+            self.grid,
+            [
+                (x, y)
+                for x in range(self.start_x, self.start_x + self.start_area.area_width)
+                for y in range(
+                    self.start_y, self.start_y + self.start_area.area_height
+                )
+            ],
+        )
+
+    def initialize_robots(self) -> None:
+        for robot_id in range(self.number_of_robots):
+            x: int = self.rng.randint(
+                self.start_x, self.start_x + self.start_area.area_width - 1
+            )
+            y: int = self.rng.randint(
+                self.start_y, self.start_y + self.start_area.area_height - 1
+            )
+            robot: Robot = Robot(
+                self,
+                x,
+                y,
+                robot_id,
+                self.view_distance,
+                self.carrying_capacity,
+                self.grab_distance,
+            )
+            self.robots.append(robot)
+            self.grid.add(x, y, ROBOT)
+            self.exploration.visit(x, y)
+
+    # encola un evento en el registro estructurado (se escribe en otro hilo)
+    def log(
+        self,
+        event: str,
+        robot: int,
+        x: int,
+        y: int,
+        resource: Optional[int] = None,
+        level: int = INFO,
+    ) -> None:
+        if self.logger is not None:
+            self.logger.event(self.tick, level, event, robot, x, y, resource)
+
+    # escribe lo que quede pendiente en el registro y detiene su hilo
+    def close(self) -> None:
+        if self.logger is not None:
+            self.logger.close()
+
+    # guarda un evento en el registro binario si está activo
+    def record(self, kind: int, robot: int, x: int, y: int, value: int) -> None:
+        if self.event_log is not None:
+            self.event_log.record(self.tick, kind, robot, x, y, value)
+
+    # calcula el movimiento del robot
+    def move_robot(self, robot: Robot) -> None:
+        if robot.is_grabbing:
+            robot.return_home()
+        else:
+            robot.decide_movement()
+
+    # comprueba si la simulación ha terminado
+    def check_game_over(self) -> bool:
+        return self.start_area.materials >= self.materials_goal
+
+    # actualización de los recursos: solo se revisan los que se agotaron
+    def update_resources(self) -> None:
+        self.resource_manager.update(self.tick)
+
+    # mantiene la cuadrícula y el índice espacial al día con los recursos vivos
+    def index_resource(self, resource: Resources, alive: bool) -> None:
+        if alive:
+            self.grid.add(resource.x, resource.y, RESOURCE)
+            self.resource_index.insert(resource)
+        else:
+            self.grid.remove(resource.x, resource.y, RESOURCE)
+            self.resource_index.remove(resource)
+
+    # registra las bajas y reapariciones de recursos
+    def resource_changed(self, resource: Resources, alive: bool) -> None:
+        if alive:
+            self.record(RESPAWN, resource.materials, resource.x, resource.y, resource.id)
+            self.log("respawn", -1, resource.x, resource.y, resource.id, DEBUG)
+            return
+        self.record(DEPLETE, 0, resource.x, resource.y, resource.id)
+        self.log("deplete", -1, resource.x, resource.y, resource.id, DEBUG)
+        # el objeto se reutiliza al reaparecer: nadie debe seguir recordándolo
+        for robot in self.robots:
+            if robot.last_resource is resource:
+                robot.last_resource = None
+
+    # el recurso agotado deja de ocupar su celda y sale de la lista
+    def retire_resource(self, resource: Resources) -> None:
+        self.resource_manager.retire(resource, self.tick)
+
+    # coloca un recurso en una celda; si seguía vivo se libera su celda anterior
+    def place_resource(
+        self, resource: Resources, x: int, y: int, materials: int
+    ) -> None:
+        self.resource_manager.place(resource, x, y, materials)
+
+    # actualización de los robots
+    def update_robots(self) -> None:
+        robots = self.robots
+        if not self.game_over and self.check_game_over():
+            # todos los que esperaban tienen que volver a casa
+            self.game_over = True
+            self.scheduler.wake_waiting()
+        elif self.coordinator is not None and not self.game_over:
+            self.coordinator.update(self.tick)
+        if self.sensor is not None and not self.game_over:
+            # lo que ve cada robot que busca, calculado para todos a la vez
+            scheduler = self.scheduler
+            self.sensor.update(
+                [
+                    robots[robot_id]
+                    for robot_id in scheduler.order
+                    if scheduler.awake[robot_id] and not robots[robot_id].is_grabbing
+                ],
+                self.tick,
+            )
+        if self.game_over:
+            for robot_id in self.scheduler:
+                robots[robot_id].return_home()
+        else:
+            for robot_id in self.scheduler:
+                self.move_robot(robots[robot_id])
+
+    # una celda pasó de libre a bloqueada o al revés: los robots que esperaban
+    # un camino, un vecino libre o un recurso nuevo vuelven a intentarlo
+    def board_changed(self, x: int, y: int, blocked: bool) -> None:
+        self.scheduler.wake_waiting()
+
+    # avanza la simulación un tick
+    def step(self) -> None:
+        if self.metrics.enabled:
+            self.step_instrumented()
+            return
+        self.update_resources()
+        self.update_robots()
+        self.tick += 1
+        self.exploration.update(self.tick)
+
+    # igual que step pero midiendo cada fase
+    def step_instrumented(self) -> None:
+        metrics = self.metrics
+        metrics.begin_tick()
+        started = perf_counter()
+        self.update_resources()
+        resources_done = perf_counter()
+        self.update_robots()
+        robots_done = perf_counter()
+        self.tick += 1
+        self.exploration.update(self.tick)
+        finished = perf_counter()
+        metrics.add_time("resources", resources_done - started)
+        metrics.add_time("robots", robots_done - resources_done)
+        metrics.add_time("exploration", finished - robots_done)
+        metrics.end_tick(self.tick - 1, finished - started)
+
+    # avanza la simulación hasta que se cumpla la condición o se agoten los ticks
+    def run_until(
+        self,
+        condition: Optional[Callable[[], bool]] = None,
+        max_ticks: Optional[int] = None,
+    ) -> int:
+        if condition is None:
+            condition = self.check_game_over
+        start_tick: int = self.tick
+        while not condition():
+            if max_ticks is not None and self.tick - start_tick >= max_ticks:
+                break
+            self.step()
+        return self.tick - start_tick
@@ -0,0 +1,88 @@
+# importes locales
+from typing import Dict, List, Optional, Tuple
+
+# importes internos
+from resources import Resources
+
+
+class ResourceIndex:
+    def __init__(self, width: int, height: int, bucket_size: int = 8) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.bucket_size: int = bucket_size
+        self.columns: int = (width + bucket_size - 1) // bucket_size
+        self.rows: int = (height + bucket_size - 1) // bucket_size
+
+        # cada cubeta funciona como un conjunto ordenado para que las
+        # consultas sean deterministas
+        self.buckets: List[Dict[Resources, None]] = [
+            {} for _ in range(self.columns * self.rows)
+        ]
+        self.positions: Dict[Resources, Tuple[int, int]] = {}
+
+    def _bucket(self, x: int, y: int) -> Dict[Resources, None]:
+        return self.buckets[
+            (y // self.bucket_size) * self.columns + x // self.bucket_size
+        ]
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, resource: Resources) -> bool:
+        return resource in self.positions
+
+    # posición con la que se indexó el recurso (None si no está indexado)
+    def position(self, resource: Resources) -> Optional[Tuple[int, int]]:
+        return self.positions.get(resource)
+
+    # algún recurso indexado en la celda (None si no hay)
+    def at(self, x: int, y: int) -> Optional[Resources]:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        for resource in self._bucket(x, y):
+            if self.positions[resource] == (x, y):
+                return resource
+        return None
+
+    # agrega un recurso al índice (los que están fuera del tablero se ignoran)
+    def insert(self, resource: Resources) -> None:
+        if resource in self.positions:
+            self.remove(resource)
+        if not (0 <= resource.x < self.width and 0 <= resource.y < self.height):
+            return
+        self.positions[resource] = (resource.x, resource.y)
+        self._bucket(resource.x, resource.y)[resource] = None
+
+    # quita un recurso usando la posición con la que fue indexado
+    def remove(self, resource: Resources) -> None:
+        position = self.positions.pop(resource, None)
+        if position is not None:
+            del self._bucket(*position)[resource]
+
+    # vuelve a indexar un recurso después de cambiar su posición
+    def update(self, resource: Resources) -> None:
+        self.insert(resource)
+
+    # busca el recurso vivo más cercano dentro de una distancia manhattan
+    # revisando solo las cubetas que tocan el rombo de búsqueda
+    def nearest(self, x: int, y: int, radius: int) -> Optional[Resources]:
+        size: int = self.bucket_size
+        min_column: int = max(0, (x - radius) // size)
+        max_column: int = min(self.columns - 1, (x + radius) // size)
+        min_row: int = max(0, (y - radius) // size)
+        max_row: int = min(self.rows - 1, (y + radius) // size)
+
+        closest_resource: Optional[Resources] = None
+        closest_distance: int = radius + 1
+        for row in range(min_row, max_row + 1):
+            offset: int = row * self.columns
+            for column in range(min_column, max_column + 1):
+                for resource in self.buckets[offset + column]:
+                    if resource.materials <= 0:
+                        continue
+                    distance: int = abs(x - resource.x) + abs(y - resource.y)
+                    if distance < closest_distance:
+                        closest_resource = resource
+                        closest_distance = distance
+
+        return closest_resource
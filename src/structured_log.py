@@ -0,0 +1,160 @@
+# importes globales
+import atexit
+import json
+import sys
+import threading
+
+# importes locales
+from collections import deque
+from typing import Deque, List, Optional, TextIO, Tuple, Union
+
+# niveles con los mismos valores que el módulo logging, que no se importa
+# porque casi duplicaba el tiempo de `import simulation`
+DEBUG: int = 10
+INFO: int = 20
+WARNING: int = 30
+
+# tick, nivel, evento, robot, x, y, recurso
+Record = Tuple[int, int, str, int, int, int, Optional[int]]
+
+LEVEL_NAMES = {DEBUG: "debug", INFO: "info", WARNING: "warning"}
+
+
+# registro de eventos que no escribe desde el ciclo de la simulación:
+# en el camino caliente solo se agrega una tupla a una cola y un hilo en
+# segundo plano la vacía y escribe todo el lote con una sola llamada
+#
+# formatos: "jsonl" (un objeto JSON por línea) o "text" (para la consola)
+# el registro binario para reproducir corridas es EventLog
+class StructuredLogger:
+    def __init__(
+        self,
+        output: Union[str, TextIO, None] = None,
+        level: int = INFO,
+        sample_every: int = 1,
+        format: str = "jsonl",
+        batch_size: int = 1024,
+        flush_interval: float = 0.5,
+    ) -> None:
+        if format not in ("jsonl", "text"):
+            raise ValueError(f"unknown log format {format!r}")
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+
+        self.level: int = level
+        # se guarda uno de cada `sample_every` eventos por debajo de WARNING
+        self.sample_every: int = sample_every
+        self.format: str = format
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.seen: int = 0
+        self.written: int = 0
+
+        self.owns_stream: bool = isinstance(output, str)
+        self.stream: TextIO = (
+            open(output, "a") if isinstance(output, str) else output or sys.stdout
+        )
+
+        # append y popleft de deque son seguros entre hilos
+        self.records: Deque[Record] = deque()
+        self.wake = threading.Event()
+        self.closed: bool = False
+        # el hilo se crea con el primer evento y termina cuando pasa un
+        # `flush_interval` sin eventos, así una simulación que nadie cierra no
+        # deja hilos ni ganchos de salida vivos
+        self.writer: Optional[threading.Thread] = None
+        self.running: bool = False
+        self.lock = threading.Lock()
+
+    def _start_writer(self) -> None:
+        with self.lock:
+            if self.running or self.closed:
+                return
+            self.running = True
+            self.writer = threading.Thread(
+                target=self._write_loop, name="structured-log", daemon=True
+            )
+            self.writer.start()
+            atexit.register(self.close)
+
+    # camino caliente: filtra por nivel y muestreo y encola la tupla
+    def event(
+        self,
+        tick: int,
+        level: int,
+        event: str,
+        robot: int,
+        x: int,
+        y: int,
+        resource: Optional[int] = None,
+    ) -> None:
+        if level < self.level:
+            return
+        if level < WARNING and self.sample_every > 1:
+            self.seen += 1
+            if self.seen % self.sample_every:
+                return
+        self.records.append((tick, level, event, robot, x, y, resource))
+        if not self.running:
+            self._start_writer()
+        if len(self.records) >= self.batch_size:
+            self.wake.set()
+
+    def format_record(self, record: Record) -> str:
+        tick, level, event, robot, x, y, resource = record
+        if self.format == "text":
+            text = f"[{tick}] robot {robot} {event} at ({x}, {y})"
+            if resource is not None:
+                text += f" resource {resource}"
+            return text + "\n"
+        fields = {
+            "tick": tick,
+            "level": LEVEL_NAMES.get(level, level),
+            "event": event,
+            "robot": robot,
+            "x": x,
+            "y": y,
+        }
+        if resource is not None:
+            fields["resource"] = resource
+        return json.dumps(fields, separators=(",", ":")) + "\n"
+
+    # saca de la cola todo lo que haya y lo escribe de una vez
+    def drain(self) -> None:
+        lines: List[str] = []
+        records = self.records
+        while records:
+            lines.append(self.format_record(records.popleft()))
+        if lines:
+            self.stream.write("".join(lines))
+            self.stream.flush()
+            self.written += len(lines)
+
+    def _write_loop(self) -> None:
+        while not self.closed:
+            woke: bool = self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.drain()
+            if woke:
+                continue
+            # sin eventos en un intervalo: el hilo termina hasta el siguiente
+            with self.lock:
+                if not self.records and not self.closed:
+                    self.running = False
+                    atexit.unregister(self.close)
+                    return
+
+    # escribe lo pendiente y detiene el hilo (se llama también al salir)
+    def close(self) -> None:
+        if self.closed:
+            return
+        with self.lock:
+            self.closed = True
+            writer = self.writer if self.running else None
+        if writer is not None:
+            self.wake.set()
+            writer.join()
+            atexit.unregister(self.close)
+        self.drain()
+        if self.owns_stream:
+            self.stream.close()
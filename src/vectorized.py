@@ -0,0 +1,298 @@
+# importes globales
+import numpy as np
+
+# importes locales
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+# importes internos
+from distance_field import DistanceField, UNREACHABLE
+from occupancy import OccupancyGrid, BLOCKING, OBSTACLE, RESOURCE, START_AREA
+
+# direcciones en el mismo orden que usa Robot
+DIRECTIONS: np.ndarray = np.array([(0, -1), (0, 1), (-1, 0), (1, 0)], dtype=np.int32)
+
+
+# desplazamientos del rombo de visión ordenados por distancia manhattan,
+# así el primer recurso encontrado en una fila es el más cercano
+@lru_cache(maxsize=None)
+def view_offsets(radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    offsets: List[Tuple[int, int]] = [
+        (dx, dy)
+        for dy in range(-radius, radius + 1)
+        for dx in range(-radius, radius + 1)
+        if abs(dx) + abs(dy) <= radius
+    ]
+    offsets.sort(key=lambda offset: abs(offset[0]) + abs(offset[1]))
+    array = np.array(offsets, dtype=np.int32).reshape(-1, 2)
+    return array, np.abs(array).sum(axis=1)
+
+
+# representación del mundo como arreglos de NumPy (struct-of-arrays)
+# cada fase del tick se ejecuta para todos los robots a la vez
+class VectorWorld:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        robot_positions: np.ndarray,
+        resource_positions: np.ndarray,
+        resource_materials: np.ndarray,
+        obstacle_positions: np.ndarray,
+        start_area: Tuple[int, int, int, int],
+        view_distance: int = 5,
+        grab_distance: int = 1,
+        materials_goal: int = 25,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.width: int = width
+        self.height: int = height
+        self.grab_distance: int = grab_distance
+        self.materials_goal: int = materials_goal
+        self.seed: Optional[int] = seed
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.tick: int = 0
+
+        # ocupación compartida con el campo de distancias (misma memoria)
+        self.grid: OccupancyGrid = OccupancyGrid(width, height)
+        start_x, start_y, area_width, area_height = start_area
+        home: List[Tuple[int, int]] = []
+        for x in range(start_x, start_x + area_width):
+            for y in range(start_y, start_y + area_height):
+                self.grid.add(x, y, START_AREA)
+                home.append((x, y))
+        for x, y in obstacle_positions:
+            self.grid.add(int(x), int(y), OBSTACLE)
+
+        # estado de los recursos
+        self.resource_x: np.ndarray = np.asarray(resource_positions[:, 0], dtype=np.int32)
+        self.resource_y: np.ndarray = np.asarray(resource_positions[:, 1], dtype=np.int32)
+        self.resource_materials: np.ndarray = np.asarray(
+            resource_materials, dtype=np.int32
+        ).copy()
+        self.resource_alive: np.ndarray = self.resource_materials > 0
+        # índice del recurso vivo en cada celda (-1 si no hay), con un borde del
+        # tamaño del campo de visión para leer el rombo sin revisar límites
+        self.padding: int = max(view_distance, 1)
+        self.padded_resource_at: np.ndarray = np.full(
+            (height + 2 * self.padding, width + 2 * self.padding), -1, dtype=np.int32
+        )
+        self.resource_at: np.ndarray = self.padded_resource_at[
+            self.padding : self.padding + height, self.padding : self.padding + width
+        ]
+        for i in np.flatnonzero(self.resource_alive):
+            self.grid.add(int(self.resource_x[i]), int(self.resource_y[i]), RESOURCE)
+            self.resource_at[self.resource_y[i], self.resource_x[i]] = i
+
+        self.home_field: DistanceField = DistanceField(self.grid, home)
+        self.cells: np.ndarray = np.frombuffer(self.grid.cells, dtype=np.uint8).reshape(
+            height, width
+        )
+        self.home: np.ndarray = np.frombuffer(
+            self.home_field.distances, dtype=np.int32
+        ).reshape(height, width)
+
+        # estado de los robots
+        number_of_robots: int = len(robot_positions)
+        self.robot_x: np.ndarray = np.asarray(robot_positions[:, 0], dtype=np.int32).copy()
+        self.robot_y: np.ndarray = np.asarray(robot_positions[:, 1], dtype=np.int32).copy()
+        self.robot_materials: np.ndarray = np.zeros(number_of_robots, dtype=np.int32)
+        self.robot_grabbing: np.ndarray = np.zeros(number_of_robots, dtype=bool)
+        self.robot_view: np.ndarray = np.full(number_of_robots, view_distance, dtype=np.int32)
+        self.robot_last_resource: np.ndarray = np.full(number_of_robots, -1, dtype=np.int32)
+        self.robot_distance: np.ndarray = np.zeros(number_of_robots, dtype=np.int64)
+
+        self.start_materials: int = 0
+
+    # construye el mundo vectorizado a partir de una Simulation ya inicializada
+    @classmethod
+    def from_simulation(cls, simulation, seed: Optional[int] = None) -> "VectorWorld":
+        area = simulation.start_area
+        return cls(
+            simulation.width,
+            simulation.height,
+            np.array([(r.x, r.y) for r in simulation.robots], dtype=np.int32).reshape(-1, 2),
+            np.array(
+                [(r.x, r.y) for r in simulation.resources], dtype=np.int32
+            ).reshape(-1, 2),
+            np.array([r.materials for r in simulation.resources], dtype=np.int32),
+            np.array(
+                [(o.x, o.y) for o in simulation.obstacles], dtype=np.int32
+            ).reshape(-1, 2),
+            (area.start_x, area.start_y, area.area_width, area.area_height),
+            view_distance=max((r.view_distance for r in simulation.robots), default=5),
+            grab_distance=max((r.grab_distance for r in simulation.robots), default=1),
+            materials_goal=simulation.materials_goal,
+            seed=seed if seed is not None else simulation.seed,
+        )
+
+    # comprueba si la simulación ha terminado
+    def check_game_over(self) -> bool:
+        return self.start_materials >= self.materials_goal
+
+    # lee un arreglo 2D en posiciones arbitrarias, con valor fijo fuera del tablero
+    def _gather(self, grid: np.ndarray, x: np.ndarray, y: np.ndarray, outside) -> np.ndarray:
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        values = np.full(x.shape, outside, dtype=grid.dtype)
+        values[inside] = grid[y[inside], x[inside]]
+        return values
+
+    # fase de agotamiento: libera las celdas de los recursos sin materiales
+    def update_resources(self) -> None:
+        depleted = np.flatnonzero(self.resource_alive & (self.resource_materials <= 0))
+        if depleted.size == 0:
+            return
+        self.resource_alive[depleted] = False
+        self.resource_at[self.resource_y[depleted], self.resource_x[depleted]] = -1
+        for i in depleted:
+            self.grid.remove(int(self.resource_x[i]), int(self.resource_y[i]), RESOURCE)
+
+    # fase de búsqueda: recurso vivo más cercano dentro del campo de visión
+    def find_closest_resources(self, robots: np.ndarray) -> np.ndarray:
+        radius: int = min(int(self.robot_view[robots].max(initial=0)), self.padding)
+        offsets, distances = view_offsets(radius)
+        stride: int = self.padded_resource_at.shape[1]
+        centers = (self.robot_y[robots] + self.padding) * stride + (
+            self.robot_x[robots] + self.padding
+        )
+        cells = centers[:, None] + (offsets[:, 1] * stride + offsets[:, 0])[None, :]
+        candidates = np.take(self.padded_resource_at, cells)
+        candidates[distances[None, :] > self.robot_view[robots, None]] = -1
+        found = candidates >= 0
+        first = found.argmax(axis=1)
+        closest = candidates[np.arange(len(robots)), first]
+        closest[~found.any(axis=1)] = -1
+        return closest
+
+    # elige un vecino válido por robot según un puntaje (menor es mejor)
+    def _apply_moves(self, robots: np.ndarray, scores: np.ndarray) -> None:
+        choice = scores.argmin(axis=1)
+        best = scores[np.arange(len(robots)), choice]
+        moving = np.isfinite(best)
+        robots = robots[moving]
+        choice = choice[moving]
+        self.robot_x[robots] += DIRECTIONS[choice, 0]
+        self.robot_y[robots] += DIRECTIONS[choice, 1]
+        self.robot_distance[robots] += 1
+
+    def _neighbor_cells(self, robots: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        x = self.robot_x[robots, None] + DIRECTIONS[None, :, 0]
+        y = self.robot_y[robots, None] + DIRECTIONS[None, :, 1]
+        return x, y
+
+    # fase de movimiento para robots que regresan a la zona inicial
+    def move_home(self, robots: np.ndarray) -> None:
+        if robots.size == 0:
+            return
+        x, y = self._neighbor_cells(robots)
+        neighbor = self._gather(self.home, x, y, UNREACHABLE).astype(np.float64)
+        current = self.home[self.robot_y[robots], self.robot_x[robots]]
+        neighbor[neighbor >= current[:, None]] = np.inf
+        self._apply_moves(robots, neighbor)
+
+    # fase de movimiento hacia un recurso (paso voraz) o aleatorio si no hay objetivo
+    def move_seeking(self, robots: np.ndarray, targets: np.ndarray) -> None:
+        if robots.size == 0:
+            return
+        x, y = self._neighbor_cells(robots)
+        blocked = (self._gather(self.cells, x, y, OBSTACLE) & BLOCKING) > 0
+        # puntaje aleatorio para quien no tiene objetivo o no puede acercarse
+        scores = self.rng.random((len(robots), 4))
+        has_target = targets >= 0
+        if has_target.any():
+            tx = self.resource_x[targets[has_target], None]
+            ty = self.resource_y[targets[has_target], None]
+            distance = np.abs(x[has_target] - tx) + np.abs(y[has_target] - ty)
+            current = np.abs(
+                self.robot_x[robots[has_target]] - tx[:, 0]
+            ) + np.abs(self.robot_y[robots[has_target]] - ty[:, 0])
+            closer = distance < current[:, None]
+            # los que ya están junto al recurso no se mueven
+            arrived = current <= self.grab_distance
+            # un paso que acerca siempre gana a los aleatorios (que están en [0, 1))
+            closer_scores = np.where(
+                closer, -1.0 - 1.0 / (distance + 1), scores[has_target]
+            )
+            closer_scores[arrived] = np.inf
+            scores[has_target] = closer_scores
+        scores[blocked] = np.inf
+        self._apply_moves(robots, scores)
+
+    # fase de recolección: cada recurso solo entrega los materiales que tiene,
+    # por orden de robot cuando varios lo alcanzan en el mismo tick
+    def grab(self, robots: np.ndarray, targets: np.ndarray) -> None:
+        valid = targets >= 0
+        robots, targets = robots[valid], targets[valid]
+        alive = self.resource_alive[targets] & (self.resource_materials[targets] > 0)
+        distance = np.abs(self.robot_x[robots] - self.resource_x[targets]) + np.abs(
+            self.robot_y[robots] - self.resource_y[targets]
+        )
+        ready = alive & (distance <= self.grab_distance)
+        robots, targets = robots[ready], targets[ready]
+        if robots.size == 0:
+            return
+        order = np.argsort(targets, kind="stable")
+        robots, targets = robots[order], targets[order]
+        first = np.searchsorted(targets, targets, side="left")
+        rank = np.arange(len(targets)) - first
+        allowed = rank < self.resource_materials[targets]
+        robots, targets = robots[allowed], targets[allowed]
+        np.subtract.at(self.resource_materials, targets, 1)
+        self.robot_materials[robots] += 1
+        self.robot_grabbing[robots] = True
+        self.robot_last_resource[robots] = targets
+
+    # fase de entrega en la zona inicial
+    def drop(self, robots: np.ndarray) -> None:
+        if robots.size == 0:
+            return
+        at_home = self.home[self.robot_y[robots], self.robot_x[robots]] <= self.grab_distance
+        robots = robots[at_home]
+        self.start_materials += int(self.robot_materials[robots].sum())
+        self.robot_materials[robots] = 0
+        self.robot_grabbing[robots] = False
+
+    # avanza la simulación un tick
+    def step(self) -> None:
+        self.update_resources()
+
+        if self.check_game_over():
+            self.move_home(np.arange(len(self.robot_x)))
+            self.tick += 1
+            return
+
+        returning = np.flatnonzero(self.robot_grabbing)
+        seeking = np.flatnonzero(~self.robot_grabbing)
+
+        # el último recurso tiene prioridad mientras tenga materiales
+        targets = self.robot_last_resource[seeking].copy()
+        lost = targets >= 0
+        lost[lost] = ~self.resource_alive[targets[lost]] | (
+            self.resource_materials[targets[lost]] <= 0
+        )
+        targets[lost] = -1
+        self.robot_last_resource[seeking[lost]] = -1
+        without_target = targets < 0
+        if without_target.any():
+            targets[without_target] = self.find_closest_resources(seeking[without_target])
+
+        self.move_home(returning)
+        self.move_seeking(seeking, targets)
+        self.drop(returning)
+        self.grab(seeking, targets)
+        self.tick += 1
+
+    # avanza hasta que se cumpla la condición o se agoten los ticks
+    def run_until(
+        self,
+        condition: Optional[Callable[[], bool]] = None,
+        max_ticks: Optional[int] = None,
+    ) -> int:
+        if condition is None:
+            condition = self.check_game_over
+        start_tick: int = self.tick
+        while not condition():
+            if max_ticks is not None and self.tick - start_tick >= max_ticks:
+                break
+            self.step()
+        return self.tick - start_tick
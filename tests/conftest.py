@@ -0,0 +1,7 @@
+# importes globales
+import sys
+
+# importes locales
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
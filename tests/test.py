@@ -1,2 +1,57 @@
+# tiempo de importación de los módulos sin interfaz
+#
+# uso: python -m pytest tests/test.py
 
+# importes globales
+import subprocess
+import sys
 
+# importes locales
+from pathlib import Path
+from typing import Dict
+
+SRC: Path = Path(__file__).resolve().parents[1] / "src"
+# módulos que usan los procesos sin ventana (lotes, sharding, CLI)
+HEADLESS_MODULES: str = "simulation, checkpoint, event_log, batch, scenario, app"
+# presupuesto para importar la simulación (solo pygame tardaba ~300 ms)
+IMPORT_BUDGET_US: int = 150_000
+
+
+# tiempo acumulado en microsegundos por módulo según `python -X importtime`
+def import_times(modules: str) -> Dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modules}"],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_headless_modules_do_not_import_pygame() -> None:
+    times = import_times(HEADLESS_MODULES)
+    assert "simulation" in times
+    loaded = [name for name in times if name.split(".")[0] in ("pygame", "numpy")]
+    assert loaded == []
+
+
+# los niveles del registro están en structured_log; logging tardaba ~20 ms
+def test_simulation_does_not_import_logging() -> None:
+    assert "logging" not in import_times("simulation")
+
+
+def test_simulation_import_time() -> None:
+    # el mejor de varios intentos para no depender de la caché del disco
+    best: int = min(import_times("simulation")["simulation"] for _ in range(3))
+    assert best < IMPORT_BUDGET_US
+
+
+def test_rendering_still_uses_pygame() -> None:
+    assert "pygame" in import_times("game")
@@ -0,0 +1,61 @@
+# importes globales
+import csv
+
+# importes internos
+import batch
+
+
+def tiny_jobs(seeds: str = "0-3"):
+    args = batch.parse_args(
+        ["--seeds", seeds, "--width", "20", "--height", "15", "--robots", "2,3"]
+        + ["--resources", "5", "--obstacles", "5", "--max-ticks", "200"]
+    )
+    return batch.build_jobs(args)
+
+
+def read_rows(path):
+    with open(path, newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def test_parse_int_list() -> None:
+    assert batch.parse_int_list("0-3,7, 10-11,") == [0, 1, 2, 3, 7, 10, 11]
+
+
+def test_batch_writes_one_row_per_job(tmp_path) -> None:
+    path = str(tmp_path / "resultados.csv")
+    jobs = tiny_jobs()
+    assert batch.run_batch(jobs, path, workers=2) == len(jobs) == 8
+
+    rows = read_rows(path)
+    assert list(rows[0]) == batch.FIELDS
+    assert sorted(batch.job_key(row) for row in rows) == sorted(
+        batch.job_key(job) for job in jobs
+    )
+    # una corrida del lote es la misma que en este proceso
+    row = next(row for row in rows if batch.job_key(row) == batch.job_key(jobs[0]))
+    result = batch.run_job(jobs[0])
+    assert int(row["ticks"]) == result["ticks"]
+    assert int(row["materials_delivered"]) == result["materials_delivered"]
+
+
+def test_resume_runs_only_missing_jobs_without_duplicates(tmp_path) -> None:
+    path = tmp_path / "resultados.csv"
+    jobs = tiny_jobs()
+    batch.run_batch(jobs, str(path), workers=2)
+    lines = path.read_bytes().splitlines(keepends=True)
+    # se pierden dos renglones completos y el último queda a medias
+    path.write_bytes(b"".join(lines[:-3]) + lines[-3][:10])
+    kept = {batch.job_key(row) for row in read_rows(str(path))[:-1]}
+
+    assert batch.completed_keys(str(path)) == kept
+    assert path.read_bytes().endswith(b"\n")
+    assert batch.run_batch(jobs, str(path), workers=2) == 3
+
+    keys = [batch.job_key(row) for row in read_rows(str(path))]
+    assert len(keys) == len(set(keys)) == len(jobs)
+    assert batch.run_batch(jobs, str(path), workers=2) == 0
+
+
+def test_missing_file_has_no_completed_jobs(tmp_path) -> None:
+    assert batch.completed_keys(str(tmp_path / "nada.csv")) == set()
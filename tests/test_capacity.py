@@ -0,0 +1,69 @@
+# importes internos
+from event_log import DROP, GRAB
+from simulation import Simulation
+
+
+# simulación con un recurso de `materials` junto al primer robot (en la zona inicial)
+def setup(capacity: int, materials: int):
+    simulation = Simulation(
+        40,
+        30,
+        number_of_robots=2,
+        carrying_capacity=capacity,
+        seed=0,
+        event_log=True,
+        verbose=False,
+    )
+    robot = simulation.robots[0]
+    resource = simulation.resources[0]
+    x = robot.x + 1 if robot.x + 1 < simulation.width else robot.x - 1
+    simulation.place_resource(resource, x, robot.y, materials)
+    return simulation, robot, resource
+
+
+def events(simulation: Simulation, kind: int):
+    return [event for event in simulation.event_log if event.kind == kind]
+
+
+def test_grab_takes_as_much_as_fits_in_one_visit() -> None:
+    simulation, robot, resource = setup(capacity=4, materials=6)
+    robot.grab_resource(resource)
+    assert robot.materials == 4
+    assert robot.is_grabbing
+    assert resource.materials == 2
+    # un registro GRAB por material
+    grabs = events(simulation, GRAB)
+    assert len(grabs) == 4
+    assert {(event.robot, event.value) for event in grabs} == {(robot.id, resource.id)}
+
+
+def test_grab_stops_at_what_the_resource_has() -> None:
+    simulation, robot, resource = setup(capacity=4, materials=3)
+    robot.grab_resource(resource)
+    assert robot.materials == 3
+    assert resource.materials == 0
+    assert resource in simulation.resource_manager.depleted
+    assert len(events(simulation, GRAB)) == 3
+
+
+def test_single_drop_delivers_the_whole_load() -> None:
+    simulation, robot, resource = setup(capacity=4, materials=6)
+    robot.grab_resource(resource)
+    assert robot.at_home()
+    robot.drop_resource()
+    assert simulation.start_area.materials == 4
+    assert robot.materials == 0 and not robot.is_grabbing
+    drops = events(simulation, DROP)
+    assert [(event.robot, event.value) for event in drops] == [(robot.id, 4)]
+
+
+def test_every_grabbed_unit_is_recorded_and_delivered() -> None:
+    simulation = Simulation(
+        60, 40, carrying_capacity=3, materials_goal=40, seed=2, event_log=True, verbose=False
+    )
+    simulation.run_until(max_ticks=20_000)
+    grabbed = len(events(simulation, GRAB))
+    delivered = sum(event.value for event in events(simulation, DROP))
+    carried = sum(robot.materials for robot in simulation.robots)
+    assert delivered == simulation.start_area.materials >= 40
+    assert grabbed == delivered + carried
@@ -0,0 +1,65 @@
+# importes globales
+import pytest
+
+# importes internos
+import checkpoint
+from simulation import Simulation
+
+CONFIGURATIONS = [
+    {},
+    {"respawn_delay": 20},
+    {"coordination_interval": 5},
+    {"carrying_capacity": 3},
+    {"respawn_delay": 10, "coordination_interval": 4, "carrying_capacity": 2},
+    {"exploration_decay": 50, "grab_distance": 2},
+]
+
+
+# corre las dos simulaciones a la par y compara el estado completo en cada tick
+def assert_same_run(original: Simulation, restored: Simulation, ticks: int) -> None:
+    for _ in range(ticks):
+        original.step()
+        restored.step()
+        assert restored.tick == original.tick
+        assert [(robot.x, robot.y, robot.materials) for robot in restored.robots] == [
+            (robot.x, robot.y, robot.materials) for robot in original.robots
+        ]
+    assert checkpoint.dumps(restored) == checkpoint.dumps(original)
+
+
+@pytest.mark.parametrize("options", CONFIGURATIONS)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_restored_run_continues_tick_for_tick(seed: int, options: dict) -> None:
+    original = Simulation(
+        60, 40, number_of_robots=8, materials_goal=60, seed=seed, verbose=False, **options
+    )
+    original.run_until(max_ticks=120)
+    data = checkpoint.dumps(original)
+    restored = checkpoint.loads(data)
+    assert checkpoint.dumps(restored) == data
+    assert_same_run(original, restored, 400)
+
+
+def test_save_and_load(tmp_path) -> None:
+    original = Simulation(40, 30, seed=3, verbose=False)
+    original.run_until(max_ticks=50)
+    path = str(tmp_path / "run.ckpt")
+    checkpoint.save(original, path)
+    assert_same_run(original, checkpoint.load(path), 200)
+
+
+def test_fork_with_the_same_seed_matches_the_original() -> None:
+    original = Simulation(40, 30, seed=3, respawn_delay=5, verbose=False)
+    original.run_until(max_ticks=50)
+    assert_same_run(original, checkpoint.fork(original), 200)
+
+
+def test_rejects_other_files() -> None:
+    with pytest.raises(ValueError):
+        checkpoint.loads(b"not a checkpoint")
+    data = bytearray(checkpoint.dumps(Simulation(20, 20, seed=0, verbose=False)))
+    data[4] = checkpoint.VERSION + 1
+    with pytest.raises(ValueError):
+        checkpoint.loads(bytes(data))
+    with pytest.raises(TypeError):
+        checkpoint.fork(Simulation(20, 20, seed=0, verbose=False), width=30)
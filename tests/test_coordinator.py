@@ -0,0 +1,140 @@
+# importes globales
+import pytest
+
+# importes locales
+from collections import Counter
+from random import Random
+
+# importes internos
+from simulation import Simulation
+
+
+def build(capacity: int = 1, robots: int = 8) -> Simulation:
+    return Simulation(
+        40,
+        30,
+        number_of_robots=robots,
+        number_of_resources=3,
+        carrying_capacity=capacity,
+        coordination_interval=1,
+        seed=0,
+        verbose=False,
+    )
+
+
+@pytest.mark.parametrize("capacity", [1, 2, 3])
+def test_resource_never_gets_more_robots_than_it_can_fill(capacity: int) -> None:
+    simulation = build(capacity)
+    coordinator = simulation.coordinator
+    for materials, resource in zip((1, 2, 4), simulation.resources):
+        resource.materials = materials
+        coordinator.report(resource)
+
+    coordinator.assign()
+
+    assigned = Counter(
+        robot.last_resource for robot in simulation.robots if robot.last_resource
+    )
+    for resource in simulation.resources:
+        assert assigned[resource] <= -(-resource.materials // capacity)
+    # hay más robots que materiales: todo material queda reservado
+    assert sum(min(capacity * n, r.materials) for r, n in assigned.items()) == 7
+
+
+def test_free_robots_without_a_task_forget_their_target() -> None:
+    simulation = build(robots=8)
+    coordinator = simulation.coordinator
+    for resource in simulation.resources:
+        resource.materials = 1
+        coordinator.report(resource)
+    # todos perseguían el mismo recurso antes del reparto
+    for robot in simulation.robots:
+        robot.last_resource = simulation.resources[0]
+
+    coordinator.assign()
+
+    targets = [robot.last_resource for robot in simulation.robots]
+    assert sorted(targets.count(resource) for resource in simulation.resources) == [1, 1, 1]
+    assert targets.count(None) == len(simulation.robots) - 3
+
+
+def test_robots_report_the_resources_they_see() -> None:
+    simulation = build()
+    coordinator = simulation.coordinator
+    robot = simulation.robots[0]
+    resource = simulation.resources[0]
+    simulation.resource_index.remove(resource)
+    resource.x, resource.y = robot.x, min(robot.y + 2, simulation.height - 1)
+    simulation.resource_index.insert(resource)
+
+    robot.decide_movement()
+
+    assert resource in coordinator.known
+
+
+# la asignación voraz sobre todas las parejas ordenadas, como referencia
+def brute_force(simulation):
+    coordinator = simulation.coordinator
+    robots = [robot for robot in simulation.robots if not robot.is_grabbing]
+    resources = [resource for resource in coordinator.known if resource.materials > 0]
+    pairs = sorted(
+        (abs(robot.x - r.x) + abs(robot.y - r.y), -r.materials, i, j)
+        for i, robot in enumerate(robots)
+        for j, r in enumerate(resources)
+    )
+    capacity = [resource.materials for resource in resources]
+    targets = {}
+    for _, _, i, j in pairs:
+        if i in targets or capacity[j] == 0:
+            continue
+        capacity[j] -= min(robots[i].capacity, capacity[j])
+        targets[i] = resources[j]
+    return [targets.get(i) for i in range(len(robots))]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_assignment_matches_sorting_every_pair(seed: int) -> None:
+    rng = Random(seed)
+    simulation = Simulation(
+        90,
+        60,
+        number_of_robots=30,
+        number_of_resources=40,
+        carrying_capacity=2,
+        coordination_interval=1,
+        seed=seed,
+        verbose=False,
+    )
+    coordinator = simulation.coordinator
+    for resource in simulation.resources:
+        if rng.random() < 0.7:
+            coordinator.report(resource)
+    for robot in simulation.robots:
+        robot.x, robot.y = rng.randrange(90), rng.randrange(60)
+
+    expected = brute_force(simulation)
+    coordinator.assign()
+    assert [robot.last_resource for robot in simulation.robots] == expected
+
+
+def test_robots_without_a_task_leave_reserved_resources_alone() -> None:
+    simulation = build(robots=2)
+    coordinator = simulation.coordinator
+    first, second = simulation.robots
+    resource = simulation.resources[0]
+    simulation.resource_index.remove(resource)
+    resource.x, resource.y = second.x, min(second.y + 2, simulation.height - 1)
+    resource.materials = 1
+    simulation.resource_index.insert(resource)
+    coordinator.report(resource)
+
+    coordinator.assign()
+
+    assert not coordinator.is_free(resource)
+    assert [first.last_resource, second.last_resource] == [None, resource]
+    # el segundo ya tiene la tarea; el primero lo ve pero no va por él
+    first.x, first.y = second.x, second.y
+    first.decide_movement()
+    assert first.closest_resource is resource
+    assert first.last_resource is None
+    assert first.path_goal != (resource.x, resource.y)
@@ -0,0 +1,40 @@
+# importes globales
+import pytest
+
+# importes internos
+from event_log import EventLog, Replay, first_difference
+from simulation import Simulation
+
+
+def run(seed, **options) -> Simulation:
+    simulation = Simulation(50, 30, seed=seed, event_log=True, verbose=False, **options)
+    simulation.run_until(max_ticks=3_000)
+    return simulation
+
+
+@pytest.mark.parametrize("options", [{}, {"respawn_delay": 10, "number_of_robots": 8}])
+def test_same_seed_gives_the_same_run(options: dict) -> None:
+    first, second = run(7, **options), run(7, **options)
+    assert first_difference(first.event_log, second.event_log) is None
+    assert first.event_log.to_bytes() == second.event_log.to_bytes()
+
+
+def test_different_seeds_give_different_runs() -> None:
+    assert first_difference(run(1).event_log, run(2).event_log) is not None
+
+
+def test_seed_is_chosen_and_stored_when_missing() -> None:
+    simulation = run(None)
+    again = run(simulation.seed)
+    assert simulation.event_log.to_bytes() == again.event_log.to_bytes()
+
+
+def test_replay_reaches_the_same_final_state() -> None:
+    simulation = run(3)
+    replay = Replay(EventLog.from_bytes(simulation.event_log.to_bytes()))
+    replay.run()
+    replayed = replay.simulation
+    assert replayed.start_area.materials == simulation.start_area.materials
+    assert [(r.x, r.y, r.materials) for r in replayed.robots] == [
+        (r.x, r.y, r.materials) for r in simulation.robots
+    ]
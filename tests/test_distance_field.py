@@ -0,0 +1,56 @@
+# importes globales
+import pytest
+
+# importes locales
+from random import Random
+
+# importes internos
+from distance_field import UNREACHABLE, DistanceField
+from occupancy import OBSTACLE, OccupancyGrid
+
+
+def test_distances_go_around_obstacles() -> None:
+    grid = OccupancyGrid(5, 3)
+    for y in range(2):
+        grid.add(2, y, OBSTACLE)
+    field = DistanceField(grid, [(0, 0)])
+    assert field.distance(0, 0) == 0
+    assert field.distance(4, 0) == 8
+    assert field.distance(2, 0) == UNREACHABLE
+    assert field.distance(-1, 0) == UNREACHABLE
+
+    # bajar por el campo llega a la fuente en tantos pasos como la distancia
+    x, y, steps = 4, 0, 0
+    while (step := field.next_step(x, y)) is not None:
+        x, y = step
+        steps += 1
+    assert (x, y, steps) == (0, 0, 8)
+
+
+def test_walled_in_cells_are_unreachable() -> None:
+    grid = OccupancyGrid(5, 5)
+    for x, y in ((3, 4), (4, 3)):
+        grid.add(x, y, OBSTACLE)
+    field = DistanceField(grid, [(0, 0)])
+    assert field.distance(4, 4) == UNREACHABLE
+    assert field.next_step(4, 4) is None
+    grid.remove(3, 4, OBSTACLE)
+    assert field.distance(4, 4) == 8
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_updates_match_a_full_recompute(seed: int) -> None:
+    rng = Random(seed)
+    grid = OccupancyGrid(25, 15)
+    field = DistanceField(grid, [(x, y) for x in range(3) for y in range(3)])
+    blocked = []
+    for _ in range(300):
+        if blocked and rng.random() < 0.4:
+            grid.remove(*blocked.pop(rng.randrange(len(blocked))), OBSTACLE)
+        else:
+            cell = (rng.randrange(25), rng.randrange(15))
+            grid.add(*cell, OBSTACLE)
+            blocked.append(cell)
+        incremental = field.distances[:]
+        field.recompute()
+        assert incremental == field.distances
@@ -0,0 +1,74 @@
+# importes globales
+import pytest
+
+# importes internos
+from exploration import ExplorationMap
+
+
+def test_visits_saturate_at_255() -> None:
+    exploration = ExplorationMap(4, 3)
+    for _ in range(300):
+        exploration.visit(1, 2)
+    assert exploration.visits_at(1, 2) == 255
+    assert exploration.visits[2 * 4 + 1] == 255
+
+
+def test_visits_outside_the_board_are_ignored() -> None:
+    exploration = ExplorationMap(4, 3)
+    exploration.visit(-1, 0)
+    exploration.visit(4, 0)
+    exploration.visit(0, 3)
+    assert not any(exploration.visits)
+    assert exploration.visits_at(5, 5) == 0
+    assert not exploration.is_explored(5, 5)
+
+
+def test_decay_halves_every_cell() -> None:
+    exploration = ExplorationMap(3, 1)
+    for x, times in enumerate((1, 7, 255)):
+        for _ in range(times):
+            exploration.visit(x, 0)
+    exploration.decay()
+    assert list(exploration.visits) == [0, 3, 127]
+    assert not exploration.is_explored(0, 0)
+    assert exploration.is_explored(1, 0)
+
+
+def test_update_decays_only_every_interval() -> None:
+    exploration = ExplorationMap(1, 1, decay_interval=3)
+    for _ in range(64):
+        exploration.visit(0, 0)
+    values = []
+    for tick in range(1, 8):
+        exploration.update(tick)
+        values.append(exploration.visits_at(0, 0))
+    assert values == [64, 64, 32, 32, 32, 16, 16]
+
+
+def test_update_never_decays_without_an_interval() -> None:
+    exploration = ExplorationMap(1, 1)
+    exploration.visit(0, 0)
+    for tick in range(100):
+        exploration.update(tick)
+    assert exploration.visits_at(0, 0) == 1
+
+
+def test_coverage_counts_cells_visited_at_least_once() -> None:
+    exploration = ExplorationMap(5, 4)
+    assert exploration.coverage() == 0
+    exploration.visit(0, 0)
+    exploration.visit(0, 0)
+    exploration.visit(4, 3)
+    assert exploration.coverage() == pytest.approx(2 / 20)
+    for x in range(5):
+        for y in range(4):
+            exploration.visit(x, y)
+    assert exploration.coverage() == 1
+
+
+def test_seen_cells_are_separate_from_visits() -> None:
+    exploration = ExplorationMap(5, 4)
+    exploration.seen[3] = 1
+    assert exploration.is_seen(3, 0) and not exploration.is_explored(3, 0)
+    assert not exploration.is_seen(9, 9)
+    assert exploration.seen_coverage() == pytest.approx(1 / 20)
@@ -0,0 +1,50 @@
+# importes internos
+from occupancy import OBSTACLE, RESOURCE, ROBOT, START_AREA, OccupancyGrid
+
+
+def test_flags_combine_and_block_only_obstacles_and_resources() -> None:
+    grid = OccupancyGrid(4, 3)
+    grid.add(1, 1, START_AREA)
+    grid.add(1, 1, ROBOT)
+    assert grid.get(1, 1) == START_AREA | ROBOT
+    assert not grid.is_blocked(1, 1)
+
+    grid.add(2, 1, RESOURCE)
+    grid.add(3, 2, OBSTACLE)
+    assert grid.is_blocked(2, 1)
+    assert grid.is_blocked(3, 2)
+    # fuera del tablero cuenta como bloqueado y no se marca nada
+    assert grid.is_blocked(-1, 0) and grid.is_blocked(4, 0)
+    grid.add(5, 5, OBSTACLE)
+    assert sum(grid.cells) == START_AREA | ROBOT | RESOURCE | OBSTACLE
+
+
+def test_shared_cells_keep_the_flag_until_the_last_one_leaves() -> None:
+    grid = OccupancyGrid(3, 3)
+    grid.add(0, 0, ROBOT)
+    grid.add(0, 0, ROBOT)
+    grid.remove(0, 0, ROBOT)
+    assert grid.get(0, 0) & ROBOT
+    grid.move(0, 0, 1, 0, ROBOT)
+    assert grid.get(0, 0) == 0
+    assert grid.get(1, 0) == ROBOT
+    # quitar de una celda vacía no cambia nada
+    grid.remove(2, 2, ROBOT)
+    assert grid.get(2, 2) == 0
+
+
+def test_listeners_only_hear_changes_between_free_and_blocked() -> None:
+    grid = OccupancyGrid(3, 3)
+    changes = []
+    grid.listeners.append(lambda x, y, blocked: changes.append((x, y, blocked)))
+
+    grid.add(1, 1, ROBOT)
+    grid.add(1, 1, RESOURCE)
+    grid.add(1, 1, RESOURCE)
+    grid.add(1, 1, OBSTACLE)
+    grid.remove(1, 1, RESOURCE)
+    grid.remove(1, 1, RESOURCE)
+    grid.remove(1, 1, OBSTACLE)
+
+    assert changes == [(1, 1, True), (1, 1, False)]
+    assert grid.version == 2
@@ -0,0 +1,75 @@
+# importes internos
+from occupancy import OBSTACLE, OccupancyGrid
+from pathfinding import find_path
+from simulation import Simulation
+
+
+# rodea la celda (x, y) de obstáculos
+def wall_in(grid: OccupancyGrid, x: int, y: int) -> None:
+    for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+        grid.add(x + dx, y + dy, OBSTACLE)
+
+
+def test_path_around_an_obstacle() -> None:
+    grid = OccupancyGrid(5, 5)
+    grid.add(2, 1, OBSTACLE)
+    path = find_path(grid, (2, 0), (2, 2))
+    assert len(path) == 4
+    assert (2, 1) not in path
+    assert path[-1] == (2, 2)
+
+
+def test_unreachable_goal_respects_the_expansion_limit() -> None:
+    grid = OccupancyGrid(100, 100)
+    wall_in(grid, 80, 80)
+    assert find_path(grid, (5, 5), (80, 80)) == []
+    assert find_path(grid, (5, 5), (80, 80), max_expansions=500) is None
+
+
+def test_robot_does_not_search_the_whole_map_for_an_unreachable_goal() -> None:
+    simulation = Simulation(
+        200,
+        200,
+        number_of_resources=0,
+        number_of_obstacles=0,
+        seed=0,
+        verbose=False,
+        metrics=True,
+    )
+    robot = simulation.robots[0]
+    goal = (180, 180)
+    wall_in(simulation.grid, *goal)
+
+    simulation.metrics.begin_tick()
+    assert not robot.plan_path(goal)
+    margin = 2 * robot.view_distance + 1
+    limit = (abs(goal[0] - robot.x) + margin) * (abs(goal[1] - robot.y) + margin)
+    expansions = simulation.metrics.counters["path_expansions"]
+    assert expansions <= limit + 1 < 200 * 200
+    assert robot.current_path is None
+
+
+def test_robot_explores_instead_of_waiting_for_an_enclosed_resource() -> None:
+    # tablero chico: A* recorre todo lo alcanzable antes de agotar el límite
+    simulation = Simulation(
+        10,
+        8,
+        number_of_robots=1,
+        number_of_resources=0,
+        number_of_obstacles=0,
+        seed=0,
+        verbose=False,
+    )
+    robot = simulation.robots[0]
+    x = robot.x + 3 if robot.x + 4 < simulation.width else robot.x - 3
+    resource = simulation.resource_manager.create(x, robot.y)
+    wall_in(simulation.grid, x, robot.y)
+
+    positions = {(robot.x, robot.y)}
+    for _ in range(50):
+        simulation.step()
+        assert simulation.scheduler.is_awake(robot.id)
+        assert robot.last_resource is not resource
+        positions.add((robot.x, robot.y))
+    assert len(positions) > 1
+    assert resource.materials > 0
@@ -0,0 +1,109 @@
+# importes locales
+from random import Random
+
+# importes internos
+from occupancy import OBSTACLE, RESOURCE, OccupancyGrid
+from resource_manager import ResourceManager
+from simulation import Simulation
+
+
+def build(respawn_delay=None, width: int = 10, height: int = 10):
+    grid = OccupancyGrid(width, height)
+    manager = ResourceManager(grid, Random(0), respawn_delay)
+    changes = []
+    manager.listeners.append(lambda resource, alive: changes.append((resource.id, alive)))
+    return grid, manager, changes
+
+
+def test_ids_stay_fixed_when_resources_are_removed() -> None:
+    _, manager, changes = build()
+    resources = [manager.create(i, 0) for i in range(4)]
+    manager.remove(resources[1])
+
+    assert len(manager) == 3
+    assert [manager.get(i) for i in range(4)] == resources
+    assert not manager.is_alive(resources[1])
+    for resource in manager.resources:
+        assert manager.resources[manager.slots[resource.id]] is resource
+    assert changes[-1] == (1, False)
+
+
+def test_depleted_resources_without_delay_do_not_come_back() -> None:
+    _, manager, changes = build()
+    resource = manager.create(3, 3)
+    resource.materials = 0
+    manager.mark_depleted(resource)
+    for tick in range(50):
+        manager.update(tick)
+    assert not manager.is_alive(resource)
+    assert not manager.pool
+    assert changes == [(0, True), (0, False)]
+
+
+def test_depleted_resources_respawn_after_the_delay_on_a_free_cell() -> None:
+    grid, manager, changes = build(respawn_delay=5)
+    # solo queda una celda libre para reaparecer
+    for x in range(10):
+        for y in range(10):
+            if (x, y) != (7, 2):
+                grid.add(x, y, OBSTACLE)
+    manager.spawn_attempts = 1000
+    resource = manager.create(0, 0)
+    resource.materials = 0
+    manager.mark_depleted(resource)
+
+    manager.update(10)
+    assert not manager.is_alive(resource)
+    for tick in range(11, 15):
+        manager.update(tick)
+        assert not manager.is_alive(resource)
+    manager.update(15)
+    assert manager.is_alive(resource)
+    assert (resource.x, resource.y) == (7, 2)
+    assert 1 <= resource.materials <= 6
+    # el mismo objeto se reutiliza
+    assert manager.get(0) is resource and len(manager.by_id) == 1
+    assert changes == [(0, True), (0, False), (0, True)]
+
+
+def test_resources_that_respawn_in_a_simulation_are_on_the_grid() -> None:
+    simulation = Simulation(
+        40, 30, number_of_robots=8, respawn_delay=5, seed=0, verbose=False
+    )
+    manager = simulation.resource_manager
+    respawned = []
+    manager.listeners.append(
+        lambda resource, alive: alive and respawned.append(resource.id)
+    )
+    simulation.run_until(max_ticks=1_000)
+    assert respawned
+    for resource in manager.resources:
+        assert simulation.grid.get(resource.x, resource.y) & RESOURCE
+        assert resource in simulation.resource_index
+    for resource in manager.by_id:
+        if not manager.is_alive(resource):
+            assert resource not in simulation.resource_index
+
+
+def test_pool_respawns_in_retirement_order() -> None:
+    _, manager, changes = build(respawn_delay=3)
+    first, second = manager.create(1, 1), manager.create(2, 2)
+    for resource, tick in ((second, 0), (first, 1)):
+        resource.materials = 0
+        manager.mark_depleted(resource)
+        manager.update(tick)
+
+    for tick in range(2, 5):
+        manager.update(tick)
+    assert [entry for entry in changes[2:] if entry[1]] == [(1, True), (0, True)]
+
+
+def test_depleted_resources_refilled_before_the_update_stay_alive() -> None:
+    _, manager, _ = build(respawn_delay=3)
+    resource = manager.create(4, 4)
+    resource.materials = 0
+    manager.mark_depleted(resource)
+    resource.materials = 2
+    manager.update(0)
+    assert manager.is_alive(resource)
+    assert not manager.pool
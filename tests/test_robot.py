@@ -0,0 +1,88 @@
+# importes globales
+import pytest
+
+# importes locales
+from typing import List, Tuple
+
+# importes internos
+from occupancy import OBSTACLE
+from robot import EXPLORED_WEIGHT, MOVEMENT_HISTORY, MOVES, UNEXPLORED_WEIGHT, Robot
+from simulation import Simulation
+
+
+def test_movement_history_keeps_the_latest_moves_in_order() -> None:
+    simulation = Simulation(30, 20, number_of_robots=1, seed=0, verbose=False)
+    robot = simulation.robots[0]
+    visited = [(robot.x, robot.y)]
+    for _ in range(3 * MOVEMENT_HISTORY):
+        simulation.step()
+        if robot.recent_movements()[-1:] != visited[-1:]:
+            visited.append(robot.recent_movements()[-1])
+    assert len(robot.movements) == MOVEMENT_HISTORY
+    assert robot.recent_movements()[-1] == (robot.x, robot.y)
+    assert robot.recent_movements()[-5:] == visited[-5:]
+
+
+# devuelve siempre el mismo valor y guarda el total que pidió el robot
+class FixedRandom:
+    def __init__(self, value: int) -> None:
+        self.value: int = value
+        self.totals: List[int] = []
+
+    def randrange(self, total: int) -> int:
+        self.totals.append(total)
+        return self.value
+
+
+# un robot solo, fuera de la zona inicial y sin nada alrededor
+def lonely_robot() -> Tuple[Simulation, Robot]:
+    simulation = Simulation(
+        30,
+        20,
+        number_of_robots=1,
+        number_of_resources=0,
+        number_of_obstacles=0,
+        seed=0,
+        verbose=False,
+    )
+    robot = simulation.robots[0]
+    x = 3 if simulation.start_x > 10 else 25
+    robot.place(x, 10)
+    return simulation, robot
+
+
+def test_boxed_in_robot_stays_put_until_a_cell_is_freed() -> None:
+    simulation, robot = lonely_robot()
+    resource = simulation.resource_manager.create(robot.x, robot.y - 1)
+    resource.materials = 0
+    for dx, dy in MOVES[1:]:
+        simulation.grid.add(robot.x + dx, robot.y + dy, OBSTACLE)
+    start = (robot.x, robot.y)
+
+    for _ in range(5):
+        simulation.step()
+        assert (robot.x, robot.y) == start
+    assert not simulation.scheduler.is_awake(robot.id)
+
+    simulation.grid.remove(robot.x + 1, robot.y, OBSTACLE)
+    simulation.step()
+    assert (robot.x, robot.y) == (start[0] + 1, start[1])
+
+
+@pytest.mark.parametrize("choice, move", [(0, 0), (3, 1), (4, 2), (9, 3)])
+def test_explored_neighbours_weigh_two_and_unexplored_three(
+    choice: int, move: int
+) -> None:
+    simulation, robot = lonely_robot()
+    x, y = robot.x, robot.y
+    # arriba y abajo ya se visitaron, izquierda y derecha no
+    simulation.exploration.visit(x, y - 1)
+    simulation.exploration.visit(x, y + 1)
+    simulation.rng = FixedRandom(choice)
+
+    robot.move_randomly()
+
+    assert simulation.rng.totals == [2 * EXPLORED_WEIGHT + 2 * UNEXPLORED_WEIGHT]
+    assert EXPLORED_WEIGHT == 2 and UNEXPLORED_WEIGHT == 3
+    dx, dy = MOVES[move]
+    assert (robot.x, robot.y) == (x + dx, y + dy)
@@ -0,0 +1,127 @@
+# importes globales
+import json
+import pytest
+
+# importes internos
+import app
+import scenario as scenarios
+from scenario import Scenario
+
+
+def test_defaults_match_the_simulation_parameters() -> None:
+    parameters = Scenario().simulation_parameters()
+    assert parameters["width"] == 75 and parameters["number_of_robots"] == 4
+    assert parameters["seed"] is None and parameters["metrics"] is False
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        ({"world": {"colour": 1}}, "unknown scenario field 'world.colour'"),
+        ({"planet": {}}, "unknown section 'planet'"),
+        ({"world": 3}, "section 'world' must be a table"),
+        ({"world": {"robots": "many"}}, "world.robots must be an integer"),
+        ({"world": {"robots": 2.5}}, "world.robots must be an integer"),
+        ({"world": {"robots": -1}}, "world.robots must be at least 0"),
+        ({"world": {"width": 4}}, "world.width must be at least 5"),
+        ({"world": {"grab_distance": 0}}, "world.grab_distance must be at least 1"),
+        ({"world": {"robots": None}}, "world.robots must be an integer"),
+        ({"output": {"summary": 1}}, "output.summary must be a string"),
+    ],
+)
+def test_invalid_scenarios_are_rejected(data, message: str) -> None:
+    with pytest.raises(ValueError, match=message.replace(".", r"\.")):
+        Scenario(data)
+
+
+def test_booleans_are_not_integers_and_integers_are_not_booleans() -> None:
+    with pytest.raises(ValueError, match="must be an integer"):
+        Scenario({"world": {"robots": True}})
+    with pytest.raises(ValueError, match="must be true or false"):
+        Scenario({"run": {"headless": 1}})
+    assert Scenario({"run": {"seed": None}})["run"]["seed"] is None
+
+
+def test_short_names_resolve_only_when_unambiguous() -> None:
+    scenario = Scenario()
+    scenario.set("robots", 9)
+    assert scenario["world"]["robots"] == 9
+    with pytest.raises(ValueError, match="unknown scenario field 'planet'"):
+        scenario.set("planet", 1)
+
+
+@pytest.mark.parametrize(
+    "text, value",
+    [
+        ("3", 3),
+        ("true", True),
+        ("null", None),
+        ('"a b"', "a b"),
+        ("out.json", "out.json"),
+    ],
+)
+def test_parse_value(text: str, value) -> None:
+    assert scenarios.parse_value(text) == value
+
+
+def test_load_json(tmp_path) -> None:
+    path = tmp_path / "escenario.json"
+    path.write_text(json.dumps({"world": {"robots": 7}, "run": {"seed": 3}}))
+    scenario = scenarios.load(str(path))
+    assert scenario["world"]["robots"] == 7 and scenario["run"]["seed"] == 3
+
+
+def test_load_toml(tmp_path) -> None:
+    if scenarios.tomllib is None:
+        pytest.skip("TOML needs Python 3.11")
+    path = tmp_path / "escenario.toml"
+    path.write_text("[world]\nrobots = 7\n\n[render]\ntps = 60\n")
+    scenario = scenarios.load(str(path))
+    assert scenario["world"]["robots"] == 7 and scenario["render"]["tps"] == 60
+
+
+def test_a_scenario_file_must_be_a_table(tmp_path) -> None:
+    path = tmp_path / "escenario.json"
+    path.write_text("[1, 2]")
+    with pytest.raises(ValueError, match="must be a table of sections"):
+        scenarios.load(str(path))
+
+
+def test_command_line_options_beat_the_file(tmp_path) -> None:
+    path = tmp_path / "escenario.json"
+    path.write_text(
+        json.dumps(
+            {"world": {"robots": 7, "width": 30}, "run": {"seed": 3, "ticks": 5}}
+        )
+    )
+    args = app.parse_args(
+        [str(path), "--headless", "--seed", "9"]
+        + ["--set", "robots=2", "--set", "world.width=40"]
+    )
+    scenario = app.build_scenario(args)
+    assert scenario["world"]["robots"] == 2
+    assert scenario["world"]["width"] == 40
+    assert scenario["run"]["seed"] == 9
+    assert scenario["run"]["ticks"] == 5
+    assert scenario["run"]["headless"] is True
+
+
+def test_bad_override_exits_with_a_message(capsys) -> None:
+    with pytest.raises(SystemExit, match="error: --set expects FIELD=VALUE"):
+        app.main(["--headless", "--set", "robots"])
+    with pytest.raises(SystemExit, match="world.width must be at least 5"):
+        app.main(["--headless", "--set", "width=4"])
+
+
+def test_headless_run_writes_its_outputs(tmp_path, capsys) -> None:
+    summary = tmp_path / "resultado.json"
+    metrics = tmp_path / "metricas.json"
+    app.main(
+        ["--headless", "--seed", "4", "--ticks", "50", "--set", "verbose=false"]
+        + ["--summary", str(summary), "--metrics", str(metrics)]
+    )
+    result = json.loads(summary.read_text())
+    assert result["seed"] == 4 and result["ticks"] == 50
+    assert result["scenario"]["run"]["ticks"] == 50
+    assert json.loads(metrics.read_text())["ticks"] == 50
+    assert "50 ticks" in capsys.readouterr().out
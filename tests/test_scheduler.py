@@ -0,0 +1,87 @@
+# importes internos
+from robot import MOVES
+from scheduler import Scheduler
+from simulation import Simulation
+
+
+def test_iterates_awake_robots_in_id_order() -> None:
+    scheduler = Scheduler(4)
+    assert list(scheduler) == [0, 1, 2, 3]
+    assert len(scheduler) == 4
+
+
+def test_sleeping_robots_are_skipped_and_dropped_after_the_tick() -> None:
+    scheduler = Scheduler(4)
+    acted = []
+    for robot_id in scheduler:
+        acted.append(robot_id)
+        if robot_id == 1:
+            scheduler.sleep(2)
+    assert acted == [0, 1, 3]
+    assert scheduler.order == [0, 1, 3]
+    assert not scheduler.is_awake(2)
+    assert list(scheduler) == [0, 1, 3]
+
+
+def test_robot_woken_mid_tick_with_higher_id_acts_in_the_same_tick() -> None:
+    scheduler = Scheduler(5)
+    scheduler.sleep(1)
+    scheduler.sleep(3)
+    list(scheduler)
+    assert scheduler.order == [0, 2, 4]
+
+    acted = []
+    for robot_id in scheduler:
+        acted.append(robot_id)
+        if robot_id == 2:
+            scheduler.wake(1)
+            scheduler.wake(3)
+    # 1 ya pasó su turno, 3 todavía no
+    assert acted == [0, 2, 3, 4]
+    assert scheduler.order == [0, 1, 2, 3, 4]
+    assert list(scheduler) == [0, 1, 2, 3, 4]
+
+
+def test_robot_slept_and_woken_in_the_same_tick_is_not_listed_twice() -> None:
+    scheduler = Scheduler(3)
+    acted = []
+    for robot_id in scheduler:
+        acted.append(robot_id)
+        if robot_id == 0:
+            scheduler.sleep(1)
+            scheduler.wake(1)
+    assert acted == [0, 1, 2]
+    assert scheduler.order == [0, 1, 2]
+
+
+def test_wake_waiting_only_wakes_robots_waiting_for_the_board() -> None:
+    scheduler = Scheduler(3)
+    scheduler.sleep(0)
+    scheduler.sleep(1, waiting=False)
+    list(scheduler)
+    scheduler.wake_waiting()
+    assert scheduler.is_awake(0)
+    assert not scheduler.is_awake(1)
+    assert not scheduler.waiting
+    assert list(scheduler) == [0, 2]
+
+    scheduler.wake(1)
+    assert list(scheduler) == [0, 1, 2]
+
+
+# solo duermen los robots encerrados o los que ya terminaron
+def test_robots_only_sleep_when_boxed_in_or_done() -> None:
+    simulation = Simulation(30, 20, number_of_obstacles=450, seed=3, verbose=False)
+    grid = simulation.grid
+    for _ in range(10):
+        simulation.run_until(max_ticks=300)
+        for robot in simulation.robots:
+            if simulation.scheduler.is_awake(robot.id):
+                continue
+            boxed_in = all(
+                grid.is_blocked(robot.x + dx, robot.y + dy) for dx, dy in MOVES
+            )
+            # cargando o al terminar, sin camino a la zona inicial
+            stuck = simulation.home_field.next_step(robot.x, robot.y) is None
+            done = simulation.game_over and not robot.is_grabbing
+            assert boxed_in or stuck or done
@@ -0,0 +1,83 @@
+# importes globales
+import numpy as np
+import pytest
+
+# importes locales
+from random import Random
+
+# importes internos
+import checkpoint
+from occupancy import OBSTACLE, OccupancyGrid
+from resources import Resources
+from sensing import Sensor
+from simulation import Simulation
+from spatial_index import ResourceIndex
+
+
+def seen_cells(cells: np.ndarray, width: int) -> set:
+    return {(int(cell) % width, int(cell) // width) for cell in cells}
+
+
+def test_obstacles_hide_what_is_behind_them() -> None:
+    grid = OccupancyGrid(11, 11)
+    index = ResourceIndex(11, 11)
+    rng = Random(0)
+    grid.add(6, 5, OBSTACLE)
+    hidden = Resources(8, 5, rng, 0)
+    visible = Resources(5, 8, rng, 1)
+    for resource in (hidden, visible):
+        index.insert(resource)
+    sensor = Sensor(grid, 4, index, [hidden, visible], 1)
+    sensor.rebuild()
+
+    closest, cells = sensor.sense(np.array([5]), np.array([5]))
+    seen = seen_cells(cells, 11)
+    assert closest.tolist() == [visible.id]
+    assert (6, 5) in seen
+    assert (7, 5) not in seen and (8, 5) not in seen
+    assert (5, 8) in seen
+
+
+@pytest.mark.parametrize(
+    "seed, ticks, options",
+    [
+        (0, 60, {"respawn_delay": 3}),
+        (1, 60, {"respawn_delay": 3}),
+        (2, 60, {"respawn_delay": 3}),
+        (0, 37, {"coordination_interval": 4}),
+        (0, 150, {"coordination_interval": 4}),
+    ],
+)
+def test_restored_checkpoint_continues_like_the_original(
+    seed: int, ticks: int, options: dict
+) -> None:
+    original = Simulation(
+        75, 40, line_of_sight=True, seed=seed, verbose=False, **options
+    )
+    original.run_until(max_ticks=ticks)
+    restored = checkpoint.loads(checkpoint.dumps(original))
+    for _ in range(300):
+        original.step()
+        restored.step()
+    assert checkpoint.dumps(restored) == checkpoint.dumps(original)
+
+
+@pytest.mark.parametrize("line_of_sight", [False, True])
+def test_cells_seen_from_afar_count_as_explored(line_of_sight: bool) -> None:
+    simulation = Simulation(
+        40,
+        30,
+        number_of_robots=1,
+        number_of_resources=0,
+        number_of_obstacles=0,
+        line_of_sight=line_of_sight,
+        seed=0,
+        verbose=False,
+    )
+    robot = simulation.robots[0]
+    simulation.step()
+    x = robot.x + 3 if robot.x + 3 < simulation.width else robot.x - 3
+    y = robot.y
+    assert simulation.exploration.visits_at(x, y) == 0
+    assert simulation.exploration.is_seen(x, y) == line_of_sight
+    assert robot.already_explored(x, y) == line_of_sight
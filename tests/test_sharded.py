@@ -0,0 +1,77 @@
+# importes globales
+import multiprocessing
+import numpy as np
+import pytest
+import time
+
+# importes locales
+from threading import BrokenBarrierError
+
+# importes internos
+from sharded import ShardedWorld, ShardWorker
+from simulation import Simulation
+
+
+def build(workers: int) -> ShardedWorld:
+    simulation = Simulation(
+        120,
+        60,
+        number_of_robots=200,
+        number_of_resources=100,
+        materials_goal=10**6,
+        seed=1,
+        verbose=False,
+    )
+    return ShardedWorld.from_simulation(simulation, workers=workers)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_robots_move_at_most_one_cell_per_tick(workers: int) -> None:
+    with build(workers) as sharded:
+        world = sharded.world
+        for _ in range(300):
+            x, y = world.robot_x.copy(), world.robot_y.copy()
+            sharded.step()
+            moved = np.abs(world.robot_x - x) + np.abs(world.robot_y - y)
+            assert moved.max() <= 1
+
+
+def test_materials_are_conserved() -> None:
+    with build(4) as sharded:
+        world = sharded.world
+        total = int(world.resource_materials.sum())
+        sharded.run_until(max_ticks=300)
+        carried = int(world.robot_materials.sum())
+        assert int(world.resource_materials.sum()) + carried + world.start_materials == total
+
+
+def fail(self) -> None:
+    raise RuntimeError("worker failed")
+
+
+def stall(self) -> None:
+    time.sleep(30)
+
+
+# los procesos se crean con fork y heredan la fase cambiada
+@pytest.mark.parametrize(
+    "phase, replacement", [("grab_phase", fail), ("move_phase", stall)]
+)
+def test_worker_failures_reach_the_caller(
+    monkeypatch, phase: str, replacement
+) -> None:
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("needs the fork start method")
+    monkeypatch.setattr(ShardWorker, phase, replacement)
+    simulation = Simulation(60, 30, number_of_robots=20, seed=1, verbose=False)
+    sharded = ShardedWorld.from_simulation(simulation, workers=2, timeout=1.0)
+
+    started = time.perf_counter()
+    with pytest.raises(BrokenBarrierError, match="worker exit codes"):
+        sharded.run_until(max_ticks=10)
+    assert time.perf_counter() - started < 10
+    assert sharded.closed
+    assert not any(process.is_alive() for process in sharded.processes)
+    # el estado quedó en arreglos normales y cerrar otra vez no espera a nadie
+    assert sharded.world.robot_x.sum() >= 0
+    sharded.close()
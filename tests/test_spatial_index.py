@@ -0,0 +1,83 @@
+# importes globales
+import pytest
+
+# importes locales
+from random import Random
+
+# importes internos
+from resources import Resources
+from spatial_index import ResourceIndex
+
+
+# recurso más cercano revisando todos (referencia)
+def brute_force(resources, x: int, y: int, radius: int):
+    best, best_distance = None, radius + 1
+    for resource in resources:
+        distance = abs(x - resource.x) + abs(y - resource.y)
+        if resource.materials > 0 and distance < best_distance:
+            best, best_distance = resource, distance
+    return best
+
+
+def test_nearest_skips_empty_and_out_of_range_resources() -> None:
+    rng = Random(0)
+    index = ResourceIndex(20, 20, bucket_size=4)
+    near = Resources(5, 5, rng, 0)
+    far = Resources(9, 5, rng, 1)
+    empty = Resources(4, 5, rng, 2)
+    empty.materials = 0
+    for resource in (near, far, empty):
+        index.insert(resource)
+
+    assert index.nearest(3, 5, 2) is near
+    assert index.nearest(3, 5, 1) is None
+    assert index.nearest(9, 4, 1) is far
+
+
+def test_update_and_remove_use_the_indexed_position() -> None:
+    rng = Random(0)
+    index = ResourceIndex(20, 20, bucket_size=4)
+    resource = Resources(1, 1, rng)
+    index.insert(resource)
+    resource.x, resource.y = 15, 15
+    # hasta actualizarlo sigue en la cubeta de su posición anterior
+    assert index.position(resource) == (1, 1)
+    assert index.nearest(15, 15, 0) is None
+
+    index.update(resource)
+    assert index.position(resource) == (15, 15)
+    assert index.nearest(15, 15, 0) is resource
+    assert index.at(15, 15) is resource and index.at(1, 1) is None
+
+    index.remove(resource)
+    assert resource not in index and len(index) == 0
+    # fuera del tablero no se indexa
+    resource.x = 40
+    index.insert(resource)
+    assert resource not in index
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_nearest_matches_a_full_scan(seed: int) -> None:
+    rng = Random(seed)
+    index = ResourceIndex(60, 40)
+    resources = [
+        Resources(rng.randrange(60), rng.randrange(40), rng, i) for i in range(80)
+    ]
+    for resource in resources[::3]:
+        resource.materials = 0
+    for resource in resources:
+        index.insert(resource)
+
+    for _ in range(200):
+        x, y, radius = rng.randrange(60), rng.randrange(40), rng.randrange(12)
+        expected = brute_force(resources, x, y, radius)
+        found = index.nearest(x, y, radius)
+        if expected is None:
+            assert found is None
+        else:
+            # a igual distancia cualquiera de los empatados es válido
+            assert found is not None
+            assert abs(x - found.x) + abs(y - found.y) == abs(x - expected.x) + abs(
+                y - expected.y
+            )
@@ -0,0 +1,63 @@
+# importes globales
+import io
+import json
+import threading
+import time
+
+# importes internos
+from simulation import Simulation
+from structured_log import INFO, StructuredLogger
+
+
+def writer_threads() -> int:
+    return sum(thread.name == "structured-log" for thread in threading.enumerate())
+
+
+def test_writer_starts_on_first_event_and_stops_when_idle() -> None:
+    output = io.StringIO()
+    logger = StructuredLogger(output, flush_interval=0.02)
+    assert writer_threads() == 0
+
+    logger.event(1, INFO, "grab", 0, 1, 2, 3)
+    assert writer_threads() == 1
+    deadline = time.monotonic() + 2
+    while writer_threads() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer_threads() == 0
+    assert json.loads(output.getvalue()) == {
+        "tick": 1,
+        "level": "info",
+        "event": "grab",
+        "robot": 0,
+        "x": 1,
+        "y": 2,
+        "resource": 3,
+    }
+
+    # después de parar vuelve a arrancar con el siguiente evento
+    logger.event(2, INFO, "drop", 0, 1, 2)
+    logger.close()
+    assert output.getvalue().count("\n") == 2
+
+
+def test_simulations_without_close_leave_no_threads() -> None:
+    for seed in range(5):
+        Simulation(30, 20, seed=seed, verbose=False).run_until(max_ticks=50)
+        Simulation(30, 20, seed=seed, logger=StructuredLogger(io.StringIO()))
+    assert writer_threads() == 0
+
+
+def test_grab_is_logged_only_when_materials_were_taken() -> None:
+    output = io.StringIO()
+    simulation = Simulation(30, 20, seed=0, logger=StructuredLogger(output))
+    robot = simulation.robots[0]
+    resource = simulation.resources[0]
+    # el robot sigue apuntando a un recurso que otro acaba de vaciar
+    resource.x, resource.y = robot.x + 1, robot.y
+    resource.materials = 0
+    robot.closest_resource = resource
+    robot._check_resource_interaction()
+    simulation.close()
+
+    assert robot.materials == 0
+    assert '"grab"' not in output.getvalue()
@@ -0,0 +1,13 @@
+# importes globales
+import pytest
+
+# importes internos
+from simulation import Simulation
+from vectorized import VectorWorld
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3, 5])
+def test_reaches_materials_goal(seed: int) -> None:
+    world = VectorWorld.from_simulation(Simulation(75, 40, seed=seed, verbose=False))
+    world.run_until(max_ticks=20_000)
+    assert world.check_game_over()